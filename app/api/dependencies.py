@@ -1,9 +1,33 @@
-from fastapi import Depends
+from datetime import timedelta
+
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.infra.db.session import async_session_factory, ping_database
-from app.secure.argon import ArgonHaser 
+from app.domain.auth import TokenClaims
+from app.domain.user import UserRole
+from app.ports.auth_ports import RevocationPort, TokenPort
+from app.ports.hash_port import AsyncHashPort
+from app.secure.hash_pool import password_hasher
+from app.secure.jwt_tokens import AuthKeysNotLoadedError, InvalidTokenError, token_service
 from app.infra.db.repo.user_repo import AlchemyUserRepository
+from app.infra.db.repo.solver_repo import AlchemySolverRepository
+from app.infra.db.repo.project_repo import AlchemyProjectRepository
+from app.infra.db.repo.proposal_repo import AlchemyProposalRepository
+from app.infra.db.repo.task_submission_repo import AlchemyTaskSubmissionRepository
+from app.infra.cache.user_cache import CachedUserRepository, user_cache
+from app.infra.cache.revocation import revocation_list
+from app.infra.storage.local_blob_store import blob_store
+from app.ports.user_ports import UserRepository
 from app.services.user_service import UserServiceImpl
+from app.services.solver_service import SolverServiceImpl
+from app.services.matching_engine import matching_engine
+from app.services.matching_service import MatchingServiceImpl
+from app.services.project_service import ProjectServiceImpl
+from app.services.auth_service import AuthServiceImpl
+from app.services.proposal_service import ProposalServiceImpl
+from app.services.task_submission_service import TaskSubmissionServiceImpl
+from app.settings import settings
 
 async def get_db():
     async with async_session_factory() as session:
@@ -18,7 +42,104 @@ async def check_db_connection():
     return await ping_database()
 
 
-def get_user_service(db: AsyncSession = Depends(get_db)) -> UserServiceImpl:
-    user_repo = AlchemyUserRepository(db)
-    hasher = ArgonHaser()
-    return UserServiceImpl(user_repo, hasher)
+def get_hasher() -> AsyncHashPort:
+    return password_hasher
+
+
+def get_user_service(
+    db: AsyncSession = Depends(get_db),
+    hasher: AsyncHashPort = Depends(get_hasher)
+) -> UserServiceImpl:
+    user_repo: UserRepository = AlchemyUserRepository(db)
+    if settings.USER_CACHE_ENABLED:
+        user_repo = CachedUserRepository(user_repo, user_cache)
+    return UserServiceImpl(user_repo, hasher, settings.USER_IMPORT_BATCH_SIZE)
+
+
+def get_solver_service(db: AsyncSession = Depends(get_db)) -> SolverServiceImpl:
+    return SolverServiceImpl(AlchemySolverRepository(db))
+
+
+def get_matching_service(db: AsyncSession = Depends(get_db)) -> MatchingServiceImpl:
+    return MatchingServiceImpl(
+        matching_engine,
+        AlchemySolverRepository(db),
+        AlchemyProjectRepository(db),
+        batch_size=settings.MATCHING_REFRESH_BATCH
+    )
+
+
+def get_project_service(db: AsyncSession = Depends(get_db)) -> ProjectServiceImpl:
+    return ProjectServiceImpl(
+        AlchemyProjectRepository(db),
+        feed_stale_after=timedelta(seconds=settings.OPEN_FEED_STALE_AFTER_SECONDS)
+    )
+
+
+def get_proposal_service(db: AsyncSession = Depends(get_db)) -> ProposalServiceImpl:
+    return ProposalServiceImpl(AlchemyProposalRepository(db, settings.PROPOSAL_COUNT_STRIPES))
+
+
+def get_task_submission_service(db: AsyncSession = Depends(get_db)) -> TaskSubmissionServiceImpl:
+    return TaskSubmissionServiceImpl(
+        AlchemyTaskSubmissionRepository(db),
+        blob_store,
+        max_bytes=settings.UPLOAD_MAX_BYTES
+    )
+
+
+def get_token_service() -> TokenPort:
+    return token_service
+
+
+def get_auth_service(
+    db: AsyncSession = Depends(get_db),
+    hasher: AsyncHashPort = Depends(get_hasher),
+    tokens: TokenPort = Depends(get_token_service)
+) -> AuthServiceImpl:
+    user_repo: UserRepository = AlchemyUserRepository(db)
+    if settings.USER_CACHE_ENABLED:
+        user_repo = CachedUserRepository(user_repo, user_cache)
+    return AuthServiceImpl(user_repo, hasher, tokens)
+
+
+def get_revocation_list() -> RevocationPort | None:
+    return revocation_list if settings.REVOCATION_ENABLED else None
+
+
+_bearer = HTTPBearer(auto_error=False)
+
+
+async def get_current_claims(
+    credentials: HTTPAuthorizationCredentials | None = Depends(_bearer),
+    tokens: TokenPort = Depends(get_token_service),
+    revoked: RevocationPort | None = Depends(get_revocation_list)
+) -> TokenClaims:
+    """Verified, unrevoked claims of the request's bearer token; 401 otherwise."""
+    if credentials is None:
+        raise HTTPException(
+            status_code=401, detail="Not authenticated", headers={"WWW-Authenticate": "Bearer"}
+        )
+    try:
+        claims = tokens.verify(credentials.credentials)
+    except AuthKeysNotLoadedError:
+        raise HTTPException(status_code=503, detail="Token verification is not configured")
+    except InvalidTokenError:
+        raise HTTPException(
+            status_code=401, detail="Invalid or expired token", headers={"WWW-Authenticate": "Bearer"}
+        )
+    # Checked on every request, cache hit or not: revocation must not wait for cache expiry
+    if revoked is not None and await revoked.is_revoked(claims.jti):
+        raise HTTPException(
+            status_code=401, detail="Token has been revoked", headers={"WWW-Authenticate": "Bearer"}
+        )
+    return claims
+
+
+def require_roles(*roles: UserRole):
+    """Dependency factory: the caller's token must carry one of `roles`."""
+    def check(claims: TokenClaims = Depends(get_current_claims)) -> TokenClaims:
+        if claims.role not in roles:
+            raise HTTPException(status_code=403, detail="Insufficient role")
+        return claims
+    return check
@@ -0,0 +1,50 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infra.db.instrumentation import QueryInstrumentation
+from app.infra.profiler import SlowRequestProfiler
+from app.infra.timing import start_request
+
+
+class RequestTimingMiddleware:
+    """
+    Pure ASGI middleware: opens a per-request timing context that the
+    repositories, hasher and serializers add phases to, sends them as a
+    Server-Timing header, and registers the request with the slow-request
+    profiler and the SQL instrumentation when they are given.
+    """
+    def __init__(
+        self,
+        app: ASGIApp,
+        server_timing: bool = True,
+        profiler: SlowRequestProfiler | None = None,
+        sql: QueryInstrumentation | None = None
+    ):
+        self.app = app
+        self.server_timing = server_timing
+        self.profiler = profiler
+        self.sql = sql
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing = start_request()
+        queries = self.sql.begin_request() if self.sql else None
+        label = f"{scope['method']} {scope['path']}"
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start" and self.server_timing:
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", timing.server_timing())
+            await send(message)
+
+        token = self.profiler.begin(label) if self.profiler else None
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            if queries is not None:
+                self.sql.end_request(queries, label)
+            if token is not None:
+                await self.profiler.end(token)
@@ -0,0 +1,54 @@
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, Depends, HTTPException, Response
+from redis.exceptions import RedisError
+
+from app.api.dependencies import get_auth_service, get_current_claims, get_revocation_list
+from app.api.v1.schemas.auth_schema import ClaimsResponse, LoginRequest, TokenResponse
+from app.domain.auth import LoginData, TokenClaims
+from app.ports.auth_ports import AuthService, RevocationPort
+from app.secure.hash_pool import HashQueueFullError
+from app.secure.jwt_tokens import AuthKeysNotLoadedError
+
+router = APIRouter(prefix="/auth", tags=["auth"])
+
+
+@router.post("/token", response_model=TokenResponse)
+async def issue_token(
+    req: LoginRequest,
+    service: AuthService = Depends(get_auth_service)
+):
+    try:
+        issued = await service.login(LoginData(login=req.login, password=req.password))
+    except HashQueueFullError:
+        raise HTTPException(status_code=503, detail="Server busy, please retry")
+    except AuthKeysNotLoadedError:
+        raise HTTPException(status_code=503, detail="Token signing is not configured")
+    except ValueError as e:
+        raise HTTPException(status_code=401, detail=str(e))
+    return TokenResponse(
+        access_token=issued.token,
+        expires_at=datetime.fromtimestamp(issued.claims.expires_at, tz=timezone.utc)
+    )
+
+
+@router.get("/me", response_model=ClaimsResponse)
+async def whoami(claims: TokenClaims = Depends(get_current_claims)):
+    return claims
+
+
+@router.post("/logout", status_code=204)
+async def logout(
+    claims: TokenClaims = Depends(get_current_claims),
+    revoked: RevocationPort | None = Depends(get_revocation_list)
+):
+    """
+    Revoke the calling token on every worker.
+    """
+    if revoked is None:
+        raise HTTPException(status_code=501, detail="Token revocation is disabled")
+    try:
+        await revoked.revoke(claims.jti, claims.expires_at)
+    except (RedisError, OSError):
+        raise HTTPException(status_code=503, detail="Revocation store unavailable, please retry")
+    return Response(status_code=204)
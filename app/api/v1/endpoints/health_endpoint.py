@@ -0,0 +1,50 @@
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+
+from app.infra.health import health_prober
+from app.infra.startup import startup_phases
+
+# Served from the background prober's cached results: no I/O per request
+router = APIRouter(prefix="/health", tags=["System"])
+
+
+@router.get("")
+async def health_check(request: Request):
+    """
+    Check the status of the API and its connection to the database.
+    """
+    is_db_up = health_prober.is_ok("postgres")
+    return {
+        "status": "online" if is_db_up and not health_prober.degraded() else "degraded",
+        "database": "connected" if is_db_up else "disconnected",
+        "version": request.app.version
+    }
+
+
+@router.get("/live")
+async def liveness():
+    """
+    The process is serving and its probe loop is still cycling.
+    """
+    body = {
+        "status": "stalled" if health_prober.stalled() else "alive",
+        "last_probe_age_seconds": health_prober.stats()["last_cycle_age_seconds"],
+    }
+    return JSONResponse(body, status_code=503 if health_prober.stalled() else 200)
+
+
+@router.get("/ready")
+async def readiness():
+    """
+    Startup (warmup included) has finished and every critical dependency
+    passed its last probe. Includes each dependency's recent probe history.
+    """
+    started = startup_phases.ready_after is not None
+    ready = started and health_prober.ready()
+    body = {
+        "status": "ready" if ready else "not_ready",
+        "started": started,
+        "degraded": health_prober.degraded(),
+        **health_prober.stats(),
+    }
+    return JSONResponse(body, status_code=200 if ready else 503)
@@ -0,0 +1,63 @@
+from typing import Literal
+
+from fastapi import APIRouter, Depends
+
+from app.api.dependencies import require_roles
+from app.domain.user import UserRole
+from app.infra.cache.revocation import revocation_list
+from app.infra.cache.user_cache import user_cache
+from app.infra.db.instrumentation import sql_instrumentation
+from app.infra.db.pool import pool_stats
+from app.infra.health import health_prober
+from app.infra.profiler import slow_request_profiler
+from app.infra.jobs.counter_reconcile import reconcile_stats
+from app.infra.jobs.outbox_relay import outbox_relay
+from app.infra.startup import startup_phases
+from app.infra.db.session import get_engine, get_replicas
+from app.secure.hash_pool import password_hasher
+from app.secure.jwt_tokens import token_service
+from app.services.matching_engine import matching_engine
+
+# Operational endpoints, hidden from the public OpenAPI schema and admin-only
+router = APIRouter(
+    prefix="/internal",
+    tags=["internal"],
+    include_in_schema=False,
+    dependencies=[Depends(require_roles(UserRole.ADMIN, UserRole.SUPER_ADMIN))]
+)
+
+
+@router.get("/metrics")
+async def metrics():
+    """
+    In-process metrics for this worker.
+    """
+    replicas = get_replicas()
+    return {
+        "db_pool": pool_stats(get_engine().pool),
+        "db_replicas": replicas.stats() if replicas is not None else None,
+        "hasher": password_hasher.stats(),
+        "user_cache": user_cache.stats(),
+        "matching": matching_engine.stats(),
+        "counter_reconcile": reconcile_stats,
+        "outbox_relay": outbox_relay.stats(),
+        "auth": token_service.stats(),
+        "revocation": revocation_list.stats(),
+        "startup": startup_phases.stats(),
+        "health": health_prober.stats(),
+        "slow_request_profiler": slow_request_profiler.stats(),
+        "sql": sql_instrumentation.stats(),
+    }
+
+
+@router.get("/sql")
+async def sql_statements(top: int = 20, order_by: Literal["total", "calls", "max", "slow"] = "total"):
+    """
+    Statement aggregates for this worker by normalized text, plus the most
+    recently captured plans of slow reads.
+    """
+    return {
+        **sql_instrumentation.stats(),
+        "top": sql_instrumentation.top(top, order_by),
+        "plans": list(sql_instrumentation.plans),
+    }
@@ -0,0 +1,96 @@
+import math
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.api.dependencies import get_matching_service, get_project_service, require_roles
+from app.api.v1.schemas.project_schema import (
+    AssignSolverRequest,
+    OpenProjectFeedResponse,
+    ProjectResponse,
+    SolverMatchResponse,
+)
+from app.domain.auth import TokenClaims
+from app.domain.user import UserRole
+from app.ports.project_ports import MatchingService, ProjectService
+from app.services.matching_engine import MatchingNotReadyError
+from app.settings import settings
+
+router = APIRouter(prefix="/projects", tags=["projects"])
+
+
+@router.get("/open", response_model=OpenProjectFeedResponse)
+async def list_open_projects(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    service: ProjectService = Depends(get_project_service)
+):
+    """
+    Open projects, newest first. Served from a periodically refreshed snapshot:
+    refreshed_at tells how old it is and stale is set when refreshes stopped.
+    """
+    try:
+        return await service.list_open_projects(limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/{project_uuid}/matches", response_model=List[SolverMatchResponse])
+async def match_solvers(
+    project_uuid: UUID,
+    skills: list[str] = Query(default=[], description="Skills the project needs"),
+    k: int = Query(10, ge=1, le=100),
+    service: MatchingService = Depends(get_matching_service)
+):
+    """
+    Best matching available solvers for a project, best first.
+    """
+    try:
+        return await service.match_project(project_uuid, skills, k)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except MatchingNotReadyError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(math.ceil(settings.MATCHING_REFRESH_SECONDS))}
+        )
+
+
+@router.post("/{project_uuid}/assign", response_model=ProjectResponse)
+async def assign_solver(
+    project_uuid: UUID,
+    payload: AssignSolverRequest,
+    claims: TokenClaims = Depends(require_roles(UserRole.BUYER, UserRole.ADMIN, UserRole.SUPER_ADMIN)),
+    service: ProjectService = Depends(get_project_service)
+):
+    """
+    Hire a solver for a pending project. Buyers can only hire for their own projects.
+    """
+    buyer_user_id = claims.subject if claims.role is UserRole.BUYER else None
+    try:
+        return await service.assign_solver(project_uuid, payload.solver_uuid, buyer_user_id)
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+
+@router.post("/{project_uuid}/completion/approve", response_model=ProjectResponse)
+async def approve_completion(
+    project_uuid: UUID,
+    claims: TokenClaims = Depends(require_roles(UserRole.BUYER, UserRole.ADMIN, UserRole.SUPER_ADMIN)),
+    service: ProjectService = Depends(get_project_service)
+):
+    """
+    Approve the solver's completion request and close the project. Buyers can
+    only approve their own projects.
+    """
+    buyer_user_id = claims.subject if claims.role is UserRole.BUYER else None
+    try:
+        return await service.approve_completion(project_uuid, buyer_user_id)
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
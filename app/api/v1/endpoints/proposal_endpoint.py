@@ -0,0 +1,58 @@
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.api.dependencies import get_proposal_service, require_roles
+from app.api.v1.schemas.proposal_schema import ProposalCreate, ProposalPageResponse, ProposalResponse
+from app.domain.auth import TokenClaims
+from app.domain.proposal import ProposalSort, ProposalSubmission
+from app.domain.user import UserRole
+from app.ports.proposal_ports import ProposalService
+
+router = APIRouter(prefix="/projects/{project_uuid}/proposals", tags=["proposals"])
+
+
+@router.post("/", response_model=ProposalResponse, status_code=201)
+async def submit_proposal(
+    project_uuid: UUID,
+    req: ProposalCreate,
+    claims: TokenClaims = Depends(require_roles(UserRole.SOLVER)),
+    service: ProposalService = Depends(get_proposal_service)
+):
+    """
+    Bid on an open project. One proposal per solver and project.
+    """
+    submission = ProposalSubmission(
+        project_uuid=project_uuid,
+        solver_user_uuid=claims.subject,
+        proposed_price=req.proposed_price,
+        cover_letter=req.cover_letter
+    )
+    try:
+        return await service.submit_proposal(submission)
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+
+@router.get("/", response_model=ProposalPageResponse)
+async def list_proposals(
+    project_uuid: UUID,
+    sort: ProposalSort = ProposalSort.RECENT,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    claims: TokenClaims = Depends(require_roles(UserRole.BUYER, UserRole.ADMIN, UserRole.SUPER_ADMIN)),
+    service: ProposalService = Depends(get_proposal_service)
+):
+    """
+    Proposals on a project, cheapest or newest first. Buyers only see their own projects.
+    """
+    buyer_user_id = claims.subject if claims.role is UserRole.BUYER else None
+    try:
+        return await service.list_proposals(project_uuid, sort, limit, cursor, buyer_user_id)
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
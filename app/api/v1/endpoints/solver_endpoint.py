@@ -0,0 +1,39 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.api.dependencies import get_solver_service
+from app.api.v1.schemas.solver_schema import SolverPageResponse
+from app.domain.solver import AvailabilityStatus, SolverSearchFilters
+from app.ports.solver_ports import SolverService
+
+router = APIRouter(prefix="/solvers", tags=["solvers"])
+
+
+@router.get("/search", response_model=SolverPageResponse)
+async def search_solvers(
+    skills_any: list[str] = Query(default=[], description="Solver has at least one of these skills"),
+    skills_all: list[str] = Query(default=[], description="Solver has every one of these skills"),
+    min_hourly_rate: Optional[float] = Query(default=None, ge=0),
+    max_hourly_rate: Optional[float] = Query(default=None, ge=0),
+    min_experience_years: Optional[int] = Query(default=None, ge=0),
+    availability: Optional[AvailabilityStatus] = None,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    service: SolverService = Depends(get_solver_service)
+):
+    """
+    Best rated solvers first. Follow next_cursor for the next page.
+    """
+    filters = SolverSearchFilters(
+        skills_any=skills_any,
+        skills_all=skills_all,
+        min_hourly_rate=min_hourly_rate,
+        max_hourly_rate=max_hourly_rate,
+        min_experience_years=min_experience_years,
+        availability=availability
+    )
+    try:
+        return await service.search_solvers(filters, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,66 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import FileResponse
+
+from app.api.dependencies import get_task_submission_service, require_roles
+from app.api.v1.schemas.task_submission_schema import TaskSubmissionResponse
+from app.domain.auth import TokenClaims
+from app.domain.task_submission import SubmissionUpload
+from app.domain.user import UserRole
+from app.infra.storage.local_blob_store import BlobTooLargeError
+from app.ports.task_submission_ports import TaskSubmissionService
+from app.settings import settings
+
+router = APIRouter(prefix="/tasks/{task_uuid}/submissions", tags=["submissions"])
+
+
+@router.post("/", response_model=TaskSubmissionResponse, status_code=201)
+async def upload_submission(
+    task_uuid: UUID,
+    request: Request,
+    claims: TokenClaims = Depends(require_roles(UserRole.SOLVER)),
+    service: TaskSubmissionService = Depends(get_task_submission_service)
+):
+    """
+    Upload a file as the task's next submission version. The raw request body
+    is the file; it is streamed to storage, never buffered whole.
+    """
+    length = request.headers.get("content-length")
+    if length is not None and length.isdigit() and int(length) > settings.UPLOAD_MAX_BYTES:
+        raise HTTPException(status_code=413, detail="File too large")
+
+    upload = SubmissionUpload(task_uuid=task_uuid, solver_user_uuid=claims.subject)
+    try:
+        return await service.upload(upload, request.stream())
+    except BlobTooLargeError:
+        raise HTTPException(status_code=413, detail="File too large")
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.get("/{submission_uuid}/file")
+async def download_submission(
+    task_uuid: UUID,
+    submission_uuid: UUID,
+    claims: TokenClaims = Depends(require_roles(
+        UserRole.BUYER, UserRole.SOLVER, UserRole.ADMIN, UserRole.SUPER_ADMIN
+    )),
+    service: TaskSubmissionService = Depends(get_task_submission_service)
+):
+    """
+    Submission file. Supports Range requests; the body is sent with sendfile
+    where the server offers it.
+    """
+    reader = None if claims.role in (UserRole.ADMIN, UserRole.SUPER_ADMIN) else claims.subject
+    try:
+        submission, path = await service.open_file(task_uuid, submission_uuid, reader)
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    # Blobs are content-addressed and never rewritten, so the hash is a strong validator
+    return FileResponse(
+        path,
+        filename=f"{submission_uuid}-v{submission.version}",
+        headers={"ETag": f'"{path.name}"', "Cache-Control": "private, max-age=31536000, immutable"}
+    )
@@ -1,8 +1,18 @@
-from app.api.v1.schemas.user_schema import UserCreate, UserResponse
-from fastapi import APIRouter, Depends, HTTPException
+import csv
+import json
+from typing import AsyncIterator, Callable, Optional
+from uuid import UUID
+
+from pydantic import ValidationError
+from app.api.v1.schemas.user_schema import UserCreate, UserImportResponse, UserPageResponse, UserResponse, UserRoleUpdate
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from app.ports.user_ports import UserService
-from app.domain.user import User, UserRegistrationData
-from app.api.dependencies import get_user_service
+from app.domain.user import User, UserImportRow, UserRegistrationData, UserRole, UserStatus
+from app.api.dependencies import get_user_service, require_roles
+from app.domain.auth import TokenClaims
+from app.api.v1.serializers import JSONBytesResponse, dump_user, dump_user_page
+from app.secure.hash_pool import HashQueueFullError
+from app.settings import settings
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -18,9 +28,184 @@ async def create_user(
         password=req.password,
         user_role=req.user_role
     )
-    user = await service.register_user(
-        user_data
-    )
+    try:
+        user = await service.register_user(
+            user_data
+        )
+    except HashQueueFullError:
+        raise HTTPException(status_code=503, detail="Server busy, please retry")
     if not user:
         raise HTTPException(status_code=400, detail="User registration failed")
-    return user
+    return JSONBytesResponse(dump_user(user))
+
+
+@router.get("/", response_model=UserPageResponse)
+async def list_users(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    role: Optional[UserRole] = None,
+    status: Optional[UserStatus] = None,
+    include_total: bool = False,
+    service: UserService = Depends(get_user_service)
+):
+    """
+    Newest users first. Follow next_cursor for the next page;
+    include_total adds a count(*) and should be left off for deep paging.
+    """
+    try:
+        page = await service.list_users_page_rows(limit, cursor, role, status, include_total)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    # Fast path: column rows straight to JSON, UserPageResponse documents the shape
+    return JSONBytesResponse(dump_user_page(page))
+
+
+@router.get("/{user_uuid}", response_model=UserResponse)
+async def get_user(
+    user_uuid: UUID,
+    service: UserService = Depends(get_user_service)
+):
+    user = await service.get_user(user_uuid)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    return JSONBytesResponse(dump_user(user))
+
+
+@router.put("/{user_uuid}/role", response_model=UserResponse)
+async def change_user_role(
+    user_uuid: UUID,
+    req: UserRoleUpdate,
+    claims: TokenClaims = Depends(require_roles(UserRole.ADMIN, UserRole.SUPER_ADMIN)),
+    service: UserService = Depends(get_user_service)
+):
+    """
+    Grant a role; the only way to an admin role. Only a super admin grants or revokes super admin.
+    """
+    try:
+        user = await service.change_role(user_uuid, req.user_role, claims.role)
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except PermissionError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    return JSONBytesResponse(dump_user(user))
+
+
+@router.post(
+    "/import",
+    response_model=UserImportResponse,
+    dependencies=[Depends(require_roles(UserRole.ADMIN, UserRole.SUPER_ADMIN))]
+)
+async def import_users(
+    request: Request,
+    service: UserService = Depends(get_user_service)
+):
+    """
+    Bulk import users from an NDJSON (application/x-ndjson) or CSV (text/csv) body.
+    The body is streamed and processed in batches; failures are reported per line.
+    A line over USER_IMPORT_MAX_LINE_BYTES stops the import with a 413; batches
+    before it stay imported.
+    """
+    content_type = request.headers.get("content-type", "")
+    parse: Callable[[AsyncIterator[str]], AsyncIterator[UserImportRow]]
+    if "csv" in content_type:
+        parse = _parse_csv
+    elif "ndjson" in content_type or "jsonl" in content_type:
+        parse = _parse_ndjson
+    else:
+        raise HTTPException(status_code=415, detail="Use application/x-ndjson or text/csv")
+
+    try:
+        result = await service.import_users(parse(_iter_lines(request)))
+    except HashQueueFullError:
+        raise HTTPException(status_code=503, detail="Server busy, please retry")
+    return UserImportResponse(
+        created=result.created,
+        failed=result.failed,
+        failures=result.failures
+    )
+
+
+async def _iter_lines(request: Request) -> AsyncIterator[str]:
+    """
+    Split the streamed body into lines without buffering it whole. Splits the
+    raw bytes (a UTF-8 newline byte never sits inside a character), so at most
+    one line of USER_IMPORT_MAX_LINE_BYTES is held at a time.
+    """
+    max_line = settings.USER_IMPORT_MAX_LINE_BYTES
+    line_no = 0
+    pending = b""
+    async for chunk in request.stream():
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            line_no += 1
+            yield _decode_line(line, line_no, max_line)
+        if len(pending) > max_line:
+            raise _line_too_long(line_no + 1, max_line)
+    if pending:
+        yield _decode_line(pending, line_no + 1, max_line)
+
+
+def _decode_line(line: bytes, line_no: int, max_line: int) -> str:
+    if len(line) > max_line:
+        raise _line_too_long(line_no, max_line)
+    return line.rstrip(b"\r").decode("utf-8", errors="replace")
+
+
+def _line_too_long(line_no: int, max_line: int) -> HTTPException:
+    return HTTPException(status_code=413, detail=f"Line {line_no} is longer than {max_line} bytes")
+
+
+def _to_import_row(line_no: int, fields: dict) -> UserImportRow:
+    try:
+        req = UserCreate.model_validate(fields)
+    except ValidationError as e:
+        reason = "; ".join(
+            f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" for err in e.errors()
+        )
+        return UserImportRow(line=line_no, error=reason)
+    return UserImportRow(
+        line=line_no,
+        data=UserRegistrationData(
+            user_name=req.user_name,
+            email=req.email,
+            phone=req.phone,
+            password=req.password,
+            user_role=req.user_role
+        )
+    )
+
+
+async def _parse_ndjson(lines: AsyncIterator[str]) -> AsyncIterator[UserImportRow]:
+    line_no = 0
+    async for line in lines:
+        line_no += 1
+        if not line.strip():
+            continue
+        try:
+            fields = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield UserImportRow(line=line_no, error=f"Invalid JSON: {e.msg}")
+            continue
+        if not isinstance(fields, dict):
+            yield UserImportRow(line=line_no, error="Expected a JSON object")
+            continue
+        yield _to_import_row(line_no, fields)
+
+
+async def _parse_csv(lines: AsyncIterator[str]) -> AsyncIterator[UserImportRow]:
+    # One record per line; the first non-empty line is the header
+    header: list[str] | None = None
+    line_no = 0
+    async for line in lines:
+        line_no += 1
+        if not line.strip():
+            continue
+        values = next(csv.reader([line]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield UserImportRow(line=line_no, error=f"Expected {len(header)} columns, got {len(values)}")
+            continue
+        yield _to_import_row(line_no, dict(zip(header, values)))
@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from pydantic import UUID7, BaseModel, ConfigDict
+
+from app.domain.user import UserRole
+
+
+class LoginRequest(BaseModel):
+    login: str  # Email or user name
+    password: str
+
+
+class TokenResponse(BaseModel):
+    access_token: str
+    token_type: str = "bearer"
+    expires_at: datetime
+
+
+class ClaimsResponse(BaseModel):
+    subject: UUID7
+    role: UserRole
+    jti: UUID7
+    issued_at: int
+    expires_at: int
+
+    model_config = ConfigDict(from_attributes=True)
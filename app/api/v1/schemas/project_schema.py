@@ -0,0 +1,58 @@
+from datetime import datetime
+
+from pydantic import UUID7, BaseModel, ConfigDict
+
+from app.domain.buyer import HiringStatus
+from app.domain.project import ProjectStatus
+
+
+class ProjectResponse(BaseModel):
+    uuid: UUID7
+    project_name: str
+    project_description: str
+    project_budget: float
+    project_duration_days: int
+    project_status: ProjectStatus
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AssignSolverRequest(BaseModel):
+    solver_uuid: UUID7
+
+
+class SolverMatchResponse(BaseModel):
+    solver_uuid: UUID7
+    score: float
+    skill_overlap: float
+    rate_fit: float
+    rating: float
+    completion_rate: float
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class OpenProjectResponse(BaseModel):
+    uuid: UUID7
+    project_name: str
+    project_summary: str
+    project_budget: float
+    project_duration_days: int
+    created_at: datetime
+    buyer_uuid: UUID7
+    buyer_rating: float
+    buyer_hiring_status: HiringStatus
+    proposal_count: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class OpenProjectFeedResponse(BaseModel):
+    items: list[OpenProjectResponse]
+    next_cursor: str | None = None
+    refreshed_at: datetime | None = None
+    stale: bool
+
+    model_config = ConfigDict(from_attributes=True)
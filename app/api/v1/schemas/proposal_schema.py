@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from pydantic import UUID7, BaseModel, ConfigDict, Field
+
+from app.domain.proposal import ProposalStatus
+
+
+class ProposalCreate(BaseModel):
+    proposed_price: float = Field(gt=0)
+    cover_letter: str = Field(default="", max_length=5000)
+
+
+class ProposalResponse(BaseModel):
+    uuid: UUID7
+    proposed_price: float
+    cover_letter: str | None = None
+    proposal_status: ProposalStatus
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ProposalPageResponse(BaseModel):
+    items: list[ProposalResponse]
+    next_cursor: str | None = None
+    total: int
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,24 @@
+from pydantic import UUID7, BaseModel, ConfigDict, Field
+from app.domain.solver import AvailabilityStatus
+
+class SolverResponse(BaseModel):
+    uuid: UUID7
+    full_name: str
+    bio: str | None = None
+    # Domain entity spells it protfolio_url
+    portfolio_url: str | None = Field(default=None, validation_alias="protfolio_url")
+    hourly_rate: float
+    experience_years: int
+    rating: float
+    total_projects: int
+    completed_projects: int
+    is_available: AvailabilityStatus
+    skills: list[str]
+
+    model_config = ConfigDict(from_attributes=True)
+
+class SolverPageResponse(BaseModel):
+    items: list[SolverResponse]
+    next_cursor: str | None = None
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,14 @@
+from datetime import datetime
+
+from pydantic import UUID7, BaseModel, ConfigDict
+
+from app.domain.task_submission import BuyerFeedback
+
+
+class TaskSubmissionResponse(BaseModel):
+    uuid: UUID7
+    version: int
+    buyer_feedback: BuyerFeedback
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
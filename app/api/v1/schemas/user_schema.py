@@ -1,13 +1,26 @@
 from datetime import datetime
-from pydantic import UUID7, BaseModel, EmailStr, ConfigDict 
+from pydantic import UUID7, BaseModel, EmailStr, ConfigDict, field_validator
 from app.domain.user import UserRole
 
+# Roles a signup (or a bulk import) may ask for; the others are granted by an admin
+SELF_SERVICE_ROLES = (UserRole.BUYER, UserRole.SOLVER)
+
 class UserCreate(BaseModel):
     email: EmailStr
     phone: str
     user_name: str
     password: str
-    user_role: UserRole 
+    user_role: UserRole
+
+    @field_validator("user_role")
+    @classmethod
+    def _self_service_role(cls, role: UserRole) -> UserRole:
+        if role not in SELF_SERVICE_ROLES:
+            raise ValueError(f"must be one of: {', '.join(r.value for r in SELF_SERVICE_ROLES)}")
+        return role
+
+class UserRoleUpdate(BaseModel):
+    user_role: UserRole
 
 class UserResponse(BaseModel):
     uuid: UUID7
@@ -20,3 +33,24 @@ class UserResponse(BaseModel):
     deleted_at: datetime | None = None
 
     model_config = ConfigDict(from_attributes=True)
+
+class UserImportFailureResponse(BaseModel):
+    line: int
+    reason: str
+    email: str | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+class UserImportResponse(BaseModel):
+    created: int
+    failed: int
+    failures: list[UserImportFailureResponse]
+
+    model_config = ConfigDict(from_attributes=True)
+
+class UserPageResponse(BaseModel):
+    items: list[UserResponse]
+    next_cursor: str | None = None
+    total: int | None = None
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,68 @@
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from fastapi import Response
+from pydantic import TypeAdapter
+from typing_extensions import TypedDict
+
+from app.domain.user import User, UserRole, UserRowPage, UserStatus
+from app.infra.timing import timed
+
+
+# Serialization-only mirrors of the response schemas. Keep field names and
+# order identical to UserResponse / UserPageResponse so the JSON contract
+# does not change. Rows come from the DB already validated, so these
+# adapters only ever dump (no model instances, no validation pass).
+class UserRow(TypedDict):
+    uuid: UUID
+    email: str
+    user_name: str
+    user_role: UserRole
+    user_status: UserStatus
+    created_at: datetime
+    updated_at: datetime
+    deleted_at: Optional[datetime]
+
+
+class UserPageRows(TypedDict):
+    items: list[UserRow]
+    next_cursor: Optional[str]
+    total: Optional[int]
+
+
+# Built once at import: the pydantic-core serializer is compiled here, not per request
+_USER_ROW = TypeAdapter(UserRow)
+_USER_PAGE_ROWS = TypeAdapter(UserPageRows)
+
+
+class JSONBytesResponse(Response):
+    """Response for bodies that are already serialized JSON bytes."""
+    media_type = "application/json"
+
+
+def user_row(user: User) -> dict[str, Any]:
+    return {
+        "uuid": user.uuid,
+        "email": user.email,
+        "user_name": user.user_name,
+        "user_role": user.user_role,
+        "user_status": user.user_status,
+        "created_at": user.created_at,
+        "updated_at": user.updated_at,
+        "deleted_at": user.deleted_at,
+    }
+
+
+def dump_user(user: User) -> bytes:
+    with timed("serialize"):
+        return _USER_ROW.dump_json(user_row(user))
+
+
+def dump_user_page(page: UserRowPage) -> bytes:
+    with timed("serialize"):
+        return _USER_PAGE_ROWS.dump_json({
+            "items": page.items,
+            "next_cursor": page.next_cursor,
+            "total": page.total,
+        })
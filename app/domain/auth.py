@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from app.domain.user import UserRole
+
+
+@dataclass(slots=True, frozen=True)
+class TokenClaims:
+    subject: UUID  # User uuid
+    role: UserRole
+    jti: UUID  # Unique per token; the handle for revocation
+    issued_at: int  # Unix seconds
+    expires_at: int
+
+
+@dataclass(slots=True, frozen=True)
+class IssuedToken:
+    token: str
+    claims: TokenClaims
+
+
+@dataclass(slots=True)
+class LoginData:
+    login: str  # Email or user name
+    password: str
@@ -10,7 +10,7 @@ class HiringStatus(Enum):
     CLOSED = "closed"
     PAUSED = "paused"
 
-@dataclass
+@dataclass(slots=True)
 class Buyer:
     id: int
     user_id: int
@@ -0,0 +1,45 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID, uuid7
+
+from app.domain.project import Project
+from app.domain.user import User
+
+# Subjects live under one prefix so a single JetStream stream captures them all
+SUBJECT_PREFIX = "marketplace"
+
+USER_CREATED = f"{SUBJECT_PREFIX}.user.created"
+USER_UPDATED = f"{SUBJECT_PREFIX}.user.updated"
+USER_DELETED = f"{SUBJECT_PREFIX}.user.deleted"
+PROJECT_SOLVER_ASSIGNED = f"{SUBJECT_PREFIX}.project.solver_assigned"
+PROJECT_COMPLETED = f"{SUBJECT_PREFIX}.project.completed"
+PROPOSAL_SUBMITTED = f"{SUBJECT_PREFIX}.proposal.submitted"
+
+
+@dataclass(slots=True)
+class DomainEvent:
+    subject: str
+    payload: dict[str, Any]  # JSON-ready: uuids and datetimes already as strings
+    event_id: UUID = field(default_factory=uuid7)  # Also the JetStream de-duplication id
+    occurred_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+def user_event(subject: str, user: User) -> DomainEvent:
+    # Never put credentials on the bus
+    return DomainEvent(subject, {
+        "user_uuid": str(user.uuid),
+        "user_name": user.user_name,
+        "email": user.email,
+        "user_role": user.user_role.name,
+        "user_status": user.user_status.name,
+    })
+
+
+def project_event(subject: str, project: Project, **extra: Any) -> DomainEvent:
+    return DomainEvent(subject, {
+        "project_uuid": str(project.uuid),
+        "project_status": project.project_status.name,
+        "project_budget": project.project_budget,
+        **extra,
+    })
@@ -0,0 +1,39 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from app.domain.solver import AvailabilityStatus
+
+
+@dataclass(slots=True)
+class SolverFeatures:
+    """The slice of a solver the matching engine scores on."""
+    id: int
+    uuid: UUID
+    hourly_rate: float
+    rating: float
+    total_projects: int
+    completed_projects: int
+    is_available: AvailabilityStatus
+    skills: list[str]
+    updated_at: datetime
+    deleted_at: Optional[datetime] = None
+
+
+@dataclass(slots=True)
+class MatchQuery:
+    budget: float
+    duration_days: int
+    skills: list[str] = field(default_factory=list)
+    k: int = 10
+
+
+@dataclass(slots=True)
+class SolverMatch:
+    solver_uuid: UUID
+    score: float
+    skill_overlap: float
+    rate_fit: float
+    rating: float
+    completion_rate: float
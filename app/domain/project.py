@@ -1,17 +1,19 @@
 from dataclasses import dataclass, field
 import datetime
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID, uuid7
 from datetime import datetime, timezone
 
+from app.domain.buyer import HiringStatus
+
 class ProjectStatus(Enum):
     PENDING = "pending"
     IN_PROGRESS = "in_progress"
     COMPLETED = "completed"
     CANCELLED = "cancelled"
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     id: int
     project_name: str
@@ -27,3 +29,27 @@ class Project:
     updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     deleted_at: Optional[datetime] = field(default=None)
 
+
+
+@dataclass(slots=True)
+class OpenProject:
+    """Row of the open-projects feed: a pending project with buyer and proposal stats"""
+    uuid: UUID
+    project_name: str
+    project_summary: str
+    project_budget: float
+    project_duration_days: int
+    created_at: datetime
+    buyer_uuid: UUID
+    buyer_rating: float
+    buyer_hiring_status: HiringStatus
+    proposal_count: int
+
+
+@dataclass(slots=True)
+class OpenProjectFeedPage:
+    items: List[OpenProject]
+    next_cursor: Optional[str]
+    # When the feed snapshot was taken; rows may lag the projects table by this much
+    refreshed_at: Optional[datetime]
+    stale: bool = False
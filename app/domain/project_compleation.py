@@ -10,7 +10,7 @@ class CompletionStatus(Enum):
     REVISION_REQUESTED = "revision_requested"
     CANCELLED = "cancelled"
 
-@dataclass
+@dataclass(slots=True)
 class ProjectCompletionRequest:
     id: int
     project_id: int
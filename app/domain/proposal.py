@@ -1,15 +1,19 @@
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID, uuid7
 from datetime import datetime, timezone
 
+class ProposalSort(Enum):
+    PRICE = "price"  # Cheapest first
+    RECENT = "recent"  # Newest first
+
 class ProposalStatus(Enum):
     PENDING = "pending"  # Added pending as a logical starting state
     APPROVED = "approved"
     REJECTED = "rejected"
 
-@dataclass
+@dataclass(slots=True)
 class Proposal:
     id: int
     project_id: int
@@ -26,3 +30,19 @@ class Proposal:
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     deleted_at: Optional[datetime] = field(default=None)
+
+
+@dataclass(slots=True)
+class ProposalSubmission:
+    project_uuid: UUID
+    solver_user_uuid: UUID  # The submitting user; resolved to their solver profile
+    proposed_price: float
+    cover_letter: str
+
+
+@dataclass(slots=True)
+class ProposalPage:
+    """One keyset page of a project's proposals."""
+    items: List[Proposal]
+    next_cursor: Optional[str] = None
+    total: int = 0
@@ -9,7 +9,7 @@ class AvailabilityStatus(Enum):
     BUSY = "busy"
     OFFLINE = "offline"
 
-@dataclass
+@dataclass(slots=True)
 class Solver:
     id: int
     user_id: int
@@ -28,4 +28,20 @@ class Solver:
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     deleted_at: Optional[datetime] = field(default=None)
-        
+
+
+@dataclass(slots=True)
+class SolverSearchFilters:
+    skills_any: list[str] = field(default_factory=list)  # overlap: at least one of these
+    skills_all: list[str] = field(default_factory=list)  # containment: every one of these
+    min_hourly_rate: Optional[float] = None
+    max_hourly_rate: Optional[float] = None
+    min_experience_years: Optional[int] = None
+    availability: Optional[AvailabilityStatus] = None
+
+
+@dataclass(slots=True)
+class SolverPage:
+    """One keyset page of search results, best rated first."""
+    items: list[Solver]
+    next_cursor: Optional[str] = None
@@ -18,7 +18,7 @@ class AvailabilityStatus(Enum):
     BUSY = "busy"
     OFFLINE = "offline"
 
-@dataclass
+@dataclass(slots=True)
 class Staff:
     id: int
     user_id: int
@@ -10,7 +10,7 @@ class TaskStatus(Enum):
     DONE = "done"
     BLOCKED = "blocked"
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     id: int
     project_id: int
@@ -10,7 +10,7 @@ class BuyerFeedback(Enum):
     REVISION_REQUESTED = "revision_requested"
     REJECTED = "rejected"
 
-@dataclass
+@dataclass(slots=True)
 class TaskSubmission:
     id: int
     task_id: int
@@ -21,3 +21,25 @@ class TaskSubmission:
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     deleted_at: Optional[datetime] = field(default=None)
+
+
+@dataclass(slots=True, frozen=True)
+class StoredBlob:
+    """A content-addressed file: key is derived from sha256, so equal bytes share one blob."""
+    key: str
+    sha256: str
+    size: int
+
+
+@dataclass(slots=True)
+class SubmissionUpload:
+    task_uuid: UUID
+    solver_user_uuid: UUID  # Must be the solver assigned to the task's project
+
+
+@dataclass(slots=True)
+class SubmissionFile:
+    """A submission plus who may read it."""
+    submission: TaskSubmission
+    buyer_user_uuid: UUID
+    solver_user_uuid: Optional[UUID]
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional
+from typing import Any, Iterable, Iterator, Optional, Sequence
 from uuid import UUID, uuid7
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -17,7 +17,7 @@ class UserStatus(Enum):
     APPROVAL_PENDING = "approval_pending"
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     id: int
     user_name : str
@@ -32,7 +32,74 @@ class User:
     deleted_at: Optional[datetime] = field(default=None)
 
 
-@dataclass
+@dataclass(slots=True)
+class UserBatch(Sequence[User]):
+    """
+    Column-oriented list result: one list per field instead of one object per row.
+    Indexing or iterating materializes User entities on demand.
+    """
+    ids: list[int]
+    user_names: list[str]
+    emails: list[str]
+    phones: list[str]
+    passwords: list[str]
+    user_statuses: list[UserStatus]
+    user_roles: list[UserRole]
+    uuids: list[UUID]
+    created_ats: list[datetime]
+    updated_ats: list[datetime]
+    deleted_ats: list[Optional[datetime]]
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence[Any]]) -> "UserBatch":
+        """Rows must be in User field order (id, user_name, ..., deleted_at)."""
+        columns = list(zip(*rows))
+        if not columns:
+            return cls(*([] for _ in range(11)))
+        return cls(*(list(column) for column in columns))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return User(
+            id=self.ids[index],
+            user_name=self.user_names[index],
+            email=self.emails[index],
+            phone=self.phones[index],
+            password=self.passwords[index],
+            user_status=self.user_statuses[index],
+            user_role=self.user_roles[index],
+            uuid=self.uuids[index],
+            created_at=self.created_ats[index],
+            updated_at=self.updated_ats[index],
+            deleted_at=self.deleted_ats[index]
+        )
+
+    def __iter__(self) -> Iterator[User]:
+        for i in range(len(self.ids)):
+            yield self[i]
+
+
+@dataclass(slots=True)
+class UserPage:
+    """One keyset page of users. total is only filled when explicitly requested."""
+    items: Sequence[User]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+
+@dataclass(slots=True)
+class UserRowPage:
+    """Keyset page of public user columns as plain dicts, for serializing straight to JSON."""
+    items: list[dict[str, Any]]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+
+@dataclass(slots=True)
 class UserRegistrationData:
     user_name : str
     email : str
@@ -40,7 +107,32 @@ class UserRegistrationData:
     password: str
     user_role: UserRole = UserRole.SOLVER
 
-@dataclass
+@dataclass(slots=True)
 class UserUpdateData:
     user_name : Optional[str] = None
     phone : Optional[str] = None
+
+
+@dataclass(slots=True)
+class UserImportRow:
+    """One parsed line of a bulk import; error is set when the line could not be parsed."""
+    line: int
+    data: Optional[UserRegistrationData] = None
+    error: Optional[str] = None
+
+
+@dataclass(slots=True)
+class UserImportFailure:
+    line: int
+    reason: str
+    email: Optional[str] = None
+
+
+@dataclass(slots=True)
+class UserImportResult:
+    created: int = 0
+    failures: list[UserImportFailure] = field(default_factory=list)
+
+    @property
+    def failed(self) -> int:
+        return len(self.failures)
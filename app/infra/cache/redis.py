@@ -0,0 +1,50 @@
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from app.settings import settings
+
+_client: Optional[Redis] = None
+_pubsub_client: Optional[Redis] = None
+
+
+def get_redis() -> Redis:
+    """Process-wide Redis client; connections are opened lazily by its pool."""
+    global _client
+    if _client is None:
+        _client = Redis(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            password=settings.REDIS_PASSWORD,
+            db=settings.REDIS_DB,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+        )
+    return _client
+
+
+def get_pubsub_redis() -> Redis:
+    """
+    Separate client for long-lived subscriptions: no socket timeout, since an
+    idle channel would trip the short timeout meant for cache calls.
+    """
+    global _pubsub_client
+    if _pubsub_client is None:
+        _pubsub_client = Redis(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            password=settings.REDIS_PASSWORD,
+            db=settings.REDIS_DB,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+        )
+    return _pubsub_client
+
+
+async def close_redis() -> None:
+    global _client, _pubsub_client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+    if _pubsub_client is not None:
+        await _pubsub_client.aclose()
+        _pubsub_client = None
@@ -0,0 +1,183 @@
+import asyncio
+import logging
+import time
+from typing import Optional
+from uuid import UUID
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.infra.cache.bloom import BloomFilter
+from app.infra.cache.redis import get_pubsub_redis, get_redis
+from app.ports.auth_ports import RevocationPort
+from app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Sorted set of revoked jtis scored by token expiry: membership is the
+# source of truth, scores let expired entries be trimmed
+_REVOKED_KEY = "auth:revoked"
+_CHANNEL = "auth:revoked:events"
+
+
+class TokenRevocationList(RevocationPort):
+    """
+    Revoked-token check with a per-worker Bloom filter in front of Redis.
+
+    A jti the filter has never seen is definitely not revoked and is answered
+    without I/O; only possible hits (real revocations and the rare false
+    positive) are confirmed in Redis. Workers learn new revocations from a
+    pub/sub channel and rebuild the filter from Redis periodically and after
+    any subscription gap, which also drops expired jtis.
+
+    Until the first rebuild succeeds every check goes to Redis.
+    """
+    def __init__(
+        self,
+        redis: Redis,
+        pubsub_redis: Redis,
+        capacity: int = 100_000,
+        fp_rate: float = 0.001,
+        rebuild_interval: float = 300.0,
+        fail_closed: bool = True
+    ):
+        self.redis = redis
+        self.pubsub_redis = pubsub_redis
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        self.rebuild_interval = rebuild_interval
+        self.fail_closed = fail_closed
+
+        self._filter: Optional[BloomFilter] = None
+        # jtis seen while a rebuild scans Redis, replayed into the new filter
+        self._pending: Optional[list[str]] = None
+        # The subscriber and the periodic task both rebuild; one at a time, as they share _pending
+        self._rebuild_lock = asyncio.Lock()
+        self._tasks: list[asyncio.Task] = []
+
+        self.local_negatives = 0
+        self.redis_checks = 0
+        self.false_positives = 0
+        self.redis_errors = 0
+        self.rebuilds = 0
+
+    async def revoke(self, jti: UUID, expires_at: int) -> None:
+        member = str(jti)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.zadd(_REVOKED_KEY, {member: expires_at})
+            pipe.publish(_CHANNEL, member)
+            await pipe.execute()
+        # Visible to this worker at once, without waiting for our own message
+        self._note(member)
+
+    def _note(self, member: str) -> None:
+        if self._filter is not None:
+            self._filter.add(member)
+        if self._pending is not None:
+            self._pending.append(member)
+
+    async def is_revoked(self, jti: UUID) -> bool:
+        member = str(jti)
+        bloom = self._filter
+        if bloom is not None and member not in bloom:
+            self.local_negatives += 1
+            return False
+
+        self.redis_checks += 1
+        try:
+            score = await self.redis.zscore(_REVOKED_KEY, member)
+        except (RedisError, OSError):
+            self.redis_errors += 1
+            return self.fail_closed
+        if score is None:
+            if bloom is not None:
+                self.false_positives += 1
+            return False
+        return score > time.time()
+
+    async def rebuild(self) -> None:
+        """Swap in a filter built from the live (unexpired) revocations in Redis."""
+        async with self._rebuild_lock:
+            self._pending = []
+            try:
+                await self.redis.zremrangebyscore(_REVOKED_KEY, "-inf", time.time())
+                members = []
+                async for member, _ in self.redis.zscan_iter(_REVOKED_KEY, count=1000):
+                    members.append(member.decode() if isinstance(member, bytes) else member)
+
+                bloom = BloomFilter(max(self.capacity, 2 * len(members)), self.fp_rate)
+                bloom.update(members)
+                bloom.update(self._pending)
+                self._filter = bloom
+                self.rebuilds += 1
+            finally:
+                self._pending = None
+
+    async def _subscribe(self) -> None:
+        while True:
+            pubsub = self.pubsub_redis.pubsub()
+            try:
+                await pubsub.subscribe(_CHANNEL)
+                # Anything revoked while we were not subscribed is picked up here
+                await self.rebuild()
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    data = message["data"]
+                    self._note(data.decode() if isinstance(data, bytes) else data)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.redis_errors += 1
+                logger.exception("revocation subscription lost, resubscribing")
+                await asyncio.sleep(1.0)
+            finally:
+                await pubsub.aclose()
+
+    async def _rebuild_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.rebuild_interval)
+            try:
+                await self.rebuild()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.redis_errors += 1
+                logger.exception("revocation filter rebuild failed")
+
+    def start(self) -> None:
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._subscribe()),
+                asyncio.create_task(self._rebuild_periodically()),
+            ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def stats(self) -> dict:
+        bloom = self._filter
+        return {
+            "filter_ready": bloom is not None,
+            "filter_items": bloom.count if bloom else 0,
+            "filter_bits": bloom.bits if bloom else 0,
+            "local_negatives": self.local_negatives,
+            "redis_checks": self.redis_checks,
+            "false_positives": self.false_positives,
+            "redis_errors": self.redis_errors,
+            "rebuilds": self.rebuilds,
+        }
+
+
+# Process-wide singleton, started and stopped by the app lifespan
+revocation_list = TokenRevocationList(
+    redis=get_redis(),
+    pubsub_redis=get_pubsub_redis(),
+    capacity=settings.REVOCATION_BLOOM_CAPACITY,
+    fp_rate=settings.REVOCATION_BLOOM_FP_RATE,
+    rebuild_interval=settings.REVOCATION_REBUILD_SECONDS,
+    fail_closed=settings.REVOCATION_FAIL_CLOSED
+)
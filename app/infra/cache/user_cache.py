@@ -0,0 +1,344 @@
+import asyncio
+import json
+import logging
+from dataclasses import replace
+from datetime import datetime
+from typing import Any, List, Optional, Set, Tuple
+from uuid import UUID
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.domain.user import User, UserPage, UserRole, UserRowPage, UserStatus
+from app.infra.cache.lru import TTLCache
+from app.infra.cache.redis import get_pubsub_redis, get_redis
+from app.infra.timing import timed
+from app.ports.user_ports import UserRepository
+from app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Written over an invalidated record for a few seconds: a reader that loaded the
+# row before the write committed cannot put it back in the meantime
+_TOMBSTONE = b"-"
+# Invalidated uuids, so every worker drops its local copy
+_CHANNEL = "user:invalidate"
+
+
+def _dump_user(user: User) -> bytes:
+    return json.dumps({
+        "id": user.id,
+        "user_name": user.user_name,
+        "email": user.email,
+        "phone": user.phone,
+        "password": user.password,
+        "user_status": user.user_status.value,
+        "user_role": user.user_role.value,
+        "uuid": str(user.uuid),
+        "created_at": user.created_at.isoformat(),
+        "updated_at": user.updated_at.isoformat(),
+        "deleted_at": user.deleted_at.isoformat() if user.deleted_at else None,
+    }).encode()
+
+
+def _load_user(raw: bytes) -> User:
+    data = json.loads(raw)
+    return User(
+        id=data["id"],
+        user_name=data["user_name"],
+        email=data["email"],
+        phone=data["phone"],
+        password=data["password"],
+        user_status=UserStatus(data["user_status"]),
+        user_role=UserRole(data["user_role"]),
+        uuid=UUID(data["uuid"]),
+        created_at=datetime.fromisoformat(data["created_at"]),
+        updated_at=datetime.fromisoformat(data["updated_at"]),
+        deleted_at=datetime.fromisoformat(data["deleted_at"]) if data["deleted_at"] else None,
+    )
+
+
+class UserCache:
+    """
+    Two-tier user cache: a per-worker TTL/LRU in front of Redis.
+
+    Records are stored once under their uuid; email and user_name keys only
+    point at the uuid. Invalidating the uuid record is therefore enough on
+    writes: a stale pointer resolves to a missing or mismatching record and
+    falls through to the database.
+
+    Invalidation replaces the record with a tombstone for `tombstone_ttl`,
+    locally and in Redis. Puts never overwrite an existing Redis record (SET
+    NX), so a reader racing the write cannot repopulate the old row. The uuid
+    is also published on a channel, and every worker tombstones its local
+    copy; after a subscription gap the whole local tier is dropped.
+    """
+    def __init__(
+        self,
+        local_size: int,
+        local_ttl: float,
+        redis_ttl: int,
+        redis: Optional[Redis] = None,
+        pubsub_redis: Optional[Redis] = None,
+        tombstone_ttl: float = 5.0
+    ):
+        self.local: TTLCache[Any] = TTLCache(maxsize=local_size, ttl=local_ttl)
+        self.redis = redis
+        self.pubsub_redis = pubsub_redis
+        self.redis_ttl = redis_ttl
+        self.tombstone_ttl = tombstone_ttl
+        self._task: Optional[asyncio.Task] = None
+
+        self.redis_hits = 0
+        self.redis_misses = 0
+        self.redis_errors = 0
+        self.invalidations_received = 0
+
+    @staticmethod
+    def _record_key(id: UUID) -> str:
+        return f"user:uuid:{id}"
+
+    @staticmethod
+    def _index_key(field: str, value: str) -> str:
+        return f"user:{field}:{value}"
+
+    async def _redis_get(self, key: str) -> Optional[bytes]:
+        if self.redis is None:
+            return None
+        try:
+            with timed("cache"):
+                raw = await self.redis.get(key)
+        except (RedisError, OSError):
+            self.redis_errors += 1
+            return None
+        if raw is None:
+            self.redis_misses += 1
+        else:
+            self.redis_hits += 1
+        return raw
+
+    async def get(self, id: UUID) -> Optional[User]:
+        key = self._record_key(id)
+        user = self.local.get(key)
+        if user is _TOMBSTONE:
+            return None
+        if user is None:
+            raw = await self._redis_get(key)
+            if raw is None or raw == _TOMBSTONE:
+                return None
+            user = _load_user(raw)
+            self.local.set(key, user)
+        # Hand out a copy so callers mutating the entity cannot corrupt the cache
+        return replace(user)
+
+    async def lookup(self, field: str, value: str) -> Optional[UUID]:
+        key = self._index_key(field, value)
+        id = self.local.get(key)
+        if id is None:
+            raw = await self._redis_get(key)
+            if raw is None:
+                return None
+            id = UUID(raw.decode())
+            self.local.set(key, id)
+        return id
+
+    async def put(self, user: User) -> None:
+        record_key = self._record_key(user.uuid)
+        email_key = self._index_key("email", user.email)
+        name_key = self._index_key("user_name", user.user_name)
+        if self.local.get(record_key) is _TOMBSTONE:
+            return
+
+        self.local.set(record_key, replace(user))
+        self.local.set(email_key, user.uuid)
+        self.local.set(name_key, user.uuid)
+
+        if self.redis is None:
+            return
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                # NX: a tombstone (or a fresher put) wins
+                pipe.set(record_key, _dump_user(user), ex=self.redis_ttl, nx=True)
+                pipe.set(email_key, str(user.uuid), ex=self.redis_ttl)
+                pipe.set(name_key, str(user.uuid), ex=self.redis_ttl)
+                await pipe.execute()
+        except (RedisError, OSError):
+            self.redis_errors += 1
+
+    async def invalidate(self, id: UUID) -> None:
+        key = self._record_key(id)
+        self.local.set(key, _TOMBSTONE, ttl=self.tombstone_ttl)
+        if self.redis is None:
+            return
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.set(key, _TOMBSTONE, px=int(self.tombstone_ttl * 1000))
+                pipe.publish(_CHANNEL, str(id))
+                await pipe.execute()
+        except (RedisError, OSError):
+            self.redis_errors += 1
+
+    async def _subscribe(self) -> None:
+        while True:
+            pubsub = self.pubsub_redis.pubsub()
+            try:
+                await pubsub.subscribe(_CHANNEL)
+                # Invalidations published while we were not subscribed are lost
+                self.local.clear()
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    data = message["data"]
+                    id = data.decode() if isinstance(data, bytes) else data
+                    self.local.set(self._record_key(UUID(id)), _TOMBSTONE, ttl=self.tombstone_ttl)
+                    self.invalidations_received += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.redis_errors += 1
+                logger.exception("user cache invalidation subscription lost, resubscribing")
+                await asyncio.sleep(1.0)
+            finally:
+                await pubsub.aclose()
+
+    def start(self) -> None:
+        if self._task is None and self.pubsub_redis is not None:
+            self._task = asyncio.create_task(self._subscribe())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "local": self.local.stats(),
+            "redis": {
+                "enabled": self.redis is not None,
+                "hits": self.redis_hits,
+                "misses": self.redis_misses,
+                "errors": self.redis_errors,
+                "subscribed": self._task is not None,
+                "invalidations_received": self.invalidations_received,
+            },
+        }
+
+
+class CachedUserRepository(UserRepository):
+    """
+    Read-through caching decorator for any UserRepository.
+    Only positive lookups are cached; misses always reach the inner repository.
+    """
+    def __init__(self, inner: UserRepository, cache: UserCache):
+        self.inner = inner
+        self.cache = cache
+
+    async def _by_index(self, field: str, value: str) -> Optional[User]:
+        id = await self.cache.lookup(field, value)
+        if id is None:
+            return None
+        user = await self.cache.get(id)
+        if user is None or getattr(user, field) != value or user.deleted_at is not None:
+            return None
+        return user
+
+    async def create(self, user: User) -> User:
+        created = await self.inner.create(user)
+        await self.cache.put(created)
+        return created
+
+    async def create_many(self, users: List[User]) -> List[User]:
+        # Bulk imports are not read back immediately; don't flood the cache
+        return await self.inner.create_many(users)
+
+    # Writes invalidate twice: before, so the old row is not served or re-cached
+    # while the write is in flight, and after the inner repository commits
+
+    async def update(self, user: User) -> User:
+        await self.cache.invalidate(user.uuid)
+        updated = await self.inner.update(user)
+        await self.cache.invalidate(user.uuid)
+        return updated
+
+    async def get_by_id_or_uuid(self, id: UUID) -> Optional[User]:
+        user = await self.cache.get(id)
+        if user is not None and user.deleted_at is None:
+            return user
+        user = await self.inner.get_by_id_or_uuid(id)
+        if user is not None:
+            await self.cache.put(user)
+        return user
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        user = await self._by_index("email", email)
+        if user is not None:
+            return user
+        user = await self.inner.get_by_email(email)
+        if user is not None:
+            await self.cache.put(user)
+        return user
+
+    async def get_by_username(self, username: str) -> Optional[User]:
+        user = await self._by_index("user_name", username)
+        if user is not None:
+            return user
+        user = await self.inner.get_by_username(username)
+        if user is not None:
+            await self.cache.put(user)
+        return user
+
+    async def find_taken(self, emails: List[str], user_names: List[str]) -> Tuple[Set[str], Set[str]]:
+        return await self.inner.find_taken(emails, user_names)
+
+    async def list_users(
+        self,
+        skip: int = 0,
+        limit: int = 10,
+        role: Optional[UserRole] = None,
+        status: Optional[UserStatus] = None
+    ) -> Tuple[List[User], int]:
+        return await self.inner.list_users(skip, limit, role, status)
+
+    async def list_users_page(
+        self,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        role: Optional[UserRole] = None,
+        status: Optional[UserStatus] = None,
+        with_total: bool = False
+    ) -> UserPage:
+        return await self.inner.list_users_page(limit, cursor, role, status, with_total)
+
+    async def list_users_page_rows(
+        self,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        role: Optional[UserRole] = None,
+        status: Optional[UserStatus] = None,
+        with_total: bool = False
+    ) -> UserRowPage:
+        return await self.inner.list_users_page_rows(limit, cursor, role, status, with_total)
+
+    async def soft_delete(self, id: UUID) -> bool:
+        await self.cache.invalidate(id)
+        deleted = await self.inner.soft_delete(id)
+        await self.cache.invalidate(id)
+        return deleted
+
+    async def prune(self, id: UUID) -> bool:
+        await self.cache.invalidate(id)
+        pruned = await self.inner.prune(id)
+        await self.cache.invalidate(id)
+        return pruned
+
+
+# Process-wide singleton shared by every request-scoped repository
+user_cache = UserCache(
+    local_size=settings.USER_CACHE_LOCAL_SIZE,
+    local_ttl=settings.USER_CACHE_LOCAL_TTL_SECONDS,
+    redis_ttl=settings.USER_CACHE_REDIS_TTL_SECONDS,
+    redis=get_redis() if settings.USER_CACHE_USE_REDIS else None,
+    pubsub_redis=get_pubsub_redis() if settings.USER_CACHE_USE_REDIS else None,
+    tombstone_ttl=settings.USER_CACHE_TOMBSTONE_SECONDS
+)
@@ -0,0 +1,309 @@
+import asyncio
+import logging
+import random
+import re
+import time
+from collections import Counter, deque
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Deque, Dict, Optional, Set
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.infra.metrics import Histogram
+from app.infra.timing import current_timing
+from app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_OTHER = "<other>"
+
+# Driver SQL is already parameterized ($n); normalizing folds what still varies
+# with the call: batched VALUES rows, expanded IN lists and stray literals
+_ROWS = re.compile(r"\(\s*\$\d+[^()]*\)(?:\s*,\s*\(\s*\$\d+[^()]*\))+")
+_LIST = re.compile(r"\$\d+(?:::[\w\[\]]+)?(?:\s*,\s*\$\d+(?:::[\w\[\]]+)?)+")
+_PARAM = re.compile(r"\$\d+")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?\b")
+_SPACE = re.compile(r"\s+")
+
+# EXPLAIN ANALYZE plans the statement with its bound values inlined; plans keep
+# the shape and drop the values: every quoted literal, and numbers in predicates
+_PREDICATE = re.compile(r"^(\s*(?:(?:Index|Hash|Merge|Recheck) Cond|(?:Join |One-Time )?Filter):)(.*)$", re.MULTILINE)
+
+# EXPLAIN ANALYZE runs the statement again, so only plain reads qualify
+_READ_ONLY = re.compile(r"^\s*(?:SELECT|WITH)\b", re.IGNORECASE)
+_WRITES = re.compile(r"\b(?:INSERT|UPDATE|DELETE|FOR\s+(?:NO\s+KEY\s+)?UPDATE|FOR\s+(?:KEY\s+)?SHARE|nextval)\b", re.IGNORECASE)
+
+
+@lru_cache(maxsize=2048)  # Compiled statements repeat verbatim
+def normalize(statement: str) -> str:
+    statement = _ROWS.sub(lambda m: m.group(0)[:m.group(0).index(")") + 1] + ", ...", statement)
+    statement = _LIST.sub("?, ...", statement)
+    statement = _PARAM.sub("?", statement)
+    statement = _STRING.sub("?", statement)
+    statement = _NUMBER.sub("?", statement)
+    return _SPACE.sub(" ", statement).strip()
+
+
+def redact_plan(plan: str) -> str:
+    plan = _STRING.sub("'?'", plan)
+    return _PREDICATE.sub(lambda m: m.group(1) + _NUMBER.sub("?", m.group(2)), plan)
+
+
+def explainable(statement: str) -> bool:
+    return bool(_READ_ONLY.match(statement)) and not _WRITES.search(statement)
+
+
+class StatementStats:
+    """Aggregate for one normalized statement."""
+    __slots__ = ("calls", "errors", "slow", "repeated", "rows", "latency")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.slow = 0
+        self.repeated = 0  # Requests that ran it SQL_REPEAT_THRESHOLD+ times
+        self.rows = 0
+        self.latency = Histogram()
+
+    def snapshot(self) -> dict:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "slow": self.slow,
+            "repeated_in_request": self.repeated,
+            "rows": self.rows,
+            "total_ms": round(self.latency.sum * 1000, 2),
+            "mean_ms": round(self.latency.sum / self.calls * 1000, 3) if self.calls else 0.0,
+            "latency_seconds": self.latency.snapshot(),
+        }
+
+
+class RequestQueries:
+    """Statements one request has run so far, by normalized text."""
+    __slots__ = ("count", "seconds", "statements")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: Counter[str] = Counter()
+
+
+# Set by the timing middleware for each HTTP request, like app.infra.timing
+_current: ContextVar[Optional[RequestQueries]] = ContextVar("request_queries", default=None)
+
+
+class QueryInstrumentation:
+    """
+    Cursor-level SQL instrumentation, installed on an engine's sync core.
+
+    Every statement is timed and aggregated under its normalized text, and
+    counted against the current request (a `sql` Server-Timing phase). A
+    request that runs the same statement `repeat_threshold` or more times is
+    logged as a likely N+1. Statements slower than `slow_threshold` are
+    logged; a `explain_sample_rate` share of the slow reads is re-run as
+    EXPLAIN (ANALYZE, BUFFERS) on a one-connection engine to the same server, in a
+    read-only transaction under a statement timeout, at most one at a time
+    and once per statement per `explain_cooldown`. Plans, with their literal
+    values redacted, are kept in memory for /internal/sql and logged.
+    """
+    def __init__(
+        self,
+        slow_threshold: float = 0.2,
+        repeat_threshold: int = 5,
+        explain_sample_rate: float = 0.1,
+        explain_timeout: float = 5.0,
+        explain_cooldown: float = 300.0,
+        max_statements: int = 500,
+        plan_history: int = 20
+    ):
+        self.slow_threshold = slow_threshold
+        self.repeat_threshold = repeat_threshold
+        self.explain_sample_rate = explain_sample_rate
+        self.explain_timeout = explain_timeout
+        self.explain_cooldown = explain_cooldown
+        self.max_statements = max_statements
+
+        self.statements: Dict[str, StatementStats] = {}
+        self.plans: Deque[dict] = deque(maxlen=plan_history)
+        self.explains = 0
+        self.explain_failures = 0
+
+        self._explain_engines: Dict[str, AsyncEngine] = {}
+        self._explaining = False
+        self._explained_at: Dict[str, float] = {}
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    def install(self, engine: AsyncEngine) -> None:
+        sync_engine = engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", self._before)
+        event.listen(sync_engine, "after_cursor_execute", self._after)
+        event.listen(sync_engine, "handle_error", self._error)
+
+    async def close(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        for engine in self._explain_engines.values():
+            await engine.dispose()
+        self._explain_engines.clear()
+
+    # --- per request --- #
+
+    def begin_request(self) -> RequestQueries:
+        queries = RequestQueries()
+        _current.set(queries)
+        return queries
+
+    def end_request(self, queries: RequestQueries, label: str) -> None:
+        repeated = [(key, n) for key, n in queries.statements.items() if n >= self.repeat_threshold]
+        for key, n in repeated:
+            stats = self.statements.get(key)
+            if stats is not None:
+                stats.repeated += 1
+            logger.warning("%s ran the same statement %d times (possible N+1): %s", label, n, key[:300])
+
+    # --- cursor events --- #
+
+    def _before(self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    def _stats_for(self, key: str) -> StatementStats:
+        stats = self.statements.get(key)
+        if stats is None:
+            if len(self.statements) >= self.max_statements:
+                key = _OTHER
+                stats = self.statements.get(key)
+            if stats is None:
+                stats = self.statements[key] = StatementStats()
+        return stats
+
+    def _after(self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        key = normalize(statement)
+        stats = self._stats_for(key)
+        stats.calls += 1
+        stats.latency.observe(elapsed)
+        if cursor.rowcount and cursor.rowcount > 0:
+            stats.rows += cursor.rowcount
+
+        queries = _current.get()
+        if queries is not None:
+            queries.count += 1
+            queries.seconds += elapsed
+            queries.statements[key] += 1
+        timing = current_timing()
+        if timing is not None:
+            timing.add("sql", elapsed)
+
+        if elapsed >= self.slow_threshold:
+            stats.slow += 1
+            logger.warning("slow statement %.0f ms: %s", elapsed * 1000, key[:500])
+            if not executemany and self._should_explain(key, statement):
+                # On the server that ran it: a replica's plan can differ from the primary's
+                self._schedule_explain(key, statement, parameters, elapsed, conn.engine.url)
+
+    def _error(self, context: Any) -> None:
+        started = context.connection.info.get("query_started") if context.connection is not None else None
+        if started:
+            started.pop()
+        if context.statement is not None:
+            self._stats_for(normalize(context.statement)).errors += 1
+
+    # --- plan capture --- #
+
+    def _should_explain(self, key: str, statement: str) -> bool:
+        if self._explaining or random.random() >= self.explain_sample_rate or not explainable(statement):
+            return False
+        last = self._explained_at.get(key)
+        return last is None or time.monotonic() - last >= self.explain_cooldown
+
+    def _schedule_explain(self, key: str, statement: str, parameters: Any, elapsed: float, url: URL) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Sync use outside the app (scripts): no loop to run the capture on
+        self._explaining = True
+        self._explained_at[key] = time.monotonic()
+        task = loop.create_task(self._explain(key, statement, parameters, elapsed, url))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _engine(self, url: URL) -> AsyncEngine:
+        name = url.render_as_string(hide_password=False)
+        engine = self._explain_engines.get(name)
+        if engine is None:
+            engine = self._explain_engines[name] = create_async_engine(
+                url,
+                pool_logging_name="explain",
+                pool_size=1,
+                max_overflow=0,
+                pool_timeout=self.explain_timeout,
+                pool_recycle=settings.DB_POOL_RECYCLE_SECONDS
+            )
+        return engine
+
+    async def _explain(self, key: str, statement: str, parameters: Any, elapsed: float, url: URL) -> None:
+        try:
+            async with self._engine(url).connect() as conn:
+                # Read-only and time-boxed: a misclassified write fails instead of running twice
+                await conn.execute(text("SET TRANSACTION READ ONLY"))
+                await conn.execute(text(f"SET LOCAL statement_timeout = {int(self.explain_timeout * 1000)}"))
+                result = await conn.exec_driver_sql("EXPLAIN (ANALYZE, BUFFERS) " + statement, parameters)
+                plan = redact_plan("\n".join(row[0] for row in result))
+                await conn.rollback()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.explain_failures += 1
+            logger.warning("EXPLAIN capture failed for %s: %r", key[:200], e)
+        else:
+            self.explains += 1
+            self.plans.append({
+                "at": datetime.now(timezone.utc).isoformat(),
+                "statement": key,
+                "server": url.render_as_string(),
+                "elapsed_ms": round(elapsed * 1000, 2),
+                "plan": plan,
+            })
+            logger.warning("plan for slow statement (%.0f ms): %s\n%s", elapsed * 1000, key[:500], plan)
+        finally:
+            self._explaining = False
+
+    # --- reporting --- #
+
+    def top(self, n: int = 20, by: str = "total") -> list:
+        order = {
+            "total": lambda s: s.latency.sum,
+            "calls": lambda s: s.calls,
+            "max": lambda s: s.latency.max,
+            "slow": lambda s: s.slow,
+        }[by]
+        ranked = sorted(self.statements.items(), key=lambda kv: order(kv[1]), reverse=True)[:n]
+        return [{"statement": key, **stats.snapshot()} for key, stats in ranked]
+
+    def stats(self) -> dict:
+        return {
+            "statements": len(self.statements),
+            "calls": sum(s.calls for s in self.statements.values()),
+            "slow": sum(s.slow for s in self.statements.values()),
+            "repeated_in_request": sum(s.repeated for s in self.statements.values()),
+            "explains": self.explains,
+            "explain_failures": self.explain_failures,
+            "slow_threshold_ms": self.slow_threshold * 1000,
+        }
+
+
+# Process-wide singleton, installed on the engine by app.infra.db.session
+sql_instrumentation = QueryInstrumentation(
+    slow_threshold=settings.SQL_SLOW_QUERY_MS / 1000,
+    repeat_threshold=settings.SQL_REPEAT_THRESHOLD,
+    explain_sample_rate=settings.SQL_EXPLAIN_SAMPLE_RATE,
+    explain_timeout=settings.SQL_EXPLAIN_TIMEOUT_SECONDS,
+    explain_cooldown=settings.SQL_EXPLAIN_COOLDOWN_SECONDS,
+    max_statements=settings.SQL_MAX_STATEMENTS,
+    plan_history=settings.SQL_PLAN_HISTORY
+)
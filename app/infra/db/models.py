@@ -1,13 +1,15 @@
-from sqlalchemy import ARRAY, String, Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import String, Enum as SQLEnum
+# Dialect ARRAY: the generic one lacks the overlap (&&) / contains (@>) operators
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import ForeignKey, DateTime
+from sqlalchemy import ForeignKey, DateTime, Index, MetaData, Table, Column, Integer, BigInteger, SmallInteger, Float, Uuid
 from typing import Any
+from uuid import UUID
 from datetime import datetime
 from typing import Optional
 
 from app.domain.solver import AvailabilityStatus
-from app.infra.db.session import Base, CommonMixin
+from app.infra.db.session import Base, CommonMixin, TimePartitionedMixin
 from app.domain.user import UserRole, UserStatus
 from app.domain.buyer import HiringStatus
 from app.domain.staff import Department, AvailabilityStatus as StaffingAvailabilityStatus
@@ -37,6 +39,13 @@ class UserTable(CommonMixin, Base):
     )
 
 
+# Live users, newest first: keyset pages (uuid DESC) and their counts
+Index(
+    "ix_users_live_uuid",
+    UserTable.uuid.desc(),
+    postgresql_where=UserTable.deleted_at.is_(None)
+)
+
 
 class SolverTable(CommonMixin ,Base):
     __tablename__ = "solvers"
@@ -80,6 +89,30 @@ class SolverTable(CommonMixin ,Base):
     )
 
 
+# Solver search: GIN serves skills overlap (&&) and containment (@>);
+# the partial b-trees match the (rating DESC, uuid DESC) keyset order,
+# with a narrower one for the common "available only" search
+Index("ix_solvers_skills", SolverTable.skills, postgresql_using="gin")
+Index(
+    "ix_solvers_rating_uuid",
+    SolverTable.rating.desc(), SolverTable.uuid.desc(),
+    postgresql_where=SolverTable.deleted_at.is_(None)
+)
+Index(
+    "ix_solvers_available_rating_uuid",
+    SolverTable.rating.desc(), SolverTable.uuid.desc(),
+    postgresql_where=(SolverTable.deleted_at.is_(None)) & (SolverTable.is_available == AvailabilityStatus.AVAILABLE)
+)
+Index(
+    "ix_solvers_hourly_rate",
+    SolverTable.hourly_rate,
+    postgresql_where=SolverTable.deleted_at.is_(None)
+)
+# Matching refresh keyset: (updated_at, id) > watermark in index order.
+# Not partial: the refresh must also see soft deletes
+Index("ix_solvers_updated_at_id", SolverTable.updated_at, SolverTable.id)
+
+
 class BuyerTable(CommonMixin, Base):
     __tablename__ = "buyers"
 
@@ -176,7 +209,7 @@ class ProjectTable(CommonMixin, Base):
     )
 
 
-class ProposalTable(CommonMixin, Base):
+class ProposalTable(TimePartitionedMixin, Base):
     __tablename__ = "proposals"
 
     project_id: Mapped[int] = mapped_column(
@@ -200,6 +233,46 @@ class ProposalTable(CommonMixin, Base):
     )
 
 
+# Keyset listing per project, by price or by recency (live proposals only)
+Index(
+    "ix_proposals_project_price_uuid",
+    ProposalTable.project_id, ProposalTable.proposed_price, ProposalTable.uuid,
+    postgresql_where=ProposalTable.deleted_at.is_(None)
+)
+Index(
+    "ix_proposals_project_created_uuid",
+    ProposalTable.project_id, ProposalTable.created_at.desc(), ProposalTable.uuid.desc(),
+    postgresql_where=ProposalTable.deleted_at.is_(None)
+)
+
+
+class ProposalDedupTable(Base):
+    """
+    One row per (project, solver) that has bid. proposals is partitioned by
+    created_at, so it cannot carry this unique key itself; inserting here with
+    ON CONFLICT DO NOTHING is the once-per-solver guard.
+    """
+    __tablename__ = "proposal_dedup"
+
+    project_id: Mapped[int] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    solver_id: Mapped[int] = mapped_column(ForeignKey("solvers.id", ondelete="CASCADE"), primary_key=True)
+    proposal_uuid: Mapped[UUID] = mapped_column(Uuid, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+class ProjectProposalStatsTable(Base):
+    """
+    Per-project proposal count split over a few stripes: concurrent bids on one
+    project update different rows instead of queueing on a single counter.
+    The count is the sum over stripes.
+    """
+    __tablename__ = "project_proposal_stats"
+
+    project_id: Mapped[int] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    stripe: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    proposal_count: Mapped[int] = mapped_column(nullable=False, default=0)
+
+
 class TaskTable(CommonMixin, Base):
     __tablename__ = "tasks"
 
@@ -218,7 +291,7 @@ class TaskTable(CommonMixin, Base):
     )
 
 
-class TaskSubmissionTable(CommonMixin, Base):
+class TaskSubmissionTable(TimePartitionedMixin, Base):
     __tablename__ = "task_submissions"
 
     task_id: Mapped[int] = mapped_column(
@@ -256,3 +329,57 @@ class ProjectCompletionTable(CommonMixin, Base):
         nullable=False,
         default=CompletionStatus.PENDING
     )
+
+
+class OutboxEventTable(Base):
+    __tablename__ = "outbox_events"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    event_id: Mapped[UUID] = mapped_column(Uuid, unique=True, nullable=False)
+    subject: Mapped[str] = mapped_column(String(255), nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    occurred_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    published_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    attempts: Mapped[int] = mapped_column(nullable=False, server_default="0")
+    last_error: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    # Set once attempts reach OUTBOX_MAX_ATTEMPTS: the relay stops retrying the row
+    dead_lettered_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+# The relay only ever scans the unpublished, live tail; pruning walks published_at
+Index(
+    "ix_outbox_events_pending",
+    OutboxEventTable.id,
+    postgresql_where=(OutboxEventTable.published_at.is_(None)) & (OutboxEventTable.dead_lettered_at.is_(None))
+)
+Index("ix_outbox_events_published_at", OutboxEventTable.published_at, postgresql_where=OutboxEventTable.published_at.is_not(None))
+
+
+class MaterializedViewRefreshTable(Base):
+    __tablename__ = "materialized_view_refreshes"
+
+    view_name: Mapped[str] = mapped_column(String(63), primary_key=True)
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    duration_ms: Mapped[float] = mapped_column(nullable=False, server_default="0")
+
+
+# Materialized views are created by hand-written migrations; keeping them out of
+# Base.metadata stops autogenerate from emitting CREATE TABLE for them
+views_metadata = MetaData()
+
+# Refreshed by pg_cron via refresh_open_projects_feed()
+OpenProjectsFeedView = Table(
+    "open_projects_feed",
+    views_metadata,
+    Column("id", Integer, primary_key=True),
+    Column("uuid", Uuid, nullable=False),
+    Column("project_name", String(255), nullable=False),
+    Column("project_summary", String(280), nullable=False),
+    Column("project_budget", Float, nullable=False),
+    Column("project_duration_days", Integer, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Column("buyer_uuid", Uuid, nullable=False),
+    Column("buyer_rating", Float, nullable=False),
+    Column("buyer_hiring_status", SQLEnum(HiringStatus, name="hiring_status", create_type=False), nullable=False),
+    Column("proposal_count", Integer, nullable=False),
+)
@@ -0,0 +1,96 @@
+from datetime import datetime, timezone
+from typing import List, Sequence, Tuple
+
+from sqlalchemy import BigInteger, any_, bindparam, case, delete, func, insert, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.event import DomainEvent
+from app.ports.event_ports import OutboxRepository
+from app.infra.db.models import OutboxEventTable
+
+_STAGE = insert(OutboxEventTable)
+_CLAIM_COLUMNS = (
+    OutboxEventTable.id,
+    OutboxEventTable.subject,
+    OutboxEventTable.payload,
+    OutboxEventTable.event_id,
+    OutboxEventTable.occurred_at,
+)
+
+# = ANY(array): one statement text whatever the batch size
+_IDS = bindparam("b_ids", type_=ARRAY(BigInteger))
+_MARK_PUBLISHED = (
+    update(OutboxEventTable)
+    .where(OutboxEventTable.id == any_(_IDS))
+    .values(published_at=bindparam("b_now"), attempts=OutboxEventTable.attempts + 1)
+)
+# The row's last allowed attempt dead-letters it, so it no longer holds up the queue
+_MARK_FAILED = (
+    update(OutboxEventTable)
+    .where(OutboxEventTable.id == any_(_IDS))
+    .values(
+        attempts=OutboxEventTable.attempts + 1,
+        last_error=bindparam("b_error"),
+        dead_lettered_at=case(
+            (OutboxEventTable.attempts + 1 >= bindparam("b_max_attempts"), func.now()),
+            else_=None
+        )
+    )
+    .returning(OutboxEventTable.dead_lettered_at)
+)
+
+
+async def stage_events(session: AsyncSession, events: Sequence[DomainEvent]) -> None:
+    """
+    Queue events in the caller's transaction. They become visible to the
+    relay only if the surrounding change commits, and vanish with a rollback.
+    """
+    if not events:
+        return
+    await session.execute(_STAGE, [
+        {
+            "event_id": event.event_id,
+            "subject": event.subject,
+            "payload": event.payload,
+            "occurred_at": event.occurred_at,
+        }
+        for event in events
+    ])
+
+
+class AlchemyOutboxRepository(OutboxRepository):
+    def __init__(self, session: AsyncSession, max_attempts: int = 10):
+        self.session = session
+        self.max_attempts = max_attempts
+
+    async def claim_batch(self, limit: int) -> List[Tuple[int, DomainEvent]]:
+        rows = (await self.session.execute(
+            select(*_CLAIM_COLUMNS)
+            .where(OutboxEventTable.published_at == None, OutboxEventTable.dead_lettered_at == None)
+            .order_by(OutboxEventTable.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )).all()
+        return [(row[0], DomainEvent(*row[1:])) for row in rows]
+
+    async def mark(self, published: Sequence[int], failed: Sequence[int], error: str) -> int:
+        dead_lettered = 0
+        if published:
+            await self.session.execute(
+                _MARK_PUBLISHED, {"b_ids": list(published), "b_now": datetime.now(timezone.utc)}
+            )
+        if failed:
+            result = await self.session.execute(
+                _MARK_FAILED, {"b_ids": list(failed), "b_error": error[:500], "b_max_attempts": self.max_attempts}
+            )
+            dead_lettered = sum(1 for dead_at in result.scalars() if dead_at is not None)
+        await self.session.commit()
+        return dead_lettered
+
+    async def prune_published(self, before: datetime) -> int:
+        result = await self.session.execute(
+            delete(OutboxEventTable).where(OutboxEventTable.published_at < before)
+        )
+        await self.session.commit()
+        return getattr(result, "rowcount", 0)
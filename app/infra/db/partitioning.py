@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import ColumnElement
+
+# Partition bounds are whole months; a lookup window of a day either side of
+# the uuid timestamp touches one partition, two at a month boundary
+UUID7_CLOCK_SLACK = timedelta(days=1)
+
+
+def uuid7_created_at_window(
+    id: UUID,
+    slack: timedelta = UUID7_CLOCK_SLACK
+) -> Optional[Tuple[datetime, datetime]]:
+    """
+    created_at range a row with this uuid7 must fall in, or None for other
+    uuid versions (e.g. rows inserted with the gen_random_uuid() server default).
+    """
+    if id.version != 7:
+        return None
+    stamped = datetime.fromtimestamp((id.int >> 80) / 1000, tz=timezone.utc)
+    return stamped - slack, stamped + slack
+
+
+def uuid_lookup(table: Any, id: UUID) -> List[ColumnElement[bool]]:
+    """
+    Predicates for fetching a partitioned row by uuid. Without the created_at
+    bounds every partition's uuid index is probed.
+    """
+    predicates = [table.uuid == id]
+    window = uuid7_created_at_window(id)
+    if window is not None:
+        predicates.append(table.created_at.between(*window))
+    return predicates
+
+
+def recent(table: Any, since: datetime) -> ColumnElement[bool]:
+    """Recent-window predicate; a bound value lets Postgres prune partitions before scanning."""
+    return table.created_at >= since
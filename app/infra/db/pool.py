@@ -0,0 +1,63 @@
+import time
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+from app.infra.metrics import Histogram
+
+
+class PoolMetrics:
+    """Checkout counters for one named pool; survives pool.recreate() on dispose."""
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.checkout_wait = Histogram()
+
+
+# Keyed by pool_logging_name so a disposed-and-recreated pool keeps its history
+_registry: dict[str, PoolMetrics] = {}
+
+
+def _metrics_for(pool: Pool) -> PoolMetrics:
+    name = getattr(pool, "_orig_logging_name", None) or "default"
+    return _registry.setdefault(name, PoolMetrics())
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool that times how long each checkout waits for a
+    connection (including connecting a fresh one) and counts pool timeouts.
+    """
+    def _do_get(self) -> Any:
+        metrics = _metrics_for(self)
+        started = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            metrics.timeouts += 1
+            raise
+        finally:
+            metrics.checkout_wait.observe(time.perf_counter() - started)
+        metrics.checkouts += 1
+        return conn
+
+
+def pool_stats(pool: Pool) -> dict:
+    """Live gauges plus accumulated checkout metrics for a pool."""
+    stats: dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+            timeout_seconds=pool.timeout(),
+        )
+    metrics = _metrics_for(pool)
+    stats.update(
+        checkouts=metrics.checkouts,
+        timeouts=metrics.timeouts,
+        checkout_wait_seconds=metrics.checkout_wait.snapshot(),
+    )
+    return stats
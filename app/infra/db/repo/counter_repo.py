@@ -0,0 +1,164 @@
+from typing import Optional, Tuple
+
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.domain.project_compleation import CompletionStatus
+from app.ports.counter_ports import CounterRepository
+from app.infra.db.models import BuyerTable, ProjectCompletionTable, ProjectTable, SolverTable
+
+# Float counters are compared with a tolerance: the incremental running mean
+# and AVG() round differently
+_EPSILON = 1e-6
+
+
+class AlchemyCounterRepository(CounterRepository):
+    """
+    The aggregates below are the definition the incremental updates in
+    AlchemyProjectRepository must agree with:
+      total_projects     projects that ever had a solver assigned
+      completed_projects projects with an approved completion request
+      solver rating      mean solver_rating of approved completions
+      buyer total_spent  budget of the buyer's approved projects
+    Buyer rating has no source data and is left alone.
+    """
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def _lock_batch(self, table, after_id: int, limit: int) -> Optional[Tuple[int, int]]:
+        # Lock first, aggregate in a later statement: a concurrent assignment
+        # either committed before the lock (and is counted) or blocks on its
+        # counter UPDATE until we commit (and increments our repaired value).
+        # Aggregating in the same statement could overwrite such an increment
+        ids = (await self.session.execute(
+            select(table.id)
+            .where(table.id > after_id)
+            .order_by(table.id)
+            .limit(limit)
+            .with_for_update()
+        )).scalars().all()
+        return (ids[0], ids[-1]) if ids else None
+
+    async def reconcile_solvers(self, after_id: int, limit: int) -> Tuple[Optional[int], int]:
+        bounds = await self._lock_batch(SolverTable, after_id, limit)
+        if bounds is None:
+            await self.session.commit()
+            return None, 0
+        first, last = bounds
+
+        assigned = (
+            select(ProjectTable.solver_id, func.count().label("total"))
+            .where(ProjectTable.solver_id.between(first, last), ProjectTable.solver_assigned_at != None)
+            .group_by(ProjectTable.solver_id)
+            .subquery()
+        )
+        approved = (
+            select(
+                ProjectTable.solver_id,
+                func.count().label("completed"),
+                func.avg(ProjectCompletionTable.solver_rating).label("rating")
+            )
+            .join(ProjectCompletionTable, ProjectCompletionTable.project_id == ProjectTable.id)
+            .where(
+                ProjectTable.solver_id.between(first, last),
+                ProjectCompletionTable.completion_status == CompletionStatus.APPROVED
+            )
+            .group_by(ProjectTable.solver_id)
+            .subquery()
+        )
+        solver = aliased(SolverTable)
+        expected = (
+            select(
+                solver.id,
+                func.coalesce(assigned.c.total, 0).label("total"),
+                func.coalesce(approved.c.completed, 0).label("completed"),
+                # No approved work yet: keep whatever rating the solver started with
+                func.coalesce(approved.c.rating, solver.rating).label("rating")
+            )
+            .outerjoin(assigned, assigned.c.solver_id == solver.id)
+            .outerjoin(approved, approved.c.solver_id == solver.id)
+            .where(solver.id.between(first, last))
+            .subquery()
+        )
+        result = await self.session.execute(
+            update(SolverTable)
+            .where(
+                SolverTable.id == expected.c.id,
+                or_(
+                    SolverTable.total_projects != expected.c.total,
+                    SolverTable.completed_projects != expected.c.completed,
+                    func.abs(SolverTable.rating - expected.c.rating) > _EPSILON
+                )
+            )
+            .values(
+                total_projects=expected.c.total,
+                completed_projects=expected.c.completed,
+                rating=expected.c.rating
+            )
+            .returning(SolverTable.id)
+        )
+        repaired = len(result.all())
+        await self.session.commit()
+        return last, repaired
+
+    async def reconcile_buyers(self, after_id: int, limit: int) -> Tuple[Optional[int], int]:
+        bounds = await self._lock_batch(BuyerTable, after_id, limit)
+        if bounds is None:
+            await self.session.commit()
+            return None, 0
+        first, last = bounds
+
+        assigned = (
+            select(ProjectTable.buyer_id, func.count().label("total"))
+            .where(ProjectTable.buyer_id.between(first, last), ProjectTable.solver_assigned_at != None)
+            .group_by(ProjectTable.buyer_id)
+            .subquery()
+        )
+        approved = (
+            select(
+                ProjectTable.buyer_id,
+                func.count().label("completed"),
+                func.sum(ProjectTable.project_budget).label("spent")
+            )
+            .join(ProjectCompletionTable, ProjectCompletionTable.project_id == ProjectTable.id)
+            .where(
+                ProjectTable.buyer_id.between(first, last),
+                ProjectCompletionTable.completion_status == CompletionStatus.APPROVED
+            )
+            .group_by(ProjectTable.buyer_id)
+            .subquery()
+        )
+        buyer = aliased(BuyerTable)
+        expected = (
+            select(
+                buyer.id,
+                func.coalesce(assigned.c.total, 0).label("total"),
+                func.coalesce(approved.c.completed, 0).label("completed"),
+                func.coalesce(approved.c.spent, 0.0).label("spent")
+            )
+            .outerjoin(assigned, assigned.c.buyer_id == buyer.id)
+            .outerjoin(approved, approved.c.buyer_id == buyer.id)
+            .where(buyer.id.between(first, last))
+            .subquery()
+        )
+        result = await self.session.execute(
+            update(BuyerTable)
+            .where(
+                BuyerTable.id == expected.c.id,
+                or_(
+                    BuyerTable.total_projects != expected.c.total,
+                    BuyerTable.completed_projects != expected.c.completed,
+                    func.abs(BuyerTable.total_spent - expected.c.spent) > _EPSILON
+                )
+            )
+            .values(
+                total_projects=expected.c.total,
+                completed_projects=expected.c.completed,
+                total_spent=expected.c.spent
+            )
+            .returning(BuyerTable.id)
+        )
+        repaired = len(result.all())
+        await self.session.commit()
+        return last, repaired
@@ -0,0 +1,233 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import bindparam, func, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.event import PROJECT_COMPLETED, PROJECT_SOLVER_ASSIGNED, project_event
+from app.domain.project import OpenProject, OpenProjectFeedPage, Project, ProjectStatus
+from app.domain.project_compleation import CompletionStatus
+from app.ports.project_ports import ProjectRepository
+from app.infra.db.models import (
+    BuyerTable,
+    MaterializedViewRefreshTable,
+    OpenProjectsFeedView,
+    ProjectCompletionTable,
+    ProjectTable,
+    SolverTable,
+    UserTable,
+)
+from app.infra.db.outbox import stage_events
+from app.infra.db.pagination import decode_cursor, encode_cursor
+
+_GET_BY_UUID = select(ProjectTable).where(
+    ProjectTable.uuid == bindparam("b_uuid"), ProjectTable.deleted_at == None
+)
+_PROJECT_ID = select(ProjectTable.id).where(
+    ProjectTable.uuid == bindparam("b_project_uuid"), ProjectTable.deleted_at == None
+)
+_OWN_PROJECT_ID = (
+    select(ProjectTable.id)
+    .join(BuyerTable, BuyerTable.id == ProjectTable.buyer_id)
+    .join(UserTable, UserTable.id == BuyerTable.user_id)
+    .where(
+        ProjectTable.uuid == bindparam("b_project_uuid"),
+        ProjectTable.deleted_at == None,
+        UserTable.uuid == bindparam("b_user_uuid")
+    )
+)
+_GET_SOLVER_ID = select(SolverTable.id).where(
+    SolverTable.uuid == bindparam("b_solver_uuid"), SolverTable.deleted_at == None
+)
+
+# State transitions are conditional UPDATEs: only the transaction that actually
+# moves the row bumps the counters, so retries and races cannot double count
+_ASSIGN = (
+    update(ProjectTable)
+    .where(
+        ProjectTable.id == bindparam("b_id"),
+        ProjectTable.project_status == ProjectStatus.PENDING,
+        ProjectTable.solver_id == None,
+        ProjectTable.deleted_at == None
+    )
+    .values(
+        solver_id=bindparam("b_solver_id"),
+        project_status=ProjectStatus.IN_PROGRESS,
+        solver_assigned_at=func.now()
+    )
+    .returning(ProjectTable)
+)
+_APPROVE_COMPLETION = (
+    update(ProjectCompletionTable)
+    .where(
+        ProjectCompletionTable.project_id == select(ProjectTable.id).where(
+            ProjectTable.id == bindparam("b_id"),
+            ProjectTable.project_status == ProjectStatus.IN_PROGRESS,
+            ProjectTable.deleted_at == None
+        ).scalar_subquery(),
+        ProjectCompletionTable.completion_status == CompletionStatus.PENDING,
+        ProjectCompletionTable.deleted_at == None
+    )
+    .values(completion_status=CompletionStatus.APPROVED)
+    .returning(ProjectCompletionTable.project_id, ProjectCompletionTable.solver_rating)
+)
+_COMPLETE = (
+    update(ProjectTable)
+    .where(ProjectTable.id == bindparam("b_id"))
+    .values(project_status=ProjectStatus.COMPLETED)
+    .returning(ProjectTable)
+)
+
+# Counter deltas. The right-hand side reads the pre-update row, so the rating
+# is a running mean over approved completions without re-aggregating
+_SOLVER_ASSIGNED = (
+    update(SolverTable)
+    .where(SolverTable.id == bindparam("b_id"))
+    .values(total_projects=SolverTable.total_projects + 1)
+)
+_BUYER_ASSIGNED = (
+    update(BuyerTable)
+    .where(BuyerTable.id == bindparam("b_id"))
+    .values(total_projects=BuyerTable.total_projects + 1)
+)
+_SOLVER_COMPLETED = (
+    update(SolverTable)
+    .where(SolverTable.id == bindparam("b_id"))
+    .values(
+        completed_projects=SolverTable.completed_projects + 1,
+        rating=(
+            SolverTable.rating * SolverTable.completed_projects + bindparam("b_rating")
+        ) / (SolverTable.completed_projects + 1)
+    )
+)
+_BUYER_COMPLETED = (
+    update(BuyerTable)
+    .where(BuyerTable.id == bindparam("b_id"))
+    .values(
+        completed_projects=BuyerTable.completed_projects + 1,
+        total_spent=BuyerTable.total_spent + bindparam("b_budget")
+    )
+)
+
+_FEED = OpenProjectsFeedView.c
+# OpenProject field order
+_FEED_COLUMNS = (
+    _FEED.uuid,
+    _FEED.project_name,
+    _FEED.project_summary,
+    _FEED.project_budget,
+    _FEED.project_duration_days,
+    _FEED.created_at,
+    _FEED.buyer_uuid,
+    _FEED.buyer_rating,
+    _FEED.buyer_hiring_status,
+    _FEED.proposal_count,
+)
+_FEED_REFRESHED_AT = select(MaterializedViewRefreshTable.refreshed_at).where(
+    MaterializedViewRefreshTable.view_name == "open_projects_feed"
+)
+
+
+class AlchemyProjectRepository(ProjectRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    def _to_domain(self, row: ProjectTable) -> Project:
+        return Project(
+            id=row.id,
+            project_name=row.project_name,
+            project_description=row.project_description,
+            project_budget=row.project_budget,
+            project_duration_days=row.project_duration_days,
+            buyer_id=row.buyer_id,
+            solver_id=row.solver_id,
+            uuid=row.uuid,
+            project_status=row.project_status,
+            solver_assiened_at=row.solver_assigned_at.isoformat() if row.solver_assigned_at else "",
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            deleted_at=row.deleted_at
+        )
+
+    async def get_by_uuid(self, id: UUID) -> Optional[Project]:
+        result = await self.session.execute(_GET_BY_UUID, {"b_uuid": id})
+        row = result.scalar_one_or_none()
+        return self._to_domain(row) if row else None
+
+    async def resolve_id(self, id: UUID, buyer_user_id: Optional[UUID] = None) -> Optional[int]:
+        if buyer_user_id is None:
+            return await self.session.scalar(_PROJECT_ID, {"b_project_uuid": id})
+        return await self.session.scalar(_OWN_PROJECT_ID, {"b_project_uuid": id, "b_user_uuid": buyer_user_id})
+
+    async def assign_solver(self, project_pk: int, solver_id: UUID) -> Optional[Project]:
+        solver_pk = await self.session.scalar(_GET_SOLVER_ID, {"b_solver_uuid": solver_id})
+        if solver_pk is None:
+            await self.session.rollback()
+            return None
+
+        result = await self.session.execute(_ASSIGN, {"b_id": project_pk, "b_solver_id": solver_pk})
+        row = result.scalar_one_or_none()
+        if row is None:
+            await self.session.rollback()
+            return None
+
+        await self.session.execute(_SOLVER_ASSIGNED, {"b_id": row.solver_id})
+        await self.session.execute(_BUYER_ASSIGNED, {"b_id": row.buyer_id})
+        project = self._to_domain(row)
+        await stage_events(self.session, [project_event(
+            PROJECT_SOLVER_ASSIGNED, project,
+            solver_uuid=str(solver_id),
+            solver_assigned_at=project.solver_assiened_at
+        )])
+        await self.session.commit()
+        return project
+
+    async def approve_completion(self, project_pk: int) -> Optional[Project]:
+        result = await self.session.execute(_APPROVE_COMPLETION, {"b_id": project_pk})
+        approved = result.one_or_none()
+        if approved is None:
+            await self.session.rollback()
+            return None
+
+        result = await self.session.execute(_COMPLETE, {"b_id": approved.project_id})
+        row = result.scalar_one()
+        if row.solver_id is not None:
+            await self.session.execute(
+                _SOLVER_COMPLETED, {"b_id": row.solver_id, "b_rating": approved.solver_rating}
+            )
+        await self.session.execute(
+            _BUYER_COMPLETED, {"b_id": row.buyer_id, "b_budget": row.project_budget}
+        )
+        project = self._to_domain(row)
+        await stage_events(self.session, [project_event(
+            PROJECT_COMPLETED, project, solver_rating=approved.solver_rating
+        )])
+        await self.session.commit()
+        return project
+
+    async def list_open_feed(self, limit: int = 20, cursor: Optional[str] = None) -> OpenProjectFeedPage:
+        # Newest first on (created_at, uuid), served by ix_open_projects_feed_created_uuid
+        query = select(*_FEED_COLUMNS).order_by(_FEED.created_at.desc(), _FEED.uuid.desc()).limit(limit + 1)
+        if cursor:
+            created_at, uuid = decode_cursor(cursor, 2)
+            try:
+                after = (datetime.fromisoformat(created_at), UUID(uuid))
+            except (TypeError, ValueError):
+                raise ValueError("Invalid cursor")
+            query = query.where(tuple_(_FEED.created_at, _FEED.uuid) < tuple_(*after))
+
+        rows = (await self.session.execute(query)).all()
+        refreshed_at = await self.session.scalar(_FEED_REFRESHED_AT)
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last.created_at.isoformat(), last.uuid)
+
+        return OpenProjectFeedPage(
+            items=[OpenProject(*row) for row in rows],
+            next_cursor=next_cursor,
+            refreshed_at=refreshed_at
+        )
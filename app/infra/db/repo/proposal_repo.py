@@ -0,0 +1,199 @@
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import UUID, uuid7
+
+from sqlalchemy import bindparam, func, insert, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.event import PROPOSAL_SUBMITTED, DomainEvent
+from app.domain.project import ProjectStatus
+from app.domain.proposal import Proposal, ProposalPage, ProposalSort, ProposalSubmission
+from app.ports.proposal_ports import ProposalRepository
+from app.infra.db.models import (
+    BuyerTable,
+    ProjectProposalStatsTable,
+    ProjectTable,
+    ProposalDedupTable,
+    ProposalTable,
+    SolverTable,
+    UserTable,
+)
+from app.infra.db.outbox import stage_events
+from app.infra.db.pagination import decode_cursor, encode_cursor
+
+# Both ids in one round trip, each through a unique index
+_RESOLVE_IDS = select(
+    select(ProjectTable.id).where(
+        ProjectTable.uuid == bindparam("b_project_uuid"),
+        ProjectTable.project_status == ProjectStatus.PENDING,
+        ProjectTable.deleted_at == None
+    ).scalar_subquery(),
+    select(SolverTable.id).join(UserTable, UserTable.id == SolverTable.user_id).where(
+        UserTable.uuid == bindparam("b_user_uuid"),
+        SolverTable.deleted_at == None
+    ).scalar_subquery()
+)
+# The once-per-solver guard: losers of a race (or a retry) insert nothing
+_GUARD = (
+    pg_insert(ProposalDedupTable)
+    .values(
+        project_id=bindparam("b_project_id"),
+        solver_id=bindparam("b_solver_id"),
+        proposal_uuid=bindparam("b_uuid"),
+        created_at=bindparam("b_created_at")
+    )
+    .on_conflict_do_nothing()
+    .returning(ProposalDedupTable.project_id)
+)
+_INSERT = (
+    insert(ProposalTable)
+    .values(
+        project_id=bindparam("b_project_id"),
+        solver_id=bindparam("b_solver_id"),
+        proposed_price=bindparam("b_price"),
+        cover_letter=bindparam("b_cover_letter"),
+        uuid=bindparam("b_uuid"),
+        created_at=bindparam("b_created_at")
+    )
+    .returning(ProposalTable)
+)
+_stats_insert = pg_insert(ProjectProposalStatsTable).values(
+    project_id=bindparam("b_project_id"),
+    stripe=bindparam("b_stripe"),
+    proposal_count=1
+)
+_BUMP_COUNT = _stats_insert.on_conflict_do_update(
+    index_elements=[ProjectProposalStatsTable.project_id, ProjectProposalStatsTable.stripe],
+    set_={"proposal_count": ProjectProposalStatsTable.proposal_count + 1}
+)
+_COUNT = select(func.coalesce(func.sum(ProjectProposalStatsTable.proposal_count), 0)).where(
+    ProjectProposalStatsTable.project_id == bindparam("b_project_id")
+)
+_PROJECT_ID = select(ProjectTable.id).where(
+    ProjectTable.uuid == bindparam("b_project_uuid"), ProjectTable.deleted_at == None
+)
+_OWN_PROJECT_ID = (
+    select(ProjectTable.id)
+    .join(BuyerTable, BuyerTable.id == ProjectTable.buyer_id)
+    .join(UserTable, UserTable.id == BuyerTable.user_id)
+    .where(
+        ProjectTable.uuid == bindparam("b_project_uuid"),
+        ProjectTable.deleted_at == None,
+        UserTable.uuid == bindparam("b_user_uuid")
+    )
+)
+
+
+class AlchemyProposalRepository(ProposalRepository):
+    def __init__(self, session: AsyncSession, count_stripes: int = 16):
+        self.session = session
+        self.count_stripes = count_stripes
+
+    def _to_domain(self, row: ProposalTable) -> Proposal:
+        return Proposal(
+            id=row.id,
+            project_id=row.project_id,
+            solver_id=row.solver_id,
+            proposed_price=row.proposed_price,
+            cover_letter=row.cover_letter,
+            uuid=row.uuid,
+            proposal_status=row.proposal_status,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            deleted_at=row.deleted_at
+        )
+
+    async def resolve_ids(self, project_id: UUID, solver_user_id: UUID) -> tuple[Optional[int], Optional[int]]:
+        row = (await self.session.execute(
+            _RESOLVE_IDS, {"b_project_uuid": project_id, "b_user_uuid": solver_user_id}
+        )).one()
+        return row[0], row[1]
+
+    async def submit(self, project_pk: int, solver_pk: int, submission: ProposalSubmission) -> Optional[Proposal]:
+        # uuid and created_at come from the same clock, which keeps uuid
+        # lookups partition-prunable
+        params = {
+            "b_project_id": project_pk,
+            "b_solver_id": solver_pk,
+            "b_uuid": uuid7(),
+            "b_created_at": datetime.now(timezone.utc),
+        }
+        if (await self.session.execute(_GUARD, params)).scalar_one_or_none() is None:
+            await self.session.rollback()
+            return None
+
+        result = await self.session.execute(_INSERT, {
+            **params,
+            "b_price": submission.proposed_price,
+            "b_cover_letter": submission.cover_letter,
+        })
+        proposal = self._to_domain(result.scalar_one())
+
+        # A solver always lands on the same stripe; thousands of bidders on one
+        # project spread over count_stripes rows
+        await self.session.execute(_BUMP_COUNT, {
+            "b_project_id": project_pk,
+            "b_stripe": solver_pk % self.count_stripes,
+        })
+        await stage_events(self.session, [DomainEvent(PROPOSAL_SUBMITTED, {
+            "proposal_uuid": str(proposal.uuid),
+            "project_uuid": str(submission.project_uuid),
+            "solver_user_uuid": str(submission.solver_user_uuid),
+            "proposed_price": proposal.proposed_price,
+        })])
+        await self.session.commit()
+        return proposal
+
+    async def list_for_project(
+        self,
+        project_id: UUID,
+        sort: ProposalSort = ProposalSort.RECENT,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        buyer_user_id: Optional[UUID] = None
+    ) -> Optional[ProposalPage]:
+        if buyer_user_id is None:
+            project_pk = await self.session.scalar(_PROJECT_ID, {"b_project_uuid": project_id})
+        else:
+            project_pk = await self.session.scalar(
+                _OWN_PROJECT_ID, {"b_project_uuid": project_id, "b_user_uuid": buyer_user_id}
+            )
+        if project_pk is None:
+            return None
+
+        conditions = [ProposalTable.project_id == project_pk, ProposalTable.deleted_at == None]
+        # Each order matches its partial index exactly:
+        # price -> (project_id, proposed_price, uuid); recent -> (project_id, created_at DESC, uuid DESC)
+        if sort is ProposalSort.PRICE:
+            order = (ProposalTable.proposed_price.asc(), ProposalTable.uuid.asc())
+        else:
+            order = (ProposalTable.created_at.desc(), ProposalTable.uuid.desc())
+
+        if cursor:
+            last_key, last_uuid = decode_cursor(cursor, 2)
+            try:
+                if sort is ProposalSort.PRICE:
+                    key = (float(last_key), UUID(str(last_uuid)))
+                    conditions.append(tuple_(ProposalTable.proposed_price, ProposalTable.uuid) > tuple_(*key))
+                else:
+                    key = (datetime.fromisoformat(str(last_key)), UUID(str(last_uuid)))
+                    conditions.append(tuple_(ProposalTable.created_at, ProposalTable.uuid) < tuple_(*key))
+            except (TypeError, ValueError):
+                raise ValueError("Invalid cursor")
+
+        rows = (await self.session.execute(
+            select(ProposalTable).where(*conditions).order_by(*order).limit(limit + 1)
+        )).scalars().all()
+        total = await self.session.scalar(_COUNT, {"b_project_id": project_pk})
+
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            sort_key = last.proposed_price if sort is ProposalSort.PRICE else last.created_at.isoformat()
+            next_cursor = encode_cursor(sort_key, last.uuid)
+        return ProposalPage(
+            items=[self._to_domain(row) for row in rows[:limit]],
+            next_cursor=next_cursor,
+            total=int(total or 0)
+        )
@@ -0,0 +1,131 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import bindparam, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.matching import SolverFeatures
+from app.domain.solver import Solver, SolverPage, SolverSearchFilters
+from app.ports.solver_ports import SolverRepository
+from app.infra.db.models import SolverTable
+from app.infra.db.pagination import decode_cursor, encode_cursor
+
+# Only the columns the matching engine scores on; no ORM entities for bulk loads
+_FEATURE_COLUMNS = (
+    SolverTable.id,
+    SolverTable.uuid,
+    SolverTable.hourly_rate,
+    SolverTable.rating,
+    SolverTable.total_projects,
+    SolverTable.completed_projects,
+    SolverTable.is_available,
+    SolverTable.skills,
+    SolverTable.updated_at,
+    SolverTable.deleted_at,
+)
+# Refresh pages walk ix_solvers_updated_at_id in order; soft-deleted rows are
+# included so the matching engine sees deletions
+_FEATURES_FROM_START = (
+    select(*_FEATURE_COLUMNS)
+    .order_by(SolverTable.updated_at, SolverTable.id)
+    .limit(bindparam("b_limit"))
+)
+_FEATURES_CHANGED = (
+    select(*_FEATURE_COLUMNS)
+    .where(tuple_(SolverTable.updated_at, SolverTable.id) > tuple_(
+        bindparam("b_updated_at", type_=SolverTable.updated_at.type),
+        bindparam("b_id", type_=SolverTable.id.type)
+    ))
+    .order_by(SolverTable.updated_at, SolverTable.id)
+    .limit(bindparam("b_limit"))
+)
+
+
+class AlchemySolverRepository(SolverRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    def _to_domain(self, row: SolverTable) -> Solver:
+        return Solver(
+            id=row.id,
+            user_id=row.user_id,
+            full_name=row.full_name,
+            bio=row.bio,
+            hourly_rate=row.hourly_rate,
+            experience_years=row.experience_years,
+            rating=row.rating,
+            total_projects=row.total_projects,
+            completed_projects=row.completed_projects,
+            protfolio_url=row.portfolio_url,
+            meta=row.meta,
+            is_available=row.is_available,
+            skills=row.skills,
+            uuid=row.uuid,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            deleted_at=row.deleted_at
+        )
+
+    async def search(
+        self,
+        filters: SolverSearchFilters,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> SolverPage:
+        # Every predicate maps onto an index: skills -> GIN, rate -> partial b-tree,
+        # order + cursor -> partial (rating DESC, uuid DESC)
+        conditions = [SolverTable.deleted_at == None]
+        if filters.skills_any:
+            conditions.append(SolverTable.skills.overlap(filters.skills_any))
+        if filters.skills_all:
+            conditions.append(SolverTable.skills.contains(filters.skills_all))
+        if filters.min_hourly_rate is not None:
+            conditions.append(SolverTable.hourly_rate >= filters.min_hourly_rate)
+        if filters.max_hourly_rate is not None:
+            conditions.append(SolverTable.hourly_rate <= filters.max_hourly_rate)
+        if filters.min_experience_years is not None:
+            conditions.append(SolverTable.experience_years >= filters.min_experience_years)
+        if filters.availability is not None:
+            conditions.append(SolverTable.is_available == filters.availability)
+
+        if cursor:
+            last_rating, last_uuid = decode_cursor(cursor, 2)
+            try:
+                key = (float(last_rating), UUID(str(last_uuid)))
+            except (TypeError, ValueError):
+                raise ValueError("Invalid cursor")
+            # Row comparison matches the index order exactly (both columns DESC)
+            conditions.append(tuple_(SolverTable.rating, SolverTable.uuid) < tuple_(*key))
+
+        query = (
+            select(SolverTable)
+            .where(*conditions)
+            .order_by(SolverTable.rating.desc(), SolverTable.uuid.desc())
+            .limit(limit + 1)
+        )
+        rows = (await self.session.execute(query)).scalars().all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = encode_cursor(last.rating, last.uuid)
+        return SolverPage(
+            items=[self._to_domain(row) for row in rows[:limit]],
+            next_cursor=next_cursor
+        )
+
+    async def list_features_changed_since(
+        self,
+        after: Optional[Tuple[datetime, int]],
+        limit: int = 5000
+    ) -> List[SolverFeatures]:
+        if after is None:
+            result = await self.session.execute(_FEATURES_FROM_START, {"b_limit": limit})
+        else:
+            updated_at, id = after
+            result = await self.session.execute(
+                _FEATURES_CHANGED, {"b_updated_at": updated_at, "b_id": id, "b_limit": limit}
+            )
+        rows = result.all()
+        return [SolverFeatures(*row) for row in rows]
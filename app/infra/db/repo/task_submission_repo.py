@@ -0,0 +1,128 @@
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import UUID, uuid7
+
+from sqlalchemy import bindparam, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.domain.project import ProjectStatus
+from app.domain.task_submission import SubmissionFile, TaskSubmission
+from app.ports.task_submission_ports import TaskSubmissionRepository
+from app.infra.db.models import (
+    BuyerTable,
+    ProjectTable,
+    SolverTable,
+    TaskSubmissionTable,
+    TaskTable,
+    UserTable,
+)
+from app.infra.db.partitioning import uuid_lookup
+
+_BuyerUser = aliased(UserTable)
+_SolverUser = aliased(UserTable)
+
+# Only the solver assigned to an in-progress project may upload to its tasks
+_UPLOAD_TASK_ID = (
+    select(TaskTable.id)
+    .join(ProjectTable, ProjectTable.id == TaskTable.project_id)
+    .join(SolverTable, SolverTable.id == ProjectTable.solver_id)
+    .join(UserTable, UserTable.id == SolverTable.user_id)
+    .where(
+        TaskTable.uuid == bindparam("b_task_uuid"),
+        TaskTable.deleted_at == None,
+        ProjectTable.project_status == ProjectStatus.IN_PROGRESS,
+        ProjectTable.deleted_at == None,
+        UserTable.uuid == bindparam("b_user_uuid")
+    )
+)
+# Serialises version numbering per task; uploads to other tasks are not blocked
+_LOCK_TASK = select(TaskTable.id).where(TaskTable.id == bindparam("b_task_id")).with_for_update()
+_LATEST = (
+    select(TaskSubmissionTable)
+    .where(TaskSubmissionTable.task_id == bindparam("b_task_id"))
+    .order_by(TaskSubmissionTable.version.desc())
+    .limit(1)
+)
+_INSERT = (
+    insert(TaskSubmissionTable)
+    .values(
+        task_id=bindparam("b_task_id"),
+        file_path=bindparam("b_file_path"),
+        version=bindparam("b_version"),
+        uuid=bindparam("b_uuid"),
+        created_at=bindparam("b_created_at")
+    )
+    .returning(TaskSubmissionTable)
+)
+
+
+class AlchemyTaskSubmissionRepository(TaskSubmissionRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    def _to_domain(self, row: TaskSubmissionTable) -> TaskSubmission:
+        return TaskSubmission(
+            id=row.id,
+            task_id=row.task_id,
+            file_path=row.file_path,
+            version=row.version,
+            uuid=row.uuid,
+            buyer_feedback=row.buyer_feedback,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            deleted_at=row.deleted_at
+        )
+
+    async def resolve_upload_task(self, task_id: UUID, solver_user_id: UUID) -> Optional[int]:
+        task_pk = await self.session.scalar(
+            _UPLOAD_TASK_ID, {"b_task_uuid": task_id, "b_user_uuid": solver_user_id}
+        )
+        # Hand the connection back to the pool before the body streams in
+        await self.session.rollback()
+        return task_pk
+
+    async def create_version(self, task_pk: int, file_path: str) -> TaskSubmission:
+        await self.session.execute(_LOCK_TASK, {"b_task_id": task_pk})
+        latest = (await self.session.execute(_LATEST, {"b_task_id": task_pk})).scalar_one_or_none()
+        if latest is not None and latest.deleted_at is None and latest.file_path == file_path:
+            # Same bytes as the current version: a retried or repeated upload
+            submission = self._to_domain(latest)
+            await self.session.rollback()
+            return submission
+
+        result = await self.session.execute(_INSERT, {
+            "b_task_id": task_pk,
+            "b_file_path": file_path,
+            "b_version": latest.version + 1 if latest is not None else 1,
+            "b_uuid": uuid7(),
+            "b_created_at": datetime.now(timezone.utc),
+        })
+        submission = self._to_domain(result.scalar_one())
+        await self.session.commit()
+        return submission
+
+    async def get_submission_file(self, task_id: UUID, submission_id: UUID) -> Optional[SubmissionFile]:
+        stmt = (
+            select(TaskSubmissionTable, _BuyerUser.uuid, _SolverUser.uuid)
+            .join(TaskTable, TaskTable.id == TaskSubmissionTable.task_id)
+            .join(ProjectTable, ProjectTable.id == TaskTable.project_id)
+            .join(BuyerTable, BuyerTable.id == ProjectTable.buyer_id)
+            .join(_BuyerUser, _BuyerUser.id == BuyerTable.user_id)
+            .outerjoin(SolverTable, SolverTable.id == ProjectTable.solver_id)
+            .outerjoin(_SolverUser, _SolverUser.id == SolverTable.user_id)
+            .where(
+                *uuid_lookup(TaskSubmissionTable, submission_id),
+                TaskSubmissionTable.deleted_at == None,
+                TaskTable.uuid == task_id,
+                TaskTable.deleted_at == None
+            )
+        )
+        row = (await self.session.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        return SubmissionFile(
+            submission=self._to_domain(row[0]),
+            buyer_user_uuid=row[1],
+            solver_user_uuid=row[2]
+        )
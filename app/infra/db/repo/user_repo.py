@@ -1,12 +1,94 @@
 from datetime import datetime, timezone
-from typing import Optional, List, Tuple
+from typing import Optional, List, Set, Tuple
 from uuid import UUID
-from sqlalchemy import  select, func, update, delete 
+from sqlalchemy import  select, func, update, delete, or_, bindparam, any_, String
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domain.user import User, UserRole, UserStatus
+from app.domain.event import USER_CREATED, USER_DELETED, USER_UPDATED, DomainEvent, user_event
+from app.domain.user import User, UserBatch, UserPage, UserRole, UserRowPage, UserStatus
 from app.ports.user_ports import UserRepository
 from app.infra.db.models import UserTable
+from app.infra.db.outbox import stage_events
+from app.infra.db.pagination import decode_cursor, encode_cursor
+from app.infra.db.routing import READ_REPLICA
+from app.infra.timing import timed
+
+# Hot-path statements are built once at import and parameterized with bindparam().
+# A reused statement object memoizes its cache key, so each execution skips
+# construction and key generation and hits SQLAlchemy's compiled cache directly;
+# the identical SQL text then reuses asyncpg's per-connection prepared statement.
+# Bind names must not clash with column names used in SET clauses.
+#
+# Listings are marked READ_REPLICA. Point lookups stay on the primary: their
+# results fill the shared user cache, feed read-modify-write updates and answer
+# logins straight after signup, where replica lag would show.
+_GET_BY_UUID = select(UserTable).where(
+    UserTable.uuid == bindparam("b_uuid"), UserTable.deleted_at == None
+)
+_GET_BY_EMAIL = select(UserTable).where(
+    UserTable.email == bindparam("b_email"), UserTable.deleted_at == None
+)
+_GET_BY_USERNAME = select(UserTable).where(
+    UserTable.user_name == bindparam("b_user_name"), UserTable.deleted_at == None
+)
+# = ANY(array) keeps one SQL text (and one prepared statement) for every batch size
+_FIND_TAKEN = select(UserTable.email, UserTable.user_name).where(
+    or_(
+        UserTable.email == any_(bindparam("b_emails", type_=ARRAY(String))),
+        UserTable.user_name == any_(bindparam("b_user_names", type_=ARRAY(String)))
+    )
+)
+_UPDATE = (
+    update(UserTable)
+    .where(UserTable.uuid == bindparam("b_uuid"))
+    .values(
+        user_name=bindparam("b_user_name"),
+        email=bindparam("b_email"),
+        phone=bindparam("b_phone"),
+        user_role=bindparam("b_user_role"),
+        user_status=bindparam("b_user_status"),
+        updated_at=bindparam("b_updated_at")
+    )
+    .returning(UserTable)
+)
+_SOFT_DELETE = (
+    update(UserTable)
+    .where(UserTable.uuid == bindparam("b_uuid"))
+    .values(deleted_at=bindparam("b_deleted_at"))
+)
+_PRUNE = delete(UserTable).where(UserTable.uuid == bindparam("b_uuid"))
+# Columns exposed by the public user contract (UserResponse), in its field order
+_PUBLIC_COLUMNS = (
+    UserTable.uuid,
+    UserTable.email,
+    UserTable.user_name,
+    UserTable.user_role,
+    UserTable.user_status,
+    UserTable.created_at,
+    UserTable.updated_at,
+    UserTable.deleted_at,
+)
+# Every column in User field order, for hydrating a UserBatch without ORM entities
+_DOMAIN_COLUMNS = (
+    UserTable.id,
+    UserTable.user_name,
+    UserTable.email,
+    UserTable.phone,
+    UserTable.hashed_password,
+    UserTable.user_status,
+    UserTable.user_role,
+    UserTable.uuid,
+    UserTable.created_at,
+    UserTable.updated_at,
+    UserTable.deleted_at,
+)
+_CREATE_MANY = (
+    pg_insert(UserTable)
+    .on_conflict_do_nothing()
+    .returning(UserTable)
+)
+
 
 class AlchemyUserRepository(UserRepository):
     def __init__(self, session: AsyncSession):
@@ -38,47 +120,88 @@ class AlchemyUserRepository(UserRepository):
             uuid=user.uuid
         )
         self.session.add(db_user)
-        await self.session.commit()
-        await self.session.refresh(db_user)
+        with timed("db.commit"):
+            await stage_events(self.session, [user_event(USER_CREATED, user)])
+            await self.session.commit()
+        with timed("db.refresh"):
+            await self.session.refresh(db_user)
         await self.session.flush()
         return self._to_domain(db_user)
 
+    async def create_many(self, users: List[User]) -> List[User]:
+        if not users:
+            return []
+        # ORM bulk insert: SQLAlchemy renders this as multi-row
+        # INSERT ... VALUES (...), (...) RETURNING, one round trip per page
+        params = [
+            {
+                "user_name": user.user_name,
+                "email": user.email,
+                "phone": user.phone,
+                "hashed_password": user.password,
+                "user_role": user.user_role,
+                "user_status": user.user_status,
+                "uuid": user.uuid,
+            }
+            for user in users
+        ]
+        result = await self.session.execute(_CREATE_MANY, params)
+        created = [self._to_domain(row) for row in result.scalars().all()]
+        # Only rows that survived ON CONFLICT DO NOTHING get an event
+        await stage_events(self.session, [user_event(USER_CREATED, user) for user in created])
+        await self.session.commit()
+        return created
+
     async def update(self, user: User) -> User:
-        stmt = (
-            update(UserTable)
-            .where(UserTable.uuid == user.uuid)
-            .values(
-                user_name=user.user_name,
-                email=user.email,
-                phone=user.phone,
-                user_role=user.user_role,
-                user_status=user.user_status,
-                updated_at=datetime.now(timezone.utc)
-            )
-            .returning(UserTable)
-        )
-        result = await self.session.execute(stmt)
-        row = result.scalar_one()
-        return self._to_domain(row)
+        result = await self.session.execute(_UPDATE, {
+            "b_uuid": user.uuid,
+            "b_user_name": user.user_name,
+            "b_email": user.email,
+            "b_phone": user.phone,
+            "b_user_role": user.user_role,
+            "b_user_status": user.user_status,
+            "b_updated_at": datetime.now(timezone.utc)
+        })
+        updated = self._to_domain(result.scalar_one())
+        await stage_events(self.session, [user_event(USER_UPDATED, updated)])
+        await self.session.commit()
+        return updated
 
     async def get_by_id_or_uuid(self, id: UUID) -> Optional[User]:
-        query = select(UserTable).where(UserTable.uuid == id, UserTable.deleted_at == None)
-        result = await self.session.execute(query)
+        with timed("db.lookup"):
+            result = await self.session.execute(_GET_BY_UUID, {"b_uuid": id})
         row = result.scalar_one_or_none()
         return self._to_domain(row) if row else None
 
     async def get_by_email(self, email: str) -> Optional[User]:
-        query = select(UserTable).where(UserTable.email == email, UserTable.deleted_at == None)
-        result = await self.session.execute(query)
+        with timed("db.lookup"):
+            result = await self.session.execute(_GET_BY_EMAIL, {"b_email": email})
         row = result.scalar_one_or_none()
         return self._to_domain(row) if row else None
 
     async def get_by_username(self, username: str) -> Optional[User]:
-        query = select(UserTable).where(UserTable.user_name == username, UserTable.deleted_at == None)
-        result = await self.session.execute(query)
+        with timed("db.lookup"):
+            result = await self.session.execute(_GET_BY_USERNAME, {"b_user_name": username})
         row = result.scalar_one_or_none()
         return self._to_domain(row) if row else None
 
+    async def find_taken(self, emails: List[str], user_names: List[str]) -> Tuple[Set[str], Set[str]]:
+        if not emails and not user_names:
+            return set(), set()
+        # No deleted_at filter: the unique constraints cover soft-deleted rows too
+        result = await self.session.execute(
+            _FIND_TAKEN, {"b_emails": list(emails), "b_user_names": list(user_names)}
+        )
+        wanted_emails, wanted_names = set(emails), set(user_names)
+        taken_emails: Set[str] = set()
+        taken_names: Set[str] = set()
+        for email, user_name in result.all():
+            if email in wanted_emails:
+                taken_emails.add(email)
+            if user_name in wanted_names:
+                taken_names.add(user_name)
+        return taken_emails, taken_names
+
     async def list_users(
         self, 
         skip: int = 0, 
@@ -90,25 +213,105 @@ class AlchemyUserRepository(UserRepository):
         if role: filters.append(UserTable.user_role == role)
         if status: filters.append(UserTable.user_status == status)
 
-        count_query = select(func.count()).select_from(UserTable).where(*filters)
+        count_query = (
+            select(func.count()).select_from(UserTable).where(*filters)
+            .execution_options(**READ_REPLICA)
+        )
         total_count = (await self.session.execute(count_query)).scalar() or 0
 
-        data_query = select(UserTable).where(*filters).offset(skip).limit(limit).order_by(UserTable.id.desc())
+        data_query = (
+            select(UserTable).where(*filters).offset(skip).limit(limit).order_by(UserTable.id.desc())
+            .execution_options(**READ_REPLICA)
+        )
         result = await self.session.execute(data_query)
         users = [self._to_domain(row) for row in result.scalars().all()]
 
         return users, total_count
 
+    async def _page(
+        self,
+        columns: tuple,
+        limit: int,
+        cursor: Optional[str],
+        role: Optional[UserRole],
+        status: Optional[UserStatus],
+        with_total: bool
+    ) -> Tuple[list, Optional[str], Optional[int]]:
+        """Shared keyset query; returns (rows, next_cursor, total). Rows keep the selected shape."""
+        filters = [UserTable.deleted_at == None]
+        if role: filters.append(UserTable.user_role == role)
+        if status: filters.append(UserTable.user_status == status)
+
+        total_count = None
+        if with_total:
+            count_query = (
+                select(func.count()).select_from(UserTable).where(*filters)
+                .execution_options(**READ_REPLICA)
+            )
+            total_count = (await self.session.execute(count_query)).scalar() or 0
+
+        # UUIDv7 is time-ordered, so uuid DESC is newest first and is served
+        # by ix_users_live_uuid without exposing the internal id in cursors
+        if cursor:
+            (last_uuid,) = decode_cursor(cursor, 1)
+            filters.append(UserTable.uuid < UUID(str(last_uuid)))
+
+        data_query = (
+            select(*columns).where(*filters).order_by(UserTable.uuid.desc()).limit(limit + 1)
+            .execution_options(**READ_REPLICA)
+        )
+        rows = (await self.session.execute(data_query)).all()
+
+        next_cursor = encode_cursor(rows[limit - 1].uuid) if len(rows) > limit else None
+        return rows[:limit], next_cursor, total_count
+
+    async def list_users_page(
+        self,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        role: Optional[UserRole] = None,
+        status: Optional[UserStatus] = None,
+        with_total: bool = False
+    ) -> UserPage:
+        # Column tuples into a columnar batch: no ORM instance state per row
+        rows, next_cursor, total_count = await self._page(
+            _DOMAIN_COLUMNS, limit, cursor, role, status, with_total
+        )
+        return UserPage(
+            items=UserBatch.from_rows(rows),
+            next_cursor=next_cursor,
+            total=total_count
+        )
+
+    async def list_users_page_rows(
+        self,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        role: Optional[UserRole] = None,
+        status: Optional[UserStatus] = None,
+        with_total: bool = False
+    ) -> UserRowPage:
+        # Plain column tuples: no ORM identity map, no entity, no domain object
+        rows, next_cursor, total_count = await self._page(
+            _PUBLIC_COLUMNS, limit, cursor, role, status, with_total
+        )
+        return UserRowPage(
+            items=[row._asdict() for row in rows],
+            next_cursor=next_cursor,
+            total=total_count
+        )
+
     async def soft_delete(self, id: UUID) -> bool:
-        query = (
-            update(UserTable)
-            .where(UserTable.uuid == id)
-            .values(deleted_at=datetime.now(timezone.utc))
+        result = await self.session.execute(
+            _SOFT_DELETE, {"b_uuid": id, "b_deleted_at": datetime.now(timezone.utc)}
         )
-        result = await self.session.execute(query)
-        return (getattr(result, "rowcount", 0)) > 0
+        deleted = (getattr(result, "rowcount", 0)) > 0
+        if deleted:
+            await stage_events(self.session, [DomainEvent(USER_DELETED, {"user_uuid": str(id)})])
+        await self.session.commit()
+        return deleted
 
     async def prune(self, id: UUID) -> bool:
-        query = delete(UserTable).where(UserTable.uuid == id)
-        result = await self.session.execute(query)
+        result = await self.session.execute(_PRUNE, {"b_uuid": id})
+        await self.session.commit()
         return (getattr(result, "rowcount", 0)) > 0
@@ -0,0 +1,119 @@
+import itertools
+from typing import Any, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.base import Executable
+
+from app.infra.db.pool import pool_stats
+
+# Statement option marking a read that may be served by a replica:
+#   select(...).execution_options(**READ_REPLICA)
+READ_REPLICA = {"read_replica": True}
+
+# 0 on a primary, or on a standby that has replayed everything it received;
+# otherwise the age of the last replayed transaction
+_LAG = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+
+class ReplicaLagError(RuntimeError):
+    pass
+
+
+class ReplicaSet:
+    """
+    Read replicas and their availability. pick() sends each read to the
+    available replica with the fewest checked-out connections, round-robin
+    among ties; with none available it returns None and the read goes to the
+    primary. Availability is set by probe(), which the health prober runs.
+    """
+    def __init__(self, engines: List[AsyncEngine], max_lag: float = 5.0):
+        self.engines = engines
+        self.max_lag = max_lag
+        self.available = [True] * len(engines)  # Optimistic until the first probe
+        self.lag: List[Optional[float]] = [None] * len(engines)
+        self.reads = [0] * len(engines)
+        self.fallbacks = 0  # Replica reads sent to the primary: none available
+        self._turn = itertools.count()
+
+    def pick(self) -> Optional[AsyncEngine]:
+        candidates = [i for i, ok in enumerate(self.available) if ok]
+        if not candidates:
+            self.fallbacks += 1
+            return None
+        start = next(self._turn)
+        # Rotate before min() so equally busy replicas take turns
+        rotated = candidates[start % len(candidates):] + candidates[:start % len(candidates)]
+        index = min(rotated, key=lambda i: self.engines[i].pool.checkedout())
+        self.reads[index] += 1
+        return self.engines[index]
+
+    async def probe(self, index: int) -> None:
+        """Check one replica is reachable and caught up; raises (and takes it out of rotation) if not."""
+        try:
+            async with self.engines[index].connect() as conn:
+                lag = float((await conn.execute(_LAG)).scalar_one())
+            self.lag[index] = lag
+            if lag > self.max_lag:
+                raise ReplicaLagError(f"replica lag {lag:.1f}s exceeds {self.max_lag}s")
+        except BaseException:
+            # Including the prober's timeout cancelling us mid-query
+            self.available[index] = False
+            raise
+        self.available[index] = True
+
+    async def dispose(self) -> None:
+        for engine in self.engines:
+            await engine.dispose()
+
+    def stats(self) -> dict:
+        return {
+            "replicas": [
+                {
+                    "name": engine.pool._orig_logging_name,
+                    "available": self.available[i],
+                    "lag_seconds": self.lag[i],
+                    "reads": self.reads[i],
+                    "pool": pool_stats(engine.pool),
+                }
+                for i, engine in enumerate(self.engines)
+            ],
+            "fallbacks": self.fallbacks,
+        }
+
+
+class RoutingSession(Session):
+    """
+    Session that sends statements marked READ_REPLICA to a replica and
+    everything else to the primary.
+
+    Once the session writes (flushes, or runs an INSERT/UPDATE/DELETE) it
+    stays on the primary for the rest of its life, so it reads its own
+    writes. A request uses one session (get_db), so this holds per request.
+    A session bound explicitly (bind=conn) is never routed.
+    """
+    def __init__(self, *args: Any, primary: AsyncEngine, replicas: ReplicaSet, **kw: Any):
+        super().__init__(*args, **kw)
+        self.primary = primary.sync_engine
+        self.replicas = replicas
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kw: Any) -> Any:
+        if self.bind is not None:
+            return self.bind
+        if self._flushing or (clause is not None and clause.is_dml):
+            self.info["wrote"] = True
+        elif (
+            not self.info.get("wrote")
+            and isinstance(clause, Executable)
+            and clause.get_execution_options().get("read_replica")
+        ):
+            replica = self.replicas.pick()
+            if replica is not None:
+                return replica.sync_engine
+        return self.primary
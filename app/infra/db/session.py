@@ -1,29 +1,125 @@
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.orm import DeclarativeBase, declared_attr
 from app.settings import settings
-from sqlalchemy import text
-from sqlalchemy import DateTime, func
+from app.infra.db.pool import InstrumentedAsyncQueuePool
+from app.infra.db.instrumentation import sql_instrumentation
+from app.infra.db.routing import ReplicaSet, RoutingSession
+from sqlalchemy import text, make_url
+from sqlalchemy import DateTime, Index, func
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Any, Optional
 from uuid import UUID
 import uuid_utils
 
 
 
-# Use the pre-computed URL from settings class
-engine = create_async_engine(
-    settings.ASYNC_DATABASE_URL, 
-    echo=settings.DEBUG  # Only log SQL in debug mode
-)
+# Built on first use (normally by the app lifespan), not at import: importing
+# models or repositories must not construct a pool or load the driver
+_engine: Optional[AsyncEngine] = None
+_session_maker: Optional[async_sessionmaker[AsyncSession]] = None
+_replicas: Optional[ReplicaSet] = None
 
-async_session_factory = async_sessionmaker(
-    bind=engine,
-    autocommit=False,
-    autoflush=False,
-    expire_on_commit=False,
-    class_=AsyncSession  # Explicitly tell it to use AsyncSession
-)
+
+def _database_url(url: Optional[str] = None):
+    # Use the pre-computed URL from settings class
+    return make_url(url or settings.ASYNC_DATABASE_URL).update_query_dict({
+        "prepared_statement_cache_size": str(settings.DB_PREPARED_STATEMENT_CACHE_SIZE)
+    })
+
+
+def _create_engine(url: Optional[str] = None, name: str = "primary", pool_size: Optional[int] = None) -> AsyncEngine:
+    engine = create_async_engine(
+        _database_url(url),
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+        echo=settings.DEBUG,  # Only log SQL in debug mode
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_logging_name=name,
+        pool_size=pool_size or settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING
+    )
+    if settings.SQL_INSTRUMENTATION_ENABLED:
+        sql_instrumentation.install(engine)
+    return engine
+
+
+def create_probe_engine() -> AsyncEngine:
+    """
+    One-connection engine for health probes. Kept apart from the main pool so a
+    probe neither takes a request's connection nor queues behind an exhausted pool.
+    """
+    return create_async_engine(
+        _database_url(),
+        pool_logging_name="probe",
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=settings.HEALTH_PROBE_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=False  # The probe is the ping
+    )
+
+
+def get_engine() -> AsyncEngine:
+    """The process-wide (primary) engine, created on first call with the replicas."""
+    global _engine, _session_maker, _replicas
+    if _engine is None:
+        _engine = _create_engine()
+        if settings.DB_REPLICA_URLS:
+            _replicas = ReplicaSet(
+                [
+                    _create_engine(url, f"replica{i}", settings.DB_REPLICA_POOL_SIZE)
+                    for i, url in enumerate(settings.DB_REPLICA_URLS)
+                ],
+                max_lag=settings.DB_REPLICA_MAX_LAG_SECONDS
+            )
+            # Unbound: RoutingSession.get_bind picks the engine per statement
+            _session_maker = async_sessionmaker(
+                sync_session_class=RoutingSession,
+                primary=_engine,
+                replicas=_replicas,
+                autocommit=False,
+                autoflush=False,
+                expire_on_commit=False,
+                class_=AsyncSession
+            )
+        else:
+            _session_maker = async_sessionmaker(
+                bind=_engine,
+                autocommit=False,
+                autoflush=False,
+                expire_on_commit=False,
+                class_=AsyncSession  # Explicitly tell it to use AsyncSession
+            )
+    return _engine
+
+
+def get_replicas() -> Optional[ReplicaSet]:
+    """The read replicas, or None when DB_REPLICA_URLS is empty."""
+    get_engine()
+    return _replicas
+
+
+def async_session_factory(**kw: Any) -> AsyncSession:
+    """New session on the process-wide engine; kw as for async_sessionmaker (e.g. bind=)."""
+    get_engine()
+    return _session_maker(**kw)
+
+
+async def dispose_engine() -> None:
+    """Close every pooled connection; the next get_engine() starts a fresh engine."""
+    global _engine, _session_maker, _replicas
+    if _engine is not None:
+        await sql_instrumentation.close()
+        await _engine.dispose()
+        if _replicas is not None:
+            await _replicas.dispose()
+        _engine = None
+        _session_maker = None
+        _replicas = None
 
 class Base(DeclarativeBase):
     """Base class for SQLAlchemy models"""
@@ -57,14 +153,49 @@ class CommonMixin:
         onupdate=func.now()
     )
 
-    # Soft Delete - Indexed 
+    # Soft Delete - not indexed on its own: "IS NULL" matches almost every row.
+    # Live-only reads get partial indexes (WHERE deleted_at IS NULL) per table
     deleted_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), 
-        index=True, 
         nullable=True
     )
 
 
+class TimePartitionedMixin(CommonMixin):
+    """
+    CommonMixin for tables range-partitioned on created_at (pg_partman, see
+    migration c7a31f5e9d48). Postgres requires the partition key in every
+    unique constraint, so the primary key is (id, created_at) and uuid is
+    unique together with created_at.
+
+    created_at is stamped client-side, from the same clock as the uuid7, so
+    lookups by uuid can be narrowed to one partition (app.infra.db.partitioning).
+    """
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+
+    uuid: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        nullable=False,
+        default=uuid_utils.uuid7,
+        server_default=func.gen_random_uuid()
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        primary_key=True,
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now()
+    )
+
+    @declared_attr.directive
+    def __table_args__(cls):
+        return (
+            Index(f"ix_{cls.__tablename__}_uuid", "uuid", "created_at", unique=True),
+            {"postgresql_partition_by": "RANGE (created_at)"},
+        )
+
+
 async def get_db():
     """Dependency for FastAPI routes to inject a database session"""
     async with async_session_factory() as session:
@@ -77,7 +208,7 @@ async def get_db():
 async def ping_database() -> bool:
     """Verifies the DB connection."""
     try:
-        async with engine.connect() as conn:
+        async with get_engine().connect() as conn:
             await conn.execute(text("SELECT 1"))
             return True
     except Exception as e:
@@ -0,0 +1,63 @@
+import asyncio
+import logging
+from typing import Any, List, Tuple
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.infra.db.repo import project_repo, proposal_repo, user_repo
+from app.infra.db.session import async_session_factory
+
+logger = logging.getLogger(__name__)
+
+# A uuid no row has: warmup lookups must not read or lock real data
+_NO_ROW = UUID(int=0)
+
+# Read-only statements on the request hot path, run through a Session like the
+# repositories do so both SQLAlchemy's compiled cache and asyncpg's per-connection
+# prepared statements are filled
+HOT_STATEMENTS: List[Tuple[Any, dict]] = [
+    (text("SELECT 1"), {}),
+    (user_repo._GET_BY_UUID, {"b_uuid": _NO_ROW}),
+    (user_repo._GET_BY_EMAIL, {"b_email": ""}),
+    (user_repo._GET_BY_USERNAME, {"b_user_name": ""}),
+    (project_repo._GET_BY_UUID, {"b_uuid": _NO_ROW}),
+    (proposal_repo._RESOLVE_IDS, {"b_project_uuid": _NO_ROW, "b_user_uuid": _NO_ROW}),
+    (proposal_repo._PROJECT_ID, {"b_project_uuid": _NO_ROW}),
+]
+
+
+async def _open(engine: AsyncEngine) -> AsyncConnection:
+    conn = engine.connect()
+    await conn.start()
+    return conn
+
+
+async def _prepare(conn: AsyncConnection) -> None:
+    async with async_session_factory(bind=conn) as session:
+        for statement, params in HOT_STATEMENTS:
+            await session.execute(statement, params)
+        await session.rollback()
+
+
+async def warm_pool(engine: AsyncEngine, connections: int) -> int:
+    """
+    Open `connections` pool connections at once and prepare the hot statements
+    on each, then hand them back to the pool. Capped at the pool size: overflow
+    connections would be closed again on check-in. Returns how many were warmed.
+    """
+    connections = min(connections, engine.pool.size())
+    results = await asyncio.gather(*(_open(engine) for _ in range(connections)), return_exceptions=True)
+    opened = [conn for conn in results if isinstance(conn, AsyncConnection)]
+    try:
+        # All held together so each one is a distinct connection
+        await asyncio.gather(*(_prepare(conn) for conn in opened))
+    finally:
+        for conn in opened:
+            await conn.close()
+
+    failed = len(results) - len(opened)
+    if failed:
+        logger.warning("pool warmup: %d of %d connections failed to open", failed, connections)
+    return len(opened)
@@ -0,0 +1,40 @@
+from typing import Callable, List, Optional, Sequence
+
+from app.domain.event import DomainEvent
+from app.ports.event_ports import EventPublisher
+
+
+class InMemoryPublisher(EventPublisher):
+    """
+    Stand-in for JetStream in development and tests. Keeps every acked event
+    in order and, like the stream's duplicate window, drops repeated event ids.
+    `fail` decides per event whether its publish should be rejected.
+    """
+    def __init__(self, fail: Optional[Callable[[DomainEvent], bool]] = None):
+        self.fail = fail
+        self.events: List[DomainEvent] = []
+        self.duplicates = 0
+        self._seen: set = set()
+
+    async def start(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    async def ping(self, timeout: float) -> None:
+        pass
+
+    async def publish_many(self, events: Sequence[DomainEvent]) -> List[bool]:
+        acks = []
+        for event in events:
+            if self.fail is not None and self.fail(event):
+                acks.append(False)
+                continue
+            if event.event_id in self._seen:
+                self.duplicates += 1
+            else:
+                self._seen.add(event.event_id)
+                self.events.append(event)
+            acks.append(True)
+        return acks
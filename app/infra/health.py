@@ -0,0 +1,189 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infra.cache.redis import get_redis
+from app.infra.db.session import create_probe_engine, get_replicas
+from app.infra.jobs.outbox_relay import outbox_relay
+from app.infra.metrics import Histogram
+from app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class DependencyCheck:
+    """Latest result and recent history of one dependency's probe."""
+    def __init__(self, name: str, probe: Callable[[], Awaitable[Any]], critical: bool, history: int):
+        self.name = name
+        self.probe = probe
+        self.critical = critical
+
+        self.ok: Optional[bool] = None  # None until the first probe finishes
+        self.error: Optional[str] = None
+        self.checked_at: Optional[datetime] = None
+        self.latency = 0.0
+        self.consecutive_failures = 0
+        self.history: Deque[tuple[datetime, bool, float]] = deque(maxlen=history)
+        self.latency_histogram = Histogram()
+
+    def record(self, ok: bool, latency: float, error: Optional[str]) -> None:
+        self.ok = ok
+        self.error = error
+        self.checked_at = datetime.now(timezone.utc)
+        self.latency = latency
+        self.consecutive_failures = 0 if ok else self.consecutive_failures + 1
+        self.history.append((self.checked_at, ok, latency))
+        self.latency_histogram.observe(latency)
+
+    def stats(self) -> dict:
+        return {
+            "ok": self.ok,
+            "critical": self.critical,
+            "error": self.error,
+            "checked_at": self.checked_at.isoformat() if self.checked_at else None,
+            "latency_ms": round(self.latency * 1000, 2),
+            "consecutive_failures": self.consecutive_failures,
+            "history": [
+                {"at": at.isoformat(), "ok": ok, "latency_ms": round(latency * 1000, 2)}
+                for at, ok, latency in self.history
+            ],
+            "latency_seconds": self.latency_histogram.snapshot(),
+        }
+
+
+class HealthProber:
+    """
+    Probes each dependency on an interval, concurrently and under a timeout,
+    and keeps the results. Health endpoints read the cached state, so load
+    balancer probes cost no I/O however often they arrive, and a hung
+    dependency shows up as a timed-out probe rather than a hung endpoint.
+
+    Ready means every critical dependency answered its last probe; the others
+    only mark the worker degraded.
+    """
+    def __init__(self, interval: float = 5.0, timeout: float = 2.0, history: int = 20):
+        self.interval = interval
+        self.timeout = timeout
+        self.history = history
+        self.checks: Dict[str, DependencyCheck] = {}
+        self.cycles = 0
+        self._last_cycle: Optional[float] = None
+
+    def add(self, name: str, probe: Callable[[], Awaitable[Any]], critical: bool = True) -> None:
+        self.checks[name] = DependencyCheck(name, probe, critical, self.history)
+
+    async def _run(self, check: DependencyCheck) -> None:
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(check.probe(), self.timeout)
+        except asyncio.TimeoutError:
+            check.record(False, time.perf_counter() - started, f"timed out after {self.timeout}s")
+        except Exception as e:
+            check.record(False, time.perf_counter() - started, repr(e)[:200])
+        else:
+            check.record(True, time.perf_counter() - started, None)
+
+    async def probe_once(self) -> None:
+        await asyncio.gather(*(self._run(check) for check in self.checks.values()))
+        self.cycles += 1
+        self._last_cycle = time.monotonic()
+
+    async def run(self) -> None:
+        """Probe until cancelled; starts with a wait if a cycle already ran."""
+        while True:
+            if self._last_cycle is not None:
+                await asyncio.sleep(self.interval)
+            try:
+                await self.probe_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("health probe cycle failed")
+
+    def is_ok(self, name: str) -> bool:
+        check = self.checks.get(name)
+        return check is not None and bool(check.ok)
+
+    def ready(self) -> bool:
+        return all(check.ok for check in self.checks.values() if check.critical)
+
+    def degraded(self) -> bool:
+        return any(not check.ok for check in self.checks.values())
+
+    def last_cycle_age(self) -> Optional[float]:
+        return None if self._last_cycle is None else time.monotonic() - self._last_cycle
+
+    def stalled(self) -> bool:
+        """The probe loop has stopped completing cycles (it died or the loop is starved)."""
+        age = self.last_cycle_age()
+        return age is not None and age > 3 * self.interval + self.timeout
+
+    def stats(self) -> dict:
+        age = self.last_cycle_age()
+        return {
+            "cycles": self.cycles,
+            "last_cycle_age_seconds": round(age, 3) if age is not None else None,
+            "checks": {name: check.stats() for name, check in self.checks.items()},
+        }
+
+
+_probe_engine: Optional[AsyncEngine] = None
+
+
+async def _probe_postgres() -> None:
+    global _probe_engine
+    if _probe_engine is None:
+        _probe_engine = create_probe_engine()
+    async with _probe_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def _probe_redis() -> None:
+    await get_redis().ping()
+
+
+async def _probe_nats() -> None:
+    await outbox_relay.publisher.ping(settings.HEALTH_PROBE_TIMEOUT_SECONDS)
+
+
+def _replica_probe(index: int) -> Callable[[], Awaitable[None]]:
+    async def probe() -> None:
+        # Through the replica's own pool: a failure also takes it out of rotation
+        await get_replicas().probe(index)
+    return probe
+
+
+async def close_probes() -> None:
+    global _probe_engine
+    if _probe_engine is not None:
+        await _probe_engine.dispose()
+        _probe_engine = None
+
+
+def _build_prober() -> HealthProber:
+    prober = HealthProber(
+        interval=settings.HEALTH_PROBE_INTERVAL_SECONDS,
+        timeout=settings.HEALTH_PROBE_TIMEOUT_SECONDS,
+        history=settings.HEALTH_PROBE_HISTORY
+    )
+    prober.add("postgres", _probe_postgres)
+    if (settings.USER_CACHE_ENABLED and settings.USER_CACHE_USE_REDIS) or settings.REVOCATION_ENABLED:
+        # The cache falls back to Postgres; a fail-closed revocation list rejects every token
+        prober.add("redis", _probe_redis, critical=settings.REVOCATION_ENABLED and settings.REVOCATION_FAIL_CLOSED)
+    if settings.EVENT_PUBLISHER == "nats" and settings.OUTBOX_RELAY_ENABLED:
+        # Events wait in the outbox while NATS is away
+        prober.add("nats", _probe_nats, critical=False)
+    for i in range(len(settings.DB_REPLICA_URLS)):
+        # Reads fall back to the primary while a replica is down or lagging
+        prober.add(f"replica{i}", _replica_probe(i), critical=False)
+    return prober
+
+
+# Process-wide singleton, run by the app lifespan
+health_prober = _build_prober()
@@ -0,0 +1,66 @@
+import asyncio
+import logging
+
+from sqlalchemy import func, select
+
+from app.infra.db.repo.counter_repo import AlchemyCounterRepository
+from app.infra.db.session import async_session_factory, get_engine
+
+logger = logging.getLogger(__name__)
+
+# pg advisory lock key: only one worker across the deployment reconciles at a time
+_LOCK_KEY = 0x636F756E  # "coun"
+
+# Last run, for /internal/metrics
+reconcile_stats: dict = {"runs": 0, "skipped": 0, "solvers_repaired": 0, "buyers_repaired": 0}
+
+
+async def reconcile_once(batch_size: int) -> dict:
+    """
+    One full pass over solvers and buyers, a short transaction per batch.
+    Returns repaired counts, or {} if another worker holds the lock.
+    """
+    async with get_engine().connect() as conn:
+        locked = await conn.scalar(select(func.pg_try_advisory_lock(_LOCK_KEY)))
+        await conn.commit()
+        if not locked:
+            reconcile_stats["skipped"] += 1
+            return {}
+        try:
+            # Bound to the locked connection so every batch runs under the lock
+            async with async_session_factory(bind=conn) as session:
+                repo = AlchemyCounterRepository(session)
+                repaired = {"solvers": 0, "buyers": 0}
+                for kind, step in (("solvers", repo.reconcile_solvers), ("buyers", repo.reconcile_buyers)):
+                    after = 0
+                    while True:
+                        last, fixed = await step(after, batch_size)
+                        repaired[kind] += fixed
+                        if last is None:
+                            break
+                        after = last
+        finally:
+            await conn.scalar(select(func.pg_advisory_unlock(_LOCK_KEY)))
+            await conn.commit()
+
+    reconcile_stats["runs"] += 1
+    reconcile_stats["solvers_repaired"] = repaired["solvers"]
+    reconcile_stats["buyers_repaired"] = repaired["buyers"]
+    return repaired
+
+
+async def run_counter_reconcile(interval: float, batch_size: int) -> None:
+    """
+    Periodically repair counter drift. Runs until cancelled.
+    Any repair is logged as a warning: it means some write path skipped the counters.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            repaired = await reconcile_once(batch_size)
+            if repaired.get("solvers") or repaired.get("buyers"):
+                logger.warning("counter drift repaired: %s", repaired)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("counter reconciliation failed")
@@ -0,0 +1,41 @@
+import asyncio
+import logging
+
+from app.infra.db.repo.project_repo import AlchemyProjectRepository
+from app.infra.db.repo.solver_repo import AlchemySolverRepository
+from app.infra.db.session import async_session_factory
+from app.services.matching_engine import SolverMatchingEngine
+from app.services.matching_service import MatchingServiceImpl
+
+logger = logging.getLogger(__name__)
+
+
+async def refresh_once(engine: SolverMatchingEngine, batch_size: int) -> int:
+    async with async_session_factory() as session:
+        service = MatchingServiceImpl(
+            engine,
+            AlchemySolverRepository(session),
+            AlchemyProjectRepository(session),
+            batch_size=batch_size
+        )
+        return await service.refresh()
+
+
+async def run_matching_refresh(engine: SolverMatchingEngine, interval: float, batch_size: int) -> None:
+    """
+    Keep the matching engine in step with the solvers table.
+    Runs until cancelled; a failed tick is logged and retried on the next one.
+    Starts with a wait if startup warmup already loaded the engine.
+    """
+    if engine.loaded:
+        await asyncio.sleep(interval)
+    while True:
+        try:
+            applied = await refresh_once(engine, batch_size)
+            if applied:
+                logger.debug("matching engine applied %d solver changes", applied)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("matching engine refresh failed")
+        await asyncio.sleep(interval)
@@ -0,0 +1,152 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+
+from app.domain.event import SUBJECT_PREFIX
+from app.infra.db.outbox import AlchemyOutboxRepository
+from app.infra.db.session import async_session_factory
+from app.infra.events.memory import InMemoryPublisher
+from app.infra.metrics import Histogram
+from app.ports.event_ports import EventPublisher
+from app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRelay:
+    """
+    Drains outbox_events into the publisher, one claimed batch per transaction.
+
+    Rows are claimed with FOR UPDATE SKIP LOCKED, so several workers can relay
+    side by side without publishing the same batch. Unacked events stay in the
+    outbox and are retried on the next pass, up to `max_attempts` publishes
+    each; then they are dead-lettered so one poisoned event cannot hold up the
+    queue. While passes fail, the poll delay doubles up to `max_backoff`.
+    Delivery is at-least-once; the event_id doubles as the broker's
+    de-duplication key.
+    """
+    def __init__(
+        self,
+        publisher: EventPublisher,
+        batch_size: int = 500,
+        poll_interval: float = 0.5,
+        max_backoff: float = 30.0,
+        max_attempts: int = 10,
+        retention: timedelta = timedelta(hours=72)
+    ):
+        self.publisher = publisher
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_backoff = max_backoff
+        self.max_attempts = max_attempts
+        self.retention = retention
+
+        self.published = 0
+        self.failed = 0
+        self.dead_lettered = 0
+        self.failing_passes = 0  # Consecutive; drives the backoff
+        self.batch_latency = Histogram()
+        self._last_prune = 0.0
+
+    async def drain_once(self) -> int:
+        """Publish one batch. Returns how many events were acknowledged."""
+        async with async_session_factory() as session:
+            repo = AlchemyOutboxRepository(session, self.max_attempts)
+            claimed = await repo.claim_batch(self.batch_size)
+            if not claimed:
+                await session.commit()
+                return 0
+
+            started = time.perf_counter()
+            error = ""
+            try:
+                acks = await self.publisher.publish_many([event for _, event in claimed])
+            except Exception as e:
+                acks = [False] * len(claimed)
+                error = repr(e)
+            self.batch_latency.observe(time.perf_counter() - started)
+
+            published = [id for (id, _), ok in zip(claimed, acks) if ok]
+            failed = [id for (id, _), ok in zip(claimed, acks) if not ok]
+            error = error or "publish not acknowledged"
+            dead_lettered = await repo.mark(published, failed, error)
+
+        self.published += len(published)
+        self.failed += len(failed)
+        if failed:
+            self.failing_passes += 1
+        if dead_lettered:
+            self.dead_lettered += dead_lettered
+            logger.error(
+                "outbox: dead-lettered %d event(s) after %d attempts: %s",
+                dead_lettered, self.max_attempts, error[:200]
+            )
+        return len(published)
+
+    async def _prune(self) -> None:
+        if time.monotonic() - self._last_prune < 3600:
+            return
+        self._last_prune = time.monotonic()
+        async with async_session_factory() as session:
+            await AlchemyOutboxRepository(session).prune_published(
+                datetime.now(timezone.utc) - self.retention
+            )
+
+    async def run(self) -> None:
+        """Relay until cancelled; reconnects to the bus after failures."""
+        while True:
+            failing = self.failing_passes
+            try:
+                await self.publisher.start()
+                # Keep draining while full batches go through, then poll
+                while await self.drain_once() >= self.batch_size:
+                    pass
+                await self._prune()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.failing_passes += 1
+                logger.exception("outbox relay pass failed")
+            if self.failing_passes == failing:
+                self.failing_passes = 0
+            await asyncio.sleep(self._delay())
+
+    def _delay(self) -> float:
+        if not self.failing_passes:
+            return self.poll_interval
+        return min(self.poll_interval * 2 ** min(self.failing_passes, 32), self.max_backoff)
+
+    def stats(self) -> dict:
+        return {
+            "published": self.published,
+            "failed": self.failed,
+            "dead_lettered": self.dead_lettered,
+            "failing_passes": self.failing_passes,
+            "batch_latency_seconds": self.batch_latency.snapshot(),
+        }
+
+
+def _build_publisher() -> EventPublisher:
+    if settings.EVENT_PUBLISHER == "memory":
+        return InMemoryPublisher()
+    # Imported here so the memory publisher works without nats-py installed
+    from app.infra.events.jetstream import JetStreamPublisher
+    return JetStreamPublisher(
+        url=settings.NATS_URL,
+        stream=settings.NATS_STREAM,
+        subjects=[f"{SUBJECT_PREFIX}.>"],
+        max_in_flight=settings.OUTBOX_MAX_IN_FLIGHT,
+        ack_timeout=settings.NATS_ACK_TIMEOUT_SECONDS
+    )
+
+
+# Process-wide singleton, run by the app lifespan
+outbox_relay = OutboxRelay(
+    _build_publisher(),
+    batch_size=settings.OUTBOX_BATCH_SIZE,
+    poll_interval=settings.OUTBOX_POLL_SECONDS,
+    max_backoff=settings.OUTBOX_MAX_BACKOFF_SECONDS,
+    max_attempts=settings.OUTBOX_MAX_ATTEMPTS,
+    retention=timedelta(hours=settings.OUTBOX_RETENTION_HOURS)
+)
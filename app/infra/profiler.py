@@ -0,0 +1,188 @@
+import asyncio
+import itertools
+import logging
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from types import FrameType
+from typing import Any, Dict, List, Optional
+
+from app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_MAX_DEPTH = 128
+
+
+def _frame_name(frame: FrameType) -> str:
+    return f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_qualname}"
+
+
+def _thread_stack(frame: Optional[FrameType]) -> List[str]:
+    stack: List[str] = []
+    while frame is not None and len(stack) < _MAX_DEPTH:
+        stack.append(_frame_name(frame))
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+def _await_chain(task: "asyncio.Task[Any]") -> List[str]:
+    """Coroutine frames from the task's entry point down to what it is awaiting now."""
+    stack: List[str] = []
+    awaitable: Any = task.get_coro()
+    while awaitable is not None and len(stack) < _MAX_DEPTH:
+        frame = getattr(awaitable, "cr_frame", None) or getattr(awaitable, "ag_frame", None) \
+            or getattr(awaitable, "gi_frame", None)
+        if frame is None:
+            # A Future or a C-level awaitable: the leaf of the chain
+            stack.append(type(awaitable).__name__)
+            break
+        stack.append(_frame_name(frame))
+        awaitable = getattr(awaitable, "cr_await", None) or getattr(awaitable, "ag_await", None) \
+            or getattr(awaitable, "gi_yieldfrom", None)
+    return stack
+
+
+class _Capture:
+    __slots__ = ("label", "started", "thread_id", "task", "samples")
+
+    def __init__(self, label: str, thread_id: int, task: Optional["asyncio.Task[Any]"]):
+        self.label = label
+        self.started = time.perf_counter()
+        self.thread_id = thread_id
+        self.task = task
+        self.samples: Counter[str] = Counter()
+
+
+class SlowRequestProfiler:
+    """
+    In-process sampling profiler for slow requests.
+
+    Every in-flight request is registered; a daemon thread wakes every
+    `interval` and samples only the requests already past `threshold`, so
+    fast requests cost one dict insert and delete. Each sample records two
+    stacks, as collapsed "a;b;c" lines:
+      loop;...   what the event loop thread is executing (CPU on the loop)
+      await;...  where this request's task is suspended (DB, hashing pool, ...)
+    On completion of a slow request the counts are written to `directory` in
+    the folded format flamegraph.pl and speedscope read. Captures are capped
+    at max_per_minute so a latency incident cannot fill the disk.
+    """
+    def __init__(
+        self,
+        directory: str,
+        threshold: float = 1.0,
+        interval: float = 0.005,
+        max_per_minute: int = 6
+    ):
+        self.directory = Path(directory)
+        self.threshold = threshold
+        self.interval = interval
+        self.max_per_minute = max_per_minute
+
+        self._active: Dict[int, _Capture] = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._written_at: List[float] = []
+
+        self.captured = 0
+        self.dropped = 0
+        self.samples = 0
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._sample_loop, name="slow-request-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def begin(self, label: str) -> int:
+        token = next(self._ids)
+        capture = _Capture(label, threading.get_ident(), asyncio.current_task())
+        with self._lock:
+            self._active[token] = capture
+        return token
+
+    async def end(self, token: int) -> Optional[Path]:
+        """Stop sampling this request; write its profile if it was slow. Returns the file, if any."""
+        with self._lock:
+            capture = self._active.pop(token, None)
+        if capture is None:
+            return None
+        elapsed = time.perf_counter() - capture.started
+        if elapsed < self.threshold or not capture.samples:
+            return None
+
+        now = time.monotonic()
+        self._written_at = [t for t in self._written_at if now - t < 60]
+        if len(self._written_at) >= self.max_per_minute:
+            self.dropped += 1
+            return None
+        self._written_at.append(now)
+        self.captured += 1
+        return await asyncio.to_thread(self._write, capture, elapsed)
+
+    def _sample_loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            # Held while sampling so end() never sees a capture still being written to
+            with self._lock:
+                due = [c for c in self._active.values() if now - c.started >= self.threshold]
+                if not due:
+                    continue
+                frames = sys._current_frames()
+                for capture in due:
+                    try:
+                        loop_stack = _thread_stack(frames.get(capture.thread_id))
+                        await_stack = _await_chain(capture.task) if capture.task is not None else []
+                    except (AttributeError, RuntimeError, ValueError):
+                        # The task moved on while being walked; skip this tick
+                        continue
+                    if loop_stack:
+                        capture.samples[";".join(["loop", *loop_stack])] += 1
+                    if await_stack:
+                        capture.samples[";".join(["await", *await_stack])] += 1
+                    self.samples += 1
+
+    def _write(self, capture: _Capture, elapsed: float) -> Path:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S.%f")
+        label = re.sub(r"[^A-Za-z0-9_.-]+", "_", capture.label).strip("_")[:80]
+        path = self.directory / f"{stamp}-{label}-{elapsed * 1000:.0f}ms.folded"
+        path.write_text("".join(f"{stack} {count}\n" for stack, count in capture.samples.most_common()))
+        logger.warning("slow request %s took %.0f ms; profile written to %s", capture.label, elapsed * 1000, path)
+        return path
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self._thread is not None,
+            "threshold_ms": self.threshold * 1000,
+            "interval_ms": self.interval * 1000,
+            "in_flight": len(self._active),
+            "captured": self.captured,
+            "dropped": self.dropped,
+            "samples": self.samples,
+        }
+
+
+# Process-wide singleton, started by the app lifespan
+slow_request_profiler = SlowRequestProfiler(
+    directory=settings.PROFILE_DIR,
+    threshold=settings.PROFILE_SLOW_REQUEST_MS / 1000,
+    interval=settings.PROFILE_SAMPLE_INTERVAL_MS / 1000,
+    max_per_minute=settings.PROFILE_MAX_PER_MINUTE
+)
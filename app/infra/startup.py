@@ -0,0 +1,39 @@
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class StartupPhases:
+    """
+    Wall-clock time of each named startup step, in order. Filled by the app
+    lifespan; read by /internal/metrics and the startup profile.
+    """
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: dict[str, float] = {}
+        self.ready_after: float | None = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = time.perf_counter() - started
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def ready(self) -> None:
+        """Mark the worker ready; total counts from process import of this module."""
+        self.ready_after = self.elapsed()
+
+    def stats(self) -> dict:
+        return {
+            "phases_ms": {name: round(seconds * 1000, 2) for name, seconds in self.phases.items()},
+            "ready_after_ms": round(self.ready_after * 1000, 2) if self.ready_after is not None else None,
+        }
+
+
+# Process-wide singleton; imported first by app.main so the clock covers imports
+startup_phases = StartupPhases()
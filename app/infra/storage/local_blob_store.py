@@ -0,0 +1,104 @@
+import asyncio
+import hashlib
+import os
+from pathlib import Path
+from typing import AsyncIterator
+from uuid import uuid4
+
+from app.domain.task_submission import StoredBlob
+from app.ports.storage_ports import BlobStore
+from app.settings import settings
+
+
+class BlobTooLargeError(ValueError):
+    """Raised when an upload stream goes past the allowed size."""
+    pass
+
+
+class LocalBlobStore(BlobStore):
+    """
+    Content-addressed blobs on local disk: sha256/ab/cd/<sha256>.
+
+    Uploads stream into a temp file under the same root while being hashed;
+    the finished file is renamed into its content address (atomic on one
+    filesystem), or discarded when that address already exists. Chunks are
+    coalesced up to write_buffer bytes and written + hashed in a worker
+    thread, so the event loop never does disk I/O and memory stays bounded
+    by the buffer.
+    """
+    def __init__(self, root: str, write_buffer: int = 1 << 20):
+        self.root = Path(root)
+        self.write_buffer = write_buffer
+        self._tmp = self.root / "tmp"
+
+    def _ensure_dirs(self) -> None:
+        self._tmp.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key_for(sha256: str) -> str:
+        return f"sha256/{sha256[:2]}/{sha256[2:4]}/{sha256}"
+
+    def path(self, key: str) -> Path:
+        path = (self.root / key).resolve()
+        if not path.is_relative_to(self.root.resolve()):
+            raise ValueError("Invalid blob key")
+        return path
+
+    @staticmethod
+    def _write(fd: int, hasher, data: bytes) -> None:
+        hasher.update(data)
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+
+    def _commit(self, fd: int, tmp_path: Path, key: str) -> None:
+        os.fsync(fd)
+        os.close(fd)
+        target = self.path(key)
+        if target.exists():
+            tmp_path.unlink()
+            return
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.chmod(tmp_path, 0o444)
+        os.replace(tmp_path, target)
+
+    async def put_stream(self, chunks: AsyncIterator[bytes], max_bytes: int) -> StoredBlob:
+        await asyncio.to_thread(self._ensure_dirs)
+        tmp_path = self._tmp / uuid4().hex
+        fd = await asyncio.to_thread(os.open, tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        hasher = hashlib.sha256()
+        size = 0
+        buffer = bytearray()
+        committed = False
+        try:
+            async for chunk in chunks:
+                size += len(chunk)
+                if size > max_bytes:
+                    raise BlobTooLargeError(f"Upload exceeds {max_bytes} bytes")
+                buffer += chunk
+                if len(buffer) >= self.write_buffer:
+                    await asyncio.to_thread(self._write, fd, hasher, bytes(buffer))
+                    buffer.clear()
+            if buffer:
+                await asyncio.to_thread(self._write, fd, hasher, bytes(buffer))
+
+            sha256 = hasher.hexdigest()
+            key = self.key_for(sha256)
+            await asyncio.to_thread(self._commit, fd, tmp_path, key)
+            committed = True
+            return StoredBlob(key=key, sha256=sha256, size=size)
+        finally:
+            if not committed:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+                tmp_path.unlink(missing_ok=True)
+
+
+# Process-wide singleton; the root is shared by every worker on the host
+blob_store = LocalBlobStore(
+    root=settings.BLOB_STORAGE_ROOT,
+    write_buffer=settings.UPLOAD_WRITE_BUFFER_BYTES
+)
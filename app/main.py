@@ -1,20 +1,48 @@
-from contextlib import asynccontextmanager
+from app.infra.startup import startup_phases  # First: the startup clock covers imports
+
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
 
 from app.settings import settings
-from app.infra.db.session import ping_database, engine
+from app.infra.db.session import dispose_engine, get_engine, get_replicas
+from app.infra.health import close_probes, health_prober
+from app.infra.profiler import slow_request_profiler
+from app.infra.db.instrumentation import sql_instrumentation
+from app.api.middleware import RequestTimingMiddleware
+from app.infra.db.warmup import warm_pool
+from app.secure.hash_pool import password_hasher
+from app.secure.jwt_tokens import token_service
+from app.infra.cache.redis import close_redis
+from app.infra.cache.revocation import revocation_list
+from app.infra.cache.user_cache import user_cache
+from app.infra.jobs.matching_refresh import refresh_once, run_matching_refresh
+from app.infra.jobs.counter_reconcile import run_counter_reconcile
+from app.infra.jobs.outbox_relay import outbox_relay
+from app.services.matching_engine import matching_engine
+
+from app.api.v1.endpoints import (
+    health_endpoint, auth_endpoint, user_endpoint, solver_endpoint, project_endpoint,
+    proposal_endpoint, task_submission_endpoint, internal_endpoint
+)
 
-from app.api.v1.endpoints import user_endpoint
+startup_phases.phases["imports"] = startup_phases.elapsed()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Manages the startup and shutdown of the application.
+    Nothing is served until this reaches `yield`, so everything a first request
+    would otherwise pay for (pool connects, prepares, schema builds) happens here.
     """
     print(f" Initializing {settings.PROJECT_NAME}...")
-    
-    # Use  infra helper
-    db_alive = await ping_database()
+
+    with startup_phases.phase("database"):
+        get_engine()
+    # First probe round before traffic, so readiness is known from the start
+    with startup_phases.phase("probes"):
+        await health_prober.probe_once()
+    db_alive = health_prober.is_ok("postgres")
     
     if db_alive:
         print("Postgres 17 connection established.")
@@ -22,13 +50,88 @@ async def lifespan(app: FastAPI):
         print("UNABLE TO REACH DATABASE. !!!")
         print("Check your .env credentials and ensure the Postgres container is running.")
 
+    # Spin up the hashing pool before traffic so signups never pay for it
+    with startup_phases.phase("hash_pool"):
+        password_hasher.start()
+
+    # Parse the ES256 keys once; requests only ever see key objects
+    with startup_phases.phase("auth_keys"):
+        try:
+            token_service.load()
+            print("Auth keys loaded.")
+        except (OSError, ValueError) as e:
+            print(f"AUTH KEYS NOT LOADED ({e}). Token endpoints will answer 503.")
+
+    # Subscribes to revocation deltas and builds the local Bloom filter
+    if settings.REVOCATION_ENABLED:
+        revocation_list.start()
+    # Drops this worker's copies of users written by any worker
+    if settings.USER_CACHE_ENABLED:
+        user_cache.start()
+
+    if settings.STARTUP_WARMUP_ENABLED:
+        if db_alive:
+            with startup_phases.phase("warmup.pool"):
+                warmed = await warm_pool(get_engine(), settings.DB_WARMUP_CONNECTIONS or settings.DB_POOL_SIZE)
+            print(f"Warmed {warmed} pool connections.")
+            # Matches answer 503 until the engine holds every solver
+            if settings.MATCHING_ENABLED:
+                with startup_phases.phase("warmup.matching"):
+                    try:
+                        loaded = await refresh_once(matching_engine, settings.MATCHING_REFRESH_BATCH)
+                        print(f"Matching engine loaded {loaded} solvers.")
+                    except Exception as e:
+                        print(f"MATCHING ENGINE NOT LOADED ({e!r}). The refresh loop will retry.")
+        replicas = get_replicas()
+        if replicas is not None:
+            with startup_phases.phase("warmup.replicas"):
+                for engine, available in zip(replicas.engines, replicas.available):
+                    if available:
+                        await warm_pool(engine, settings.DB_WARMUP_CONNECTIONS or engine.pool.size())
+        # OpenAPI and its JSON schemas are otherwise built by the first /docs or /openapi.json hit
+        with startup_phases.phase("warmup.openapi"):
+            app.openapi()
+
+    if settings.PROFILE_SLOW_REQUESTS:
+        slow_request_profiler.start()
+
+    background_tasks = [asyncio.create_task(health_prober.run())]
+    if settings.MATCHING_ENABLED:
+        background_tasks.append(asyncio.create_task(run_matching_refresh(
+            matching_engine,
+            settings.MATCHING_REFRESH_SECONDS,
+            settings.MATCHING_REFRESH_BATCH
+        )))
+    if settings.COUNTER_RECONCILE_ENABLED:
+        background_tasks.append(asyncio.create_task(run_counter_reconcile(
+            settings.COUNTER_RECONCILE_SECONDS,
+            settings.COUNTER_RECONCILE_BATCH
+        )))
+    if settings.OUTBOX_RELAY_ENABLED:
+        background_tasks.append(asyncio.create_task(outbox_relay.run()))
+
+    startup_phases.ready()
+    print(f"Ready after {startup_phases.ready_after * 1000:.0f} ms.")
+
     yield # This is where the FastAPI app starts receiving traffic
 
     # --- SHUTDOWN --- #
     print("Shutting down application...")
+    for task in background_tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    slow_request_profiler.stop()
+    await outbox_relay.publisher.close()
+    await revocation_list.stop()
+    await user_cache.stop()
     # Properly close all connections in the pool
-    await engine.dispose()
+    await dispose_engine()
+    await close_probes()
     print("Database connection pool closed.")
+    password_hasher.shutdown()
+    print("Password hashing pool stopped.")
+    await close_redis()
 
 # Initialize FastAPI with our lifespan manager
 app = FastAPI(
@@ -38,16 +141,18 @@ app = FastAPI(
     lifespan=lifespan
 )
 
-app.include_router(user_endpoint.router)
+app.add_middleware(
+    RequestTimingMiddleware,
+    server_timing=settings.SERVER_TIMING_ENABLED,
+    profiler=slow_request_profiler if settings.PROFILE_SLOW_REQUESTS else None,
+    sql=sql_instrumentation if settings.SQL_INSTRUMENTATION_ENABLED else None
+)
 
-@app.get("/health", tags=["System"])
-async def health_check():
-    """
-    Check the status of the API and its connection to the database.
-    """
-    is_db_up = await ping_database()
-    return {
-        "status": "online" if is_db_up else "degraded",
-        "database": "connected" if is_db_up else "disconnected",
-        "version": app.version
-    }
+app.include_router(health_endpoint.router)
+app.include_router(auth_endpoint.router)
+app.include_router(user_endpoint.router)
+app.include_router(solver_endpoint.router)
+app.include_router(project_endpoint.router)
+app.include_router(proposal_endpoint.router)
+app.include_router(task_submission_endpoint.router)
+app.include_router(internal_endpoint.router)
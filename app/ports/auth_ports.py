@@ -0,0 +1,47 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from app.domain.auth import IssuedToken, LoginData, TokenClaims
+from app.domain.user import User
+
+
+class TokenPort(ABC):
+    """
+    Interface for issuing and verifying signed access tokens.
+    """
+    @abstractmethod
+    def issue(self, user: User) -> IssuedToken:
+        pass
+
+    @abstractmethod
+    def verify(self, token: str) -> TokenClaims:
+        """Return the token's claims. Raises ValueError if it is malformed, forged or expired."""
+        pass
+
+
+class RevocationPort(ABC):
+    """
+    Interface for the revoked-token list, keyed by jti.
+    """
+    @abstractmethod
+    async def revoke(self, jti: UUID, expires_at: int) -> None:
+        """Revoke until expires_at (unix seconds); after that the token is dead anyway."""
+        pass
+
+    @abstractmethod
+    async def is_revoked(self, jti: UUID) -> bool:
+        pass
+
+
+class AuthService(ABC):
+    """
+    Service Interface for Auth Service
+
+    """
+    @abstractmethod
+    async def login(self, login_data: LoginData) -> IssuedToken:
+        """
+        Exchange credentials for an access token.
+        Raises ValueError for unknown users, wrong passwords and disabled accounts alike.
+        """
+        pass
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+
+class CounterRepository(ABC):
+    """
+    Repairs the denormalized project counters on solvers and buyers.
+
+    Each call handles one batch of rows with id > after_id and returns
+    (last id in the batch or None when exhausted, number of rows repaired).
+    """
+    @abstractmethod
+    async def reconcile_solvers(self, after_id: int, limit: int) -> Tuple[Optional[int], int]:
+        pass
+
+    @abstractmethod
+    async def reconcile_buyers(self, after_id: int, limit: int) -> Tuple[Optional[int], int]:
+        pass
@@ -0,0 +1,59 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Sequence, Tuple
+
+from app.domain.event import DomainEvent
+
+
+class EventPublisher(ABC):
+    """
+    Port for the message bus the outbox relay drains into.
+
+    """
+    @abstractmethod
+    async def start(self) -> None:
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        pass
+
+    @abstractmethod
+    async def ping(self, timeout: float) -> None:
+        """Round trip to the bus. Raises if it is not connected or does not answer in time."""
+        pass
+
+    @abstractmethod
+    async def publish_many(self, events: Sequence[DomainEvent]) -> List[bool]:
+        """
+        Publish concurrently and wait for every ack.
+        Returns, per event and in order, whether the bus acknowledged it.
+        """
+        pass
+
+
+class OutboxRepository(ABC):
+    """
+    Repository interface for the transactional outbox.
+
+    """
+    @abstractmethod
+    async def claim_batch(self, limit: int) -> List[Tuple[int, DomainEvent]]:
+        """
+        Lock up to `limit` unpublished events, oldest first, skipping rows
+        another relay holds and dead-lettered ones. The lock lasts until mark commits.
+        """
+        pass
+
+    @abstractmethod
+    async def mark(self, published: Sequence[int], failed: Sequence[int], error: str) -> int:
+        """
+        Record the publish outcome of a claimed batch and commit. Failed events
+        that used up their attempts are dead-lettered: kept, but never claimed
+        again. Returns how many were dead-lettered.
+        """
+        pass
+
+    @abstractmethod
+    async def prune_published(self, before: datetime) -> int:
+        pass
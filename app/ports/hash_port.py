@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List, Sequence
 
 
 class HashPort(ABC):
@@ -14,3 +15,24 @@ class HashPort(ABC):
     def compare(self, plain_password: str, hashed_password: str) -> bool:
         """Compare a plain password with a hashed password. Return True if they match."""
         pass
+
+
+class AsyncHashPort(ABC):
+    """
+    Non-blocking variant of HashPort.
+    Implementations must not run the hash on the event loop thread.
+    """
+    @abstractmethod
+    async def hash(self, password: str) -> str:
+        """Hash the given password and return the hashed string."""
+        pass
+
+    @abstractmethod
+    async def compare(self, plain_password: str, hashed_password: str) -> bool:
+        """Compare a plain password with a hashed password. Return True if they match."""
+        pass
+
+    @abstractmethod
+    async def hash_many(self, passwords: Sequence[str]) -> List[str]:
+        """Hash a batch of passwords, preserving order. Used by bulk imports."""
+        pass
@@ -0,0 +1,104 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from uuid import UUID
+
+from app.domain.matching import SolverMatch
+from app.domain.project import OpenProjectFeedPage, Project
+
+
+class ProjectRepository(ABC):
+    """
+    Repository interface for Project entity.
+
+    """
+    @abstractmethod
+    async def get_by_uuid(self, id: UUID) -> Optional[Project]:
+        pass
+
+    @abstractmethod
+    async def resolve_id(self, id: UUID, buyer_user_id: Optional[UUID] = None) -> Optional[int]:
+        """
+        Project primary key, or None if the project is missing or, when
+        buyer_user_id is given, belongs to another buyer.
+        """
+        pass
+
+    @abstractmethod
+    async def assign_solver(self, project_pk: int, solver_id: UUID) -> Optional[Project]:
+        """
+        Move a pending, unassigned project to in-progress and bump the solver's
+        and buyer's total_projects in the same transaction.
+        Returns None if the project or solver is missing or the project is not assignable.
+        """
+        pass
+
+    @abstractmethod
+    async def approve_completion(self, project_pk: int) -> Optional[Project]:
+        """
+        Approve the project's pending completion request, complete the project and
+        bump completed_projects, the solver's rating and the buyer's total_spent
+        in the same transaction.
+        Returns None if there is no pending request for an in-progress project.
+        """
+        pass
+
+    @abstractmethod
+    async def list_open_feed(self, limit: int = 20, cursor: Optional[str] = None) -> OpenProjectFeedPage:
+        """
+        Page through the materialized open-projects feed, newest first.
+        Raises ValueError for an invalid cursor.
+        """
+        pass
+
+
+class ProjectService(ABC):
+    """
+    Service Interface for Project Service
+
+    """
+    @abstractmethod
+    async def assign_solver(self, project_id: UUID, solver_id: UUID, buyer_user_id: Optional[UUID] = None) -> Project:
+        """
+        Raises LookupError if the project is not found (or, with buyer_user_id,
+        not that buyer's), ValueError if the project cannot take this solver.
+        """
+        pass
+
+    @abstractmethod
+    async def approve_completion(self, project_id: UUID, buyer_user_id: Optional[UUID] = None) -> Project:
+        """
+        Raises LookupError if the project is not found (or, with buyer_user_id,
+        not that buyer's), ValueError if there is no pending completion request to approve.
+        """
+        pass
+
+    @abstractmethod
+    async def list_open_projects(self, limit: int = 20, cursor: Optional[str] = None) -> OpenProjectFeedPage:
+        """
+        Open projects for solvers to browse, flagged stale if the feed missed its refreshes.
+        Raises ValueError for an invalid cursor.
+        """
+        pass
+
+
+class MatchingService(ABC):
+    """
+    Service Interface for ranking solvers against a project
+
+    """
+    @abstractmethod
+    async def refresh(self) -> int:
+        """
+        Pull solvers changed since the last refresh into the matching engine.
+        Returns the number of solvers applied.
+        """
+        pass
+
+    @abstractmethod
+    async def match_project(self, project_id: UUID, skills: List[str], k: int = 10) -> List[SolverMatch]:
+        """
+        Top-k solvers for the project, best first.
+        Raises ValueError if the project does not exist, and
+        MatchingNotReadyError until the engine's first load has finished.
+        """
+        pass
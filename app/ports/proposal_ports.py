@@ -0,0 +1,72 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from app.domain.proposal import Proposal, ProposalPage, ProposalSort, ProposalSubmission
+
+
+class ProposalRepository(ABC):
+    """
+    Repository interface for Proposal entity.
+
+    """
+    @abstractmethod
+    async def resolve_ids(self, project_id: UUID, solver_user_id: UUID) -> tuple[Optional[int], Optional[int]]:
+        """
+        Internal ids of the open (pending) project and of the user's solver
+        profile; None for whichever does not exist.
+        """
+        pass
+
+    @abstractmethod
+    async def submit(self, project_pk: int, solver_pk: int, submission: ProposalSubmission) -> Optional[Proposal]:
+        """
+        Insert the proposal and bump the project's proposal count in one
+        transaction. Returns None if this solver already bid on the project.
+        """
+        pass
+
+    @abstractmethod
+    async def list_for_project(
+        self,
+        project_id: UUID,
+        sort: ProposalSort = ProposalSort.RECENT,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        buyer_user_id: Optional[UUID] = None
+    ) -> Optional[ProposalPage]:
+        """
+        Keyset page of a project's proposals. With buyer_user_id, only the
+        project's own buyer may list it. Returns None if the project is not found.
+        Raises ValueError for an invalid cursor.
+        """
+        pass
+
+
+class ProposalService(ABC):
+    """
+    Service Interface for Proposal Service
+
+    """
+    @abstractmethod
+    async def submit_proposal(self, submission: ProposalSubmission) -> Proposal:
+        """
+        Raises LookupError if the project is not open or the user has no solver
+        profile, ValueError if the solver already bid on it.
+        """
+        pass
+
+    @abstractmethod
+    async def list_proposals(
+        self,
+        project_id: UUID,
+        sort: ProposalSort = ProposalSort.RECENT,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        buyer_user_id: Optional[UUID] = None
+    ) -> ProposalPage:
+        """
+        Raises LookupError if the project is not found (or not the buyer's),
+        ValueError for an invalid cursor.
+        """
+        pass
@@ -0,0 +1,53 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from app.domain.matching import SolverFeatures
+from app.domain.solver import SolverPage, SolverSearchFilters
+
+
+class SolverRepository(ABC):
+    """
+    Repository interface for Solver entity.
+
+    """
+    @abstractmethod
+    async def search(
+        self,
+        filters: SolverSearchFilters,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> SolverPage:
+        """Filtered search ordered by rating (best first), keyset paginated"""
+        pass
+
+    @abstractmethod
+    async def list_features_changed_since(
+        self,
+        after: Optional[Tuple[datetime, int]],
+        limit: int = 5000
+    ) -> List[SolverFeatures]:
+        """
+        Solvers (soft-deleted included) with (updated_at, id) greater than `after`,
+        in that order. None starts from the beginning.
+        """
+        pass
+
+
+class SolverService(ABC):
+    """
+    Service Interface for Solver Service
+
+    """
+    @abstractmethod
+    async def search_solvers(
+        self,
+        filters: SolverSearchFilters,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> SolverPage:
+        """
+        Search solvers by skills, hourly rate, experience and availability.
+        Raises ValueError for contradictory filters or an invalid cursor.
+        """
+        pass
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import AsyncIterator
+
+from app.domain.task_submission import StoredBlob
+
+
+class BlobStore(ABC):
+    """
+    Interface for content-addressed file storage.
+    """
+    @abstractmethod
+    async def put_stream(self, chunks: AsyncIterator[bytes], max_bytes: int) -> StoredBlob:
+        """
+        Store a stream without holding it in memory. Storing bytes that are
+        already present returns the existing blob.
+        Raises ValueError once the stream exceeds max_bytes.
+        """
+        pass
+
+    @abstractmethod
+    def path(self, key: str) -> Path:
+        """Local path of a stored blob, for zero-copy serving."""
+        pass
@@ -0,0 +1,62 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+from app.domain.task_submission import SubmissionFile, SubmissionUpload, TaskSubmission
+
+
+class TaskSubmissionRepository(ABC):
+    """
+    Repository interface for TaskSubmission entity.
+
+    """
+    @abstractmethod
+    async def resolve_upload_task(self, task_id: UUID, solver_user_id: UUID) -> Optional[int]:
+        """
+        Internal id of the task if its project is in progress and assigned to
+        this user's solver profile; None otherwise. Ends the read transaction so
+        no connection is held while the upload streams in.
+        """
+        pass
+
+    @abstractmethod
+    async def create_version(self, task_pk: int, file_path: str) -> TaskSubmission:
+        """
+        Record file_path as the task's next submission version. If the latest
+        version already points at the same file, it is returned unchanged.
+        """
+        pass
+
+    @abstractmethod
+    async def get_submission_file(self, task_id: UUID, submission_id: UUID) -> Optional[SubmissionFile]:
+        pass
+
+
+class TaskSubmissionService(ABC):
+    """
+    Service Interface for Task Submission Service
+
+    """
+    @abstractmethod
+    async def upload(self, upload: SubmissionUpload, chunks: AsyncIterator[bytes]) -> TaskSubmission:
+        """
+        Stream a submission file to storage and record it as a new version.
+        Raises LookupError if the task is not the solver's active work,
+        ValueError if the stream is larger than the upload limit.
+        """
+        pass
+
+    @abstractmethod
+    async def open_file(
+        self,
+        task_id: UUID,
+        submission_id: UUID,
+        reader_user_id: Optional[UUID] = None
+    ) -> tuple[TaskSubmission, Path]:
+        """
+        Submission and the local path of its file. With reader_user_id, only the
+        project's buyer or assigned solver may read it.
+        Raises LookupError if not found (or not readable by that user).
+        """
+        pass
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, Tuple, Union
+from typing import AsyncIterable, Optional, List, Set, Tuple, Union
 from uuid import UUID
-from app.domain.user import User, UserRegistrationData, UserRole, UserStatus, UserUpdateData
+from app.domain.user import (
+    User, UserImportResult, UserImportRow, UserPage, UserRegistrationData, UserRowPage, UserRole, UserStatus, UserUpdateData
+)
 
 
 
@@ -14,6 +16,14 @@ class UserRepository(ABC):
     async def create(self, user: User) -> User:
         pass
 
+    @abstractmethod
+    async def create_many(self, users: List[User]) -> List[User]:
+        """
+        Insert a batch in one statement. Rows that hit a unique constraint
+        are skipped; only the inserted users are returned.
+        """
+        pass
+
     @abstractmethod
     async def update(self, user: User) -> User:
         pass
@@ -30,6 +40,11 @@ class UserRepository(ABC):
     async def get_by_username(self, username: str) -> Optional[User]:
         pass
 
+    @abstractmethod
+    async def find_taken(self, emails: List[str], user_names: List[str]) -> Tuple[Set[str], Set[str]]:
+        """Returns (taken_emails, taken_user_names) among the given values in one query"""
+        pass
+
     @abstractmethod
     async def list_users(
         self,
@@ -41,6 +56,33 @@ class UserRepository(ABC):
         """Returns a tuple of (users_list, total_count)"""
         pass
 
+    @abstractmethod
+    async def list_users_page(
+        self,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        role: Optional[UserRole] = None,
+        status: Optional[UserStatus] = None,
+        with_total: bool = False
+    ) -> UserPage:
+        """
+        Keyset pagination, newest first. Every page costs the same as the first;
+        the count(*) only runs when with_total is set.
+        """
+        pass
+
+    @abstractmethod
+    async def list_users_page_rows(
+        self,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        role: Optional[UserRole] = None,
+        status: Optional[UserStatus] = None,
+        with_total: bool = False
+    ) -> UserRowPage:
+        """Same page as list_users_page, as plain dicts of the public columns only"""
+        pass
+
     @abstractmethod
     async def soft_delete(self, id: UUID) -> bool:
         pass
@@ -63,6 +105,14 @@ class UserService(ABC):
         """
         pass
 
+    @abstractmethod
+    async def import_users(self, rows: AsyncIterable[UserImportRow]) -> UserImportResult:
+        """
+        Bulk register users from a stream of parsed rows.
+        Invalid or duplicate rows are reported per line instead of aborting the import.
+        """
+        pass
+
     @abstractmethod
     async def update_user(self, update_data:UserUpdateData, id: UUID) -> User:
         """
@@ -70,6 +120,15 @@ class UserService(ABC):
         """
         pass
 
+    @abstractmethod
+    async def change_role(self, id: UUID, role: UserRole, granted_by: UserRole) -> User:
+        """
+        Give the user identified by uuid another role. Raises LookupError if
+        not found, PermissionError if granted_by may not grant (or take away)
+        that role. Tokens already issued keep their role until they expire.
+        """
+        pass
+
     @abstractmethod
     async def get_user(self, id: UUID) -> Optional[User]:
         """
@@ -90,6 +149,36 @@ class UserService(ABC):
         """
         pass
 
+    @abstractmethod
+    async def list_users_page(
+        self,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        role: Optional[UserRole] = None,
+        status: Optional[UserStatus] = None,
+        with_total: bool = False
+    ) -> UserPage:
+        """
+        List users with cursor pagination and optional filtering by role and status.
+        Pass the returned next_cursor to fetch the following page.
+        """
+        pass
+
+    @abstractmethod
+    async def list_users_page_rows(
+        self,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        role: Optional[UserRole] = None,
+        status: Optional[UserStatus] = None,
+        with_total: bool = False
+    ) -> UserRowPage:
+        """
+        Same as list_users_page but skips entity construction; for read
+        endpoints that serialize rows directly.
+        """
+        pass
+
     @abstractmethod
     async def get_user_by_email(self, email: str) -> Optional[User]:
         """
@@ -0,0 +1,146 @@
+import asyncio
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, List, Literal, Optional, Sequence
+
+from app.infra.metrics import Histogram
+from app.infra.timing import timed
+from app.ports.hash_port import AsyncHashPort
+from app.secure.argon import ArgonHaser
+from app.settings import settings
+
+
+# One hasher per worker process (or shared by threads; PasswordHasher is stateless)
+_worker_hasher: Optional[ArgonHaser] = None
+
+
+def _get_worker_hasher() -> ArgonHaser:
+    global _worker_hasher
+    if _worker_hasher is None:
+        _worker_hasher = ArgonHaser()
+    return _worker_hasher
+
+
+# Module-level so they can be pickled into a ProcessPoolExecutor
+def _hash(password: str) -> str:
+    return _get_worker_hasher().hash(password)
+
+
+def _compare(plain_password: str, hashed_password: str) -> bool:
+    return _get_worker_hasher().compare(plain_password, hashed_password)
+
+
+def _hash_many(passwords: Sequence[str]) -> List[str]:
+    hasher = _get_worker_hasher()
+    return [hasher.hash(p) for p in passwords]
+
+
+class HashQueueFullError(RuntimeError):
+    """Raised when the hashing pool already has max_pending jobs in flight."""
+    pass
+
+
+class PooledArgonHasher(AsyncHashPort):
+    """
+    Runs Argon2 in a process or thread pool and awaits the result.
+    In-flight jobs are capped at max_pending so a signup burst sheds load
+    instead of building an unbounded queue behind the pool.
+    """
+    def __init__(
+        self,
+        kind: Literal["process", "thread"] = "process",
+        max_workers: Optional[int] = None,
+        max_pending: int = 256
+    ):
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Optional[Executor] = None
+
+        self._pending = 0
+        self._peak_pending = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._latency = Histogram()
+
+    def start(self) -> None:
+        """Create the pool up front so the first signup does not pay for it."""
+        if self._executor is not None:
+            return
+        if self.kind == "process":
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="argon2"
+            )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def _submit(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if self._pending >= self.max_pending:
+            self._rejected += 1
+            raise HashQueueFullError(
+                f"Password hashing queue is full ({self.max_pending} pending)"
+            )
+
+        self.start()
+        self._pending += 1
+        self._peak_pending = max(self._peak_pending, self._pending)
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            # Queueing behind other jobs counts too: it is time the request waits
+            with timed("hash"):
+                result = await loop.run_in_executor(self._executor, fn, *args)
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            self._pending -= 1
+            self._latency.observe(time.perf_counter() - started)
+        self._completed += 1
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(_hash, password)
+
+    async def compare(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit(_compare, plain_password, hashed_password)
+
+    async def hash_many(self, passwords: Sequence[str]) -> List[str]:
+        # One job per worker instead of one per password: a 1000-row batch
+        # takes a handful of pending slots and pays pickling once per chunk
+        if not passwords:
+            return []
+        workers = self.max_workers or os.cpu_count() or 1
+        size = -(-len(passwords) // workers)
+        chunks = [passwords[i:i + size] for i in range(0, len(passwords), size)]
+        results = await asyncio.gather(*(self._submit(_hash_many, c) for c in chunks))
+        return [h for chunk in results for h in chunk]
+
+    def stats(self) -> dict:
+        return {
+            "kind": self.kind,
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self._pending,
+            "peak_pending": self._peak_pending,
+            "completed": self._completed,
+            "failed": self._failed,
+            "rejected": self._rejected,
+            "latency_seconds": self._latency.snapshot(),
+        }
+
+
+# Process-wide singleton, started and shut down by the app lifespan
+password_hasher = PooledArgonHasher(
+    kind=settings.HASH_POOL_KIND,
+    max_workers=settings.HASH_POOL_WORKERS,
+    max_pending=settings.HASH_MAX_PENDING
+)
@@ -0,0 +1,164 @@
+import hashlib
+import time
+from pathlib import Path
+from typing import Optional
+from uuid import UUID, uuid7
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric.ec import (
+    SECP256R1,
+    EllipticCurvePrivateKey,
+    EllipticCurvePublicKey,
+)
+from cryptography.hazmat.primitives.serialization import load_pem_private_key, load_pem_public_key
+
+from app.domain.auth import IssuedToken, TokenClaims
+from app.domain.user import User, UserRole
+from app.infra.cache.lru import TTLCache
+from app.ports.auth_ports import TokenPort
+from app.settings import settings
+
+
+class InvalidTokenError(ValueError):
+    """Raised for malformed, forged, expired or otherwise unacceptable tokens."""
+    pass
+
+
+class AuthKeysNotLoadedError(RuntimeError):
+    """Raised when a token operation runs before load() found the needed key."""
+    pass
+
+
+class ES256TokenService(TokenPort):
+    """
+    ES256 access tokens with keys parsed once.
+
+    PEM parsing happens in load() at startup; PyJWT is handed the key objects,
+    so issue/verify never touch the filesystem or re-parse keys.
+
+    verify() keeps a bounded cache of verified claims keyed by the token's
+    SHA-256. A repeated token skips the ECDSA check; each entry lives no longer
+    than its token (and at most claims_cache_max_ttl), so expiry is honoured
+    without re-checking exp on hits.
+    """
+    def __init__(
+        self,
+        private_key_path: str,
+        public_key_path: str,
+        issuer: str,
+        expire_minutes: int,
+        leeway_seconds: float = 10.0,
+        claims_cache_size: int = 50_000,
+        claims_cache_max_ttl: float = 300.0
+    ):
+        self.private_key_path = private_key_path
+        self.public_key_path = public_key_path
+        self.issuer = issuer
+        self.expire_seconds = expire_minutes * 60
+        self.leeway = leeway_seconds
+        self.claims_cache_max_ttl = claims_cache_max_ttl
+
+        self._private_key: Optional[EllipticCurvePrivateKey] = None
+        self._public_key: Optional[EllipticCurvePublicKey] = None
+        self._jwt = jwt.PyJWT()
+        self._verified: TTLCache[TokenClaims] = TTLCache(maxsize=claims_cache_size, ttl=claims_cache_max_ttl)
+        self.verifications = 0
+
+    def load(self) -> None:
+        """
+        Parse the key pair. The private key is optional so verify-only
+        deployments can ship just the public key.
+        """
+        public_key = load_pem_public_key(Path(self.public_key_path).read_bytes())
+        if not isinstance(public_key, EllipticCurvePublicKey) or not isinstance(public_key.curve, SECP256R1):
+            raise ValueError(f"{self.public_key_path} is not a P-256 public key")
+        self._public_key = public_key
+
+        private_path = Path(self.private_key_path)
+        if private_path.exists():
+            private_key = load_pem_private_key(private_path.read_bytes(), password=None)
+            if not isinstance(private_key, EllipticCurvePrivateKey) or not isinstance(private_key.curve, SECP256R1):
+                raise ValueError(f"{self.private_key_path} is not a P-256 private key")
+            self._private_key = private_key
+
+    @property
+    def loaded(self) -> bool:
+        return self._public_key is not None
+
+    def issue(self, user: User) -> IssuedToken:
+        if self._private_key is None:
+            raise AuthKeysNotLoadedError("Signing key is not loaded")
+        now = int(time.time())
+        claims = TokenClaims(
+            subject=user.uuid,
+            role=user.user_role,
+            jti=uuid7(),
+            issued_at=now,
+            expires_at=now + self.expire_seconds
+        )
+        token = self._jwt.encode(
+            {
+                "iss": self.issuer,
+                "sub": str(claims.subject),
+                "role": claims.role.name,
+                "jti": str(claims.jti),
+                "iat": claims.issued_at,
+                "exp": claims.expires_at,
+            },
+            self._private_key,
+            algorithm="ES256"
+        )
+        return IssuedToken(token=token, claims=claims)
+
+    def verify(self, token: str) -> TokenClaims:
+        key = hashlib.sha256(token.encode()).digest()
+        claims = self._verified.get(key)
+        if claims is not None:
+            return claims
+
+        if self._public_key is None:
+            raise AuthKeysNotLoadedError("Verification key is not loaded")
+        self.verifications += 1
+        try:
+            payload = self._jwt.decode(
+                token,
+                self._public_key,
+                algorithms=["ES256"],
+                issuer=self.issuer,
+                leeway=self.leeway,
+                options={"require": ["iss", "sub", "jti", "iat", "exp"]}
+            )
+            claims = TokenClaims(
+                subject=UUID(payload["sub"]),
+                role=UserRole[payload["role"]],
+                jti=UUID(payload["jti"]),
+                issued_at=int(payload["iat"]),
+                expires_at=int(payload["exp"])
+            )
+        except (jwt.PyJWTError, KeyError, TypeError, ValueError) as e:
+            raise InvalidTokenError(str(e) or "Invalid token")
+
+        remaining = claims.expires_at - time.time()
+        if remaining > 0:
+            self._verified.set(key, claims, ttl=min(remaining, self.claims_cache_max_ttl))
+        return claims
+
+    def stats(self) -> dict:
+        return {
+            "loaded": self.loaded,
+            "can_issue": self._private_key is not None,
+            "verifications": self.verifications,
+            "claims_cache": self._verified.stats(),
+        }
+
+
+# Process-wide singleton; keys are loaded by the app lifespan
+token_service = ES256TokenService(
+    private_key_path=settings.AUTH_PRIVATE_KEY_PATH,
+    public_key_path=settings.AUTH_PUBLIC_KEY_PATH,
+    issuer=settings.AUTH_ISSUER,
+    expire_minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES,
+    leeway_seconds=settings.AUTH_LEEWAY_SECONDS,
+    claims_cache_size=settings.AUTH_CLAIMS_CACHE_SIZE,
+    claims_cache_max_ttl=settings.AUTH_CLAIMS_CACHE_MAX_TTL_SECONDS
+)
@@ -0,0 +1,39 @@
+from typing import Optional
+
+from app.domain.auth import IssuedToken, LoginData
+from app.domain.user import UserStatus
+from app.ports.auth_ports import AuthService, TokenPort
+from app.ports.hash_port import AsyncHashPort
+from app.ports.user_ports import UserRepository
+
+_INVALID_CREDENTIALS = "Invalid credentials"
+
+
+class AuthServiceImpl(AuthService):
+    # Verified against when the login matches no user, so unknown and known
+    # accounts take the same Argon2 time. Computed once per process
+    _dummy_hash: Optional[str] = None
+
+    def __init__(self, user_repo: UserRepository, hasher: AsyncHashPort, tokens: TokenPort):
+        self.user_repo = user_repo
+        self.hasher = hasher
+        self.tokens = tokens
+
+    async def login(self, login_data: LoginData) -> IssuedToken:
+        if "@" in login_data.login:
+            user = await self.user_repo.get_by_email(login_data.login)
+        else:
+            user = await self.user_repo.get_by_username(login_data.login)
+
+        if user is None:
+            if AuthServiceImpl._dummy_hash is None:
+                AuthServiceImpl._dummy_hash = await self.hasher.hash("timing-equalizer")
+            await self.hasher.compare(login_data.password, AuthServiceImpl._dummy_hash)
+            raise ValueError(_INVALID_CREDENTIALS)
+
+        if not await self.hasher.compare(login_data.password, user.password):
+            raise ValueError(_INVALID_CREDENTIALS)
+        if user.user_status in (UserStatus.INACTIVE, UserStatus.SUSPENDED):
+            raise ValueError(_INVALID_CREDENTIALS)
+
+        return self.tokens.issue(user)
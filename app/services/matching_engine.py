@@ -0,0 +1,174 @@
+from datetime import datetime
+from typing import Optional, Sequence
+from uuid import UUID
+
+import numpy as np
+
+from app.domain.matching import MatchQuery, SolverFeatures, SolverMatch
+from app.domain.solver import AvailabilityStatus
+
+# Used to turn a daily duration into billable hours when comparing
+# a solver's hourly_rate with a project's total budget
+HOURS_PER_DAY = 8.0
+
+
+class MatchingNotReadyError(RuntimeError):
+    """The engine has not finished its first full load of solvers."""
+
+
+class SolverMatchingEngine:
+    """
+    In-memory, column-oriented feature matrix of every solver.
+
+    Rows are upserted incrementally from changed solvers; skills are stored
+    as a bitset (one bit per known skill, packed into uint64 words) so skill
+    overlap for all solvers is a vectorized AND + popcount. Scoring a project
+    touches each array once and never loops over solvers in Python.
+
+    Not thread-safe: mutate and query from the event loop thread only.
+    """
+    def __init__(
+        self,
+        w_skill: float = 0.45,
+        w_rate: float = 0.20,
+        w_rating: float = 0.20,
+        w_completion: float = 0.15,
+        initial_capacity: int = 1024
+    ):
+        self.weights = (w_skill, w_rate, w_rating, w_completion)
+
+        self._size = 0
+        self._row_of: dict[int, int] = {}
+        self._uuids: list[Optional[UUID]] = []
+        self._skill_bit: dict[str, int] = {}
+
+        self._rate = np.zeros(initial_capacity, dtype=np.float64)
+        self._rating = np.zeros(initial_capacity, dtype=np.float64)
+        self._completion = np.zeros(initial_capacity, dtype=np.float64)
+        self._eligible = np.zeros(initial_capacity, dtype=bool)
+        self._skills = np.zeros((initial_capacity, 1), dtype=np.uint64)
+
+        # Refresh watermark: newest (updated_at, id) applied so far
+        self.watermark: Optional[tuple[datetime, int]] = None
+        # Set once a refresh has read every solver (an empty table included)
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def eligible_count(self) -> int:
+        return int(self._eligible[:self._size].sum())
+
+    def _ensure_capacity(self, rows: int) -> None:
+        capacity = self._rate.shape[0]
+        if rows <= capacity:
+            return
+        new_capacity = max(rows, capacity * 2)
+        grow = new_capacity - capacity
+        self._rate = np.concatenate([self._rate, np.zeros(grow, dtype=np.float64)])
+        self._rating = np.concatenate([self._rating, np.zeros(grow, dtype=np.float64)])
+        self._completion = np.concatenate([self._completion, np.zeros(grow, dtype=np.float64)])
+        self._eligible = np.concatenate([self._eligible, np.zeros(grow, dtype=bool)])
+        self._skills = np.vstack([self._skills, np.zeros((grow, self._skills.shape[1]), dtype=np.uint64)])
+
+    def _bit_for(self, skill: str) -> int:
+        bit = self._skill_bit.get(skill)
+        if bit is None:
+            bit = len(self._skill_bit)
+            self._skill_bit[skill] = bit
+            words_needed = bit // 64 + 1
+            if words_needed > self._skills.shape[1]:
+                pad = np.zeros((self._skills.shape[0], words_needed - self._skills.shape[1]), dtype=np.uint64)
+                self._skills = np.hstack([self._skills, pad])
+        return bit
+
+    def _query_bits(self, skills: Sequence[str]) -> np.ndarray:
+        bits = np.zeros(self._skills.shape[1], dtype=np.uint64)
+        for skill in skills:
+            bit = self._skill_bit.get(skill)
+            if bit is not None:  # a skill nobody has can't overlap, but still counts as required
+                bits[bit // 64] |= np.uint64(1 << (bit % 64))
+        return bits
+
+    def upsert(self, solvers: Sequence[SolverFeatures]) -> None:
+        self._ensure_capacity(self._size + len(solvers))
+        for solver in solvers:
+            row = self._row_of.get(solver.id)
+            if row is None:
+                row = self._size
+                self._row_of[solver.id] = row
+                self._uuids.append(solver.uuid)
+                self._size += 1
+
+            self._rate[row] = solver.hourly_rate
+            self._rating[row] = solver.rating
+            self._completion[row] = (
+                solver.completed_projects / solver.total_projects if solver.total_projects else 0.0
+            )
+            self._eligible[row] = (
+                solver.deleted_at is None and solver.is_available == AvailabilityStatus.AVAILABLE
+            )
+            self._skills[row, :] = 0
+            for skill in solver.skills:
+                bit = self._bit_for(skill)
+                self._skills[row, bit // 64] |= np.uint64(1 << (bit % 64))
+
+            mark = (solver.updated_at, solver.id)
+            if self.watermark is None or mark > self.watermark:
+                self.watermark = mark
+
+    def top_k(self, query: MatchQuery) -> list[SolverMatch]:
+        n = self._size
+        if n == 0 or query.k <= 0:
+            return []
+
+        required = len(set(query.skills))
+        if required:
+            shared = np.bitwise_count(self._skills[:n] & self._query_bits(sorted(set(query.skills))))
+            skill_overlap = shared.sum(axis=1, dtype=np.float64) / required
+        else:
+            skill_overlap = np.ones(n, dtype=np.float64)
+
+        # 1.0 when the solver's estimated cost fits the budget, shrinking as it exceeds it
+        cost = self._rate[:n] * HOURS_PER_DAY * max(query.duration_days, 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rate_fit = np.where(cost > 0, np.minimum(query.budget / cost, 1.0), 1.0)
+
+        rating = self._rating[:n] / 5.0
+        completion = self._completion[:n]
+
+        w_skill, w_rate, w_rating, w_completion = self.weights
+        score = w_skill * skill_overlap + w_rate * rate_fit + w_rating * rating + w_completion * completion
+        score = np.where(self._eligible[:n], score, -np.inf)
+
+        k = min(query.k, self.eligible_count)
+        if k == 0:
+            return []
+        top = np.argpartition(-score, k - 1)[:k]
+        top = top[np.argsort(-score[top], kind="stable")]
+
+        return [
+            SolverMatch(
+                solver_uuid=self._uuids[i],
+                score=round(float(score[i]), 6),
+                skill_overlap=round(float(skill_overlap[i]), 6),
+                rate_fit=round(float(rate_fit[i]), 6),
+                rating=float(self._rating[i]),
+                completion_rate=round(float(completion[i]), 6)
+            )
+            for i in top
+        ]
+
+    def stats(self) -> dict:
+        return {
+            "solvers": self._size,
+            "eligible": self.eligible_count,
+            "skills": len(self._skill_bit),
+            "watermark": self.watermark[0].isoformat() if self.watermark else None,
+            "loaded": self.loaded,
+        }
+
+
+# Process-wide singleton, kept fresh by app.infra.jobs.matching_refresh
+matching_engine = SolverMatchingEngine()
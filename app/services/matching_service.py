@@ -0,0 +1,63 @@
+from datetime import timedelta
+from typing import List
+from uuid import UUID
+
+from app.domain.matching import MatchQuery, SolverMatch
+from app.ports.project_ports import MatchingService, ProjectRepository
+from app.ports.solver_ports import SolverRepository
+from app.services.matching_engine import MatchingNotReadyError, SolverMatchingEngine
+
+
+class MatchingServiceImpl(MatchingService):
+    def __init__(
+        self,
+        engine: SolverMatchingEngine,
+        solver_repo: SolverRepository,
+        project_repo: ProjectRepository,
+        batch_size: int = 5000,
+        lag: timedelta = timedelta(seconds=5)
+    ):
+        self.engine = engine
+        self.solver_repo = solver_repo
+        self.project_repo = project_repo
+        self.batch_size = batch_size
+        self.lag = lag
+
+    async def refresh(self) -> int:
+        # Re-read a small window behind the watermark: a transaction that
+        # committed late can carry an updated_at older than rows already seen.
+        # Upserts are idempotent, so the overlap only costs a few rows.
+        after = None
+        if self.engine.watermark is not None:
+            updated_at, _ = self.engine.watermark
+            after = (updated_at - self.lag, 0)
+
+        applied = 0
+        while True:
+            batch = await self.solver_repo.list_features_changed_since(after, self.batch_size)
+            if not batch:
+                break
+            self.engine.upsert(batch)
+            applied += len(batch)
+            after = (batch[-1].updated_at, batch[-1].id)
+            if len(batch) < self.batch_size:
+                break
+        self.engine.loaded = True
+        return applied
+
+    async def match_project(self, project_id: UUID, skills: List[str], k: int = 10) -> List[SolverMatch]:
+        # The first load happens in startup warmup or the refresh loop, never
+        # here: paging every solver would hold this request's connection
+        if not self.engine.loaded:
+            raise MatchingNotReadyError("Matching engine is still loading solvers")
+
+        project = await self.project_repo.get_by_uuid(project_id)
+        if not project:
+            raise ValueError("Project not found")
+
+        return self.engine.top_k(MatchQuery(
+            budget=project.project_budget,
+            duration_days=project.project_duration_days,
+            skills=skills,
+            k=k
+        ))
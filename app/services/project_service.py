@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from uuid import UUID
+
+from app.domain.project import OpenProjectFeedPage, Project
+from app.ports.project_ports import ProjectRepository, ProjectService
+
+
+class ProjectServiceImpl(ProjectService):
+    def __init__(self, project_repo: ProjectRepository, feed_stale_after: timedelta = timedelta(minutes=2)):
+        self.project_repo = project_repo
+        self.feed_stale_after = feed_stale_after
+
+    async def assign_solver(self, project_id: UUID, solver_id: UUID, buyer_user_id: Optional[UUID] = None) -> Project:
+        project_pk = await self._project_pk(project_id, buyer_user_id)
+        project = await self.project_repo.assign_solver(project_pk, solver_id)
+        if not project:
+            raise ValueError("Project is not open for assignment or solver not found")
+        return project
+
+    async def approve_completion(self, project_id: UUID, buyer_user_id: Optional[UUID] = None) -> Project:
+        project_pk = await self._project_pk(project_id, buyer_user_id)
+        project = await self.project_repo.approve_completion(project_pk)
+        if not project:
+            raise ValueError("No pending completion request for this project")
+        return project
+
+    async def _project_pk(self, project_id: UUID, buyer_user_id: Optional[UUID]) -> int:
+        project_pk = await self.project_repo.resolve_id(project_id, buyer_user_id)
+        if project_pk is None:
+            raise LookupError("Project not found")
+        return project_pk
+
+    async def list_open_projects(self, limit: int = 20, cursor: Optional[str] = None) -> OpenProjectFeedPage:
+        page = await self.project_repo.list_open_feed(limit, cursor)
+        page.stale = (
+            page.refreshed_at is None
+            or datetime.now(timezone.utc) - page.refreshed_at > self.feed_stale_after
+        )
+        return page
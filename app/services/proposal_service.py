@@ -0,0 +1,40 @@
+from typing import Optional
+from uuid import UUID
+
+from app.domain.proposal import Proposal, ProposalPage, ProposalSort, ProposalSubmission
+from app.ports.proposal_ports import ProposalRepository, ProposalService
+
+
+class ProposalServiceImpl(ProposalService):
+    def __init__(self, proposal_repo: ProposalRepository):
+        self.proposal_repo = proposal_repo
+
+    async def submit_proposal(self, submission: ProposalSubmission) -> Proposal:
+        if submission.proposed_price <= 0:
+            raise ValueError("proposed_price must be positive")
+
+        project_pk, solver_pk = await self.proposal_repo.resolve_ids(
+            submission.project_uuid, submission.solver_user_uuid
+        )
+        if project_pk is None:
+            raise LookupError("Project not found or not accepting proposals")
+        if solver_pk is None:
+            raise LookupError("No solver profile for this user")
+
+        proposal = await self.proposal_repo.submit(project_pk, solver_pk, submission)
+        if proposal is None:
+            raise ValueError("You have already submitted a proposal for this project")
+        return proposal
+
+    async def list_proposals(
+        self,
+        project_id: UUID,
+        sort: ProposalSort = ProposalSort.RECENT,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        buyer_user_id: Optional[UUID] = None
+    ) -> ProposalPage:
+        page = await self.proposal_repo.list_for_project(project_id, sort, limit, cursor, buyer_user_id)
+        if page is None:
+            raise LookupError("Project not found")
+        return page
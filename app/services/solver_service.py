@@ -0,0 +1,27 @@
+from typing import Optional
+
+from app.domain.solver import SolverPage, SolverSearchFilters
+from app.ports.solver_ports import SolverRepository, SolverService
+
+
+class SolverServiceImpl(SolverService):
+    def __init__(self, solver_repo: SolverRepository):
+        self.solver_repo = solver_repo
+
+    async def search_solvers(
+        self,
+        filters: SolverSearchFilters,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> SolverPage:
+        if (
+            filters.min_hourly_rate is not None
+            and filters.max_hourly_rate is not None
+            and filters.min_hourly_rate > filters.max_hourly_rate
+        ):
+            raise ValueError("min_hourly_rate cannot be greater than max_hourly_rate")
+
+        # Dedupe so the array literals (and their plans) stay small
+        filters.skills_any = sorted(set(filters.skills_any))
+        filters.skills_all = sorted(set(filters.skills_all))
+        return await self.solver_repo.search(filters, limit, cursor)
@@ -0,0 +1,36 @@
+from pathlib import Path
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+from app.domain.task_submission import SubmissionUpload, TaskSubmission
+from app.ports.storage_ports import BlobStore
+from app.ports.task_submission_ports import TaskSubmissionRepository, TaskSubmissionService
+
+
+class TaskSubmissionServiceImpl(TaskSubmissionService):
+    def __init__(self, submission_repo: TaskSubmissionRepository, blob_store: BlobStore, max_bytes: int):
+        self.submission_repo = submission_repo
+        self.blob_store = blob_store
+        self.max_bytes = max_bytes
+
+    async def upload(self, upload: SubmissionUpload, chunks: AsyncIterator[bytes]) -> TaskSubmission:
+        # Checked before the first byte is read, so strangers cannot fill the disk
+        task_pk = await self.submission_repo.resolve_upload_task(upload.task_uuid, upload.solver_user_uuid)
+        if task_pk is None:
+            raise LookupError("Task not found or not assigned to you")
+
+        blob = await self.blob_store.put_stream(chunks, self.max_bytes)
+        return await self.submission_repo.create_version(task_pk, blob.key)
+
+    async def open_file(
+        self,
+        task_id: UUID,
+        submission_id: UUID,
+        reader_user_id: Optional[UUID] = None
+    ) -> tuple[TaskSubmission, Path]:
+        found = await self.submission_repo.get_submission_file(task_id, submission_id)
+        if found is None:
+            raise LookupError("Submission not found")
+        if reader_user_id is not None and reader_user_id not in (found.buyer_user_uuid, found.solver_user_uuid):
+            raise LookupError("Submission not found")
+        return found.submission, self.blob_store.path(found.submission.file_path)
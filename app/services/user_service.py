@@ -1,14 +1,18 @@
-from typing import Optional, List, Tuple
+from typing import AsyncIterable, Optional, List, Tuple
 from uuid import UUID
 
-from app.domain.user import User, UserRegistrationData, UserUpdateData, UserRole, UserStatus
+from app.domain.user import (
+    User, UserImportFailure, UserImportResult, UserImportRow, UserPage, UserRowPage,
+    UserRegistrationData, UserUpdateData, UserRole, UserStatus
+)
 from app.ports.user_ports import UserService, UserRepository
-from app.ports.hash_port import HashPort
+from app.ports.hash_port import AsyncHashPort
 
 class UserServiceImpl(UserService):
-    def __init__(self, user_repo: UserRepository, hasher: HashPort):
+    def __init__(self, user_repo: UserRepository, hasher: AsyncHashPort, import_batch_size: int = 1000):
         self.user_repo = user_repo
         self.hasher = hasher
+        self.import_batch_size = import_batch_size
 
     async def register_user(self, user_data: UserRegistrationData) -> User:
         # Check for existing user
@@ -18,8 +22,8 @@ class UserServiceImpl(UserService):
         if await self.user_repo.get_by_username(user_data.user_name):
             raise ValueError(f"Username {user_data.user_name} is already taken")
 
-        # Hash password via injected port
-        hashed_password = self.hasher.hash(user_data.password)
+        # Hash password via injected port (runs off the event loop)
+        hashed_password = await self.hasher.hash(user_data.password)
 
         # Create Domain Entity (ID 0/None because it's not in DB yet)
         new_user = User(
@@ -34,6 +38,75 @@ class UserServiceImpl(UserService):
 
         return await self.user_repo.create(new_user)
 
+    async def import_users(self, rows: AsyncIterable[UserImportRow]) -> UserImportResult:
+        result = UserImportResult()
+        batch: List[Tuple[int, UserRegistrationData]] = []
+
+        async for row in rows:
+            if row.data is None:
+                result.failures.append(UserImportFailure(line=row.line, reason=row.error or "Invalid row"))
+                continue
+            batch.append((row.line, row.data))
+            if len(batch) >= self.import_batch_size:
+                await self._import_batch(batch, result)
+                batch = []
+
+        if batch:
+            await self._import_batch(batch, result)
+        result.failures.sort(key=lambda failure: failure.line)
+        return result
+
+    async def _import_batch(
+        self,
+        batch: List[Tuple[int, UserRegistrationData]],
+        result: UserImportResult
+    ) -> None:
+        taken_emails, taken_names = await self.user_repo.find_taken(
+            [data.email for _, data in batch],
+            [data.user_name for _, data in batch]
+        )
+
+        # Reject duplicates against the DB and within the batch itself
+        accepted: List[Tuple[int, UserRegistrationData]] = []
+        for line, data in batch:
+            if data.email in taken_emails:
+                reason = f"User with email {data.email} already exists"
+            elif data.user_name in taken_names:
+                reason = f"Username {data.user_name} is already taken"
+            else:
+                taken_emails.add(data.email)
+                taken_names.add(data.user_name)
+                accepted.append((line, data))
+                continue
+            result.failures.append(UserImportFailure(line=line, reason=reason, email=data.email))
+
+        if not accepted:
+            return
+
+        hashes = await self.hasher.hash_many([data.password for _, data in accepted])
+        new_users = [
+            User(
+                id=0,
+                user_name=data.user_name,
+                email=data.email,
+                phone=data.phone,
+                password=hashed_password,
+                user_status=UserStatus.ACTIVE,
+                user_role=data.user_role
+            )
+            for (_, data), hashed_password in zip(accepted, hashes)
+        ]
+        created = await self.user_repo.create_many(new_users)
+        result.created += len(created)
+
+        # Rows skipped by ON CONFLICT lost a race with a concurrent signup
+        created_emails = {user.email for user in created}
+        for line, data in accepted:
+            if data.email not in created_emails:
+                result.failures.append(
+                    UserImportFailure(line=line, reason="User already exists", email=data.email)
+                )
+
     async def update_user(self, update_data: UserUpdateData, id: UUID) -> User:
         user = await self.user_repo.get_by_id_or_uuid(id)
         if not user:
@@ -47,6 +120,18 @@ class UserServiceImpl(UserService):
 
         return await self.user_repo.update(user)
 
+    async def change_role(self, id: UUID, role: UserRole, granted_by: UserRole) -> User:
+        user = await self.user_repo.get_by_id_or_uuid(id)
+        if not user or user.deleted_at is not None:
+            raise LookupError("User not found")
+        # Only a super admin makes or unmakes another one
+        if UserRole.SUPER_ADMIN in (role, user.user_role) and granted_by is not UserRole.SUPER_ADMIN:
+            raise PermissionError("Only a super admin can grant or revoke that role")
+        if user.user_role is role:
+            return user
+        user.user_role = role
+        return await self.user_repo.update(user)
+
     async def get_user(self, id: UUID) -> Optional[User]:
         return await self.user_repo.get_by_id_or_uuid(id)
 
@@ -59,6 +144,26 @@ class UserServiceImpl(UserService):
     ) -> Tuple[List[User], int]:
         return await self.user_repo.list_users(skip, limit, role, status)
 
+    async def list_users_page(
+        self,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        role: Optional[UserRole] = None,
+        status: Optional[UserStatus] = None,
+        with_total: bool = False
+    ) -> UserPage:
+        return await self.user_repo.list_users_page(limit, cursor, role, status, with_total)
+
+    async def list_users_page_rows(
+        self,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        role: Optional[UserRole] = None,
+        status: Optional[UserStatus] = None,
+        with_total: bool = False
+    ) -> UserRowPage:
+        return await self.user_repo.list_users_page_rows(limit, cursor, role, status, with_total)
+
     async def get_user_by_email(self, email: str) -> Optional[User]:
         return await self.user_repo.get_by_email(email)
 
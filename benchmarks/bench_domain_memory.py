@@ -0,0 +1,74 @@
+"""
+Memory and CPU cost of hydrating list results: a plain (dict-backed) dataclass
+per row, the slotted User entity per row, and a columnar UserBatch.
+
+    python -m benchmarks.bench_domain_memory --rows 10000
+"""
+import argparse
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, List, Optional
+from uuid import UUID
+
+from uuid_utils.compat import uuid7
+
+from app.domain.user import User, UserBatch, UserRole, UserStatus
+
+
+@dataclass
+class _DictUser:
+    """The pre-slots User layout, kept here as the baseline."""
+    id: int
+    user_name: str
+    email: str
+    phone: str
+    password: str
+    user_status: UserStatus
+    user_role: UserRole = UserRole.SOLVER
+    uuid: UUID = field(default_factory=uuid7)
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    deleted_at: Optional[datetime] = field(default=None)
+
+
+def _rows(count: int) -> List[tuple]:
+    now = datetime.now(timezone.utc)
+    return [
+        (i, f"user_{i}", f"user_{i}@example.com", "+8801000000000", "hash",
+         UserStatus.ACTIVE, UserRole.SOLVER, uuid7(), now, now, None)
+        for i in range(count)
+    ]
+
+
+def _measure(build: Callable[[], object]) -> dict:
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - started
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return {"bytes": current, "ms": round(elapsed * 1000, 3)}
+
+
+def run(rows: int = 10_000) -> dict:
+    data = _rows(rows)
+    return {
+        "memory.hydrate_dict_dataclass": _measure(lambda: [_DictUser(*row) for row in data]),
+        "memory.hydrate_slotted_user": _measure(lambda: [User(*row) for row in data]),
+        "memory.hydrate_user_batch": _measure(lambda: UserBatch.from_rows(data)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000)
+    args = parser.parse_args()
+    for name, stats in run(args.rows).items():
+        print(f"{name:34} {stats['bytes'] / 1024:>10.1f} KiB {stats['ms']:>9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+CPU-only micro-benchmarks for the user request path: ORM row -> domain entity,
+domain entity -> JSON response (model and fast row paths), and a single Argon2 hash.
+
+    python -m benchmarks.bench_micro
+"""
+import time
+from datetime import datetime, timezone
+from typing import Callable
+
+from uuid_utils.compat import uuid7
+
+from app.api.v1.schemas.user_schema import UserResponse
+from app.api.v1.serializers import dump_user
+from app.domain.user import UserRole, UserStatus
+from app.infra.db.models import UserTable
+from app.infra.db.repo.user_repo import AlchemyUserRepository
+from app.secure.argon import ArgonHaser
+from benchmarks.stats import summarize
+
+
+def _time(fn: Callable[[], object], number: int) -> dict:
+    fn()
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(number):
+        t0 = time.perf_counter()
+        fn()
+        latencies.append(time.perf_counter() - t0)
+    return summarize(latencies, time.perf_counter() - started)
+
+
+def sample_row() -> UserTable:
+    now = datetime.now(timezone.utc)
+    return UserTable(
+        id=1,
+        user_name="bench_user",
+        email="bench_user@example.com",
+        phone="+8801000000000",
+        hashed_password="$argon2id$v=19$m=65536,t=3,p=4$c2FsdA$aGFzaA",
+        user_role=UserRole.SOLVER,
+        user_status=UserStatus.ACTIVE,
+        uuid=uuid7(),
+        created_at=now,
+        updated_at=now,
+        deleted_at=None,
+    )
+
+
+def run(number: int = 20_000, hash_number: int = 20) -> dict:
+    repo = AlchemyUserRepository(session=None)  # _to_domain never touches the session
+    row = sample_row()
+    user = repo._to_domain(row)
+    hasher = ArgonHaser()
+
+    return {
+        "micro.to_domain": _time(lambda: repo._to_domain(row), number),
+        "micro.user_response_json": _time(
+            lambda: UserResponse.model_validate(user).model_dump_json(), number
+        ),
+        "micro.user_row_json": _time(lambda: dump_user(user), number),
+        "micro.argon_hash": _time(lambda: hasher.hash("correct horse battery staple"), hash_number),
+    }
+
+
+def main() -> None:
+    for name, stats in run().items():
+        print(f"{name:28} p50={stats['p50_ms']:.4f}ms p99={stats['p99_ms']:.4f}ms")
+
+
+if __name__ == "__main__":
+    main()
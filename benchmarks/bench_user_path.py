@@ -0,0 +1,139 @@
+"""
+Database-backed benchmarks for the user request path: create (duplicate checks,
+Argon2 and insert, as POST /users does), get-by-uuid, get-by-email and
+list_users at several page depths, both offset and keyset.
+
+Every operation opens its own session, like a request would. Run
+benchmarks.seed first (benchmarks.run does it for you).
+"""
+import asyncio
+import time
+import uuid
+from typing import Awaitable, Callable, List
+
+from sqlalchemy import select
+
+from app.domain.user import UserRegistrationData, UserRole
+from app.infra.db.models import UserTable
+from app.infra.db.pagination import encode_cursor
+from app.infra.db.repo.user_repo import AlchemyUserRepository
+from app.infra.db.session import async_session_factory
+from app.secure.hash_pool import PooledArgonHasher
+from app.services.user_service import UserServiceImpl
+from benchmarks.seed import PREFIX
+from benchmarks.stats import summarize
+
+Op = Callable[[int], Awaitable[object]]
+
+
+async def measure(op: Op, iterations: int, concurrency: int) -> dict:
+    """Run op(i) for i in range(iterations) across `concurrency` workers."""
+    latencies: List[float] = []
+    counter = iter(range(iterations))
+
+    async def worker() -> None:
+        for i in counter:
+            t0 = time.perf_counter()
+            await op(i)
+            latencies.append(time.perf_counter() - t0)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, time.perf_counter() - started)
+
+
+async def _sample(column, count: int) -> list:
+    async with async_session_factory() as session:
+        query = (
+            select(column)
+            .where(UserTable.user_name.startswith(PREFIX), UserTable.deleted_at == None)
+            .order_by(UserTable.id)
+            .limit(count)
+        )
+        return list((await session.execute(query)).scalars().all())
+
+
+async def _cursor_at_depth(depth: int) -> str | None:
+    if depth == 0:
+        return None
+    async with async_session_factory() as session:
+        query = (
+            select(UserTable.uuid)
+            .where(UserTable.deleted_at == None)
+            .order_by(UserTable.uuid.desc())
+            .offset(depth - 1)
+            .limit(1)
+        )
+        last = (await session.execute(query)).scalar_one_or_none()
+    return encode_cursor(last) if last else None
+
+
+async def run(
+    iterations: int = 500,
+    concurrency: int = 8,
+    page_size: int = 20,
+    depths: tuple[int, ...] = (0, 1_000, 10_000),
+    create_iterations: int = 100
+) -> dict:
+    results: dict = {}
+    uuids = await _sample(UserTable.uuid, iterations)
+    emails = await _sample(UserTable.email, iterations)
+    if not uuids:
+        raise RuntimeError("No bench users found; run benchmarks.seed first")
+
+    async def get_by_uuid(i: int) -> object:
+        async with async_session_factory() as session:
+            return await AlchemyUserRepository(session).get_by_id_or_uuid(uuids[i % len(uuids)])
+
+    async def get_by_email(i: int) -> object:
+        async with async_session_factory() as session:
+            return await AlchemyUserRepository(session).get_by_email(emails[i % len(emails)])
+
+    results["db.get_by_uuid"] = await measure(get_by_uuid, iterations, concurrency)
+    results["db.get_by_email"] = await measure(get_by_email, iterations, concurrency)
+
+    for depth in depths:
+        async def list_offset(i: int, depth: int = depth) -> object:
+            async with async_session_factory() as session:
+                return await AlchemyUserRepository(session).list_users(skip=depth, limit=page_size)
+
+        cursor = await _cursor_at_depth(depth)
+
+        async def list_keyset(i: int, cursor: str | None = cursor) -> object:
+            async with async_session_factory() as session:
+                return await AlchemyUserRepository(session).list_users_page(limit=page_size, cursor=cursor)
+
+        results[f"db.list_users.offset.depth_{depth}"] = await measure(list_offset, iterations, concurrency)
+        results[f"db.list_users.keyset.depth_{depth}"] = await measure(list_keyset, iterations, concurrency)
+
+    # Same work as POST /users, minus HTTP: two duplicate checks, pooled Argon2, insert
+    run_id = uuid.uuid4().hex[:8]
+    hasher = PooledArgonHasher(kind="process", max_pending=max(concurrency, 1) * 4)
+    hasher.start()
+    created = []
+
+    async def create(i: int) -> object:
+        async with async_session_factory() as session:
+            service = UserServiceImpl(AlchemyUserRepository(session), hasher)
+            user = await service.register_user(UserRegistrationData(
+                user_name=f"{PREFIX}create_{run_id}_{i}",
+                email=f"{PREFIX}create_{run_id}_{i}@example.com",
+                phone="+8801000000000",
+                password="bench-password",
+                user_role=UserRole.SOLVER
+            ))
+            created.append(user.uuid)
+            return user
+
+    try:
+        results["db.create_user"] = await measure(create, create_iterations, concurrency)
+    finally:
+        hasher.shutdown()
+        # Keep the seeded set stable between runs
+        async with async_session_factory() as session:
+            repo = AlchemyUserRepository(session)
+            for id in created:
+                await repo.prune(id)
+            await session.commit()
+
+    return results
@@ -0,0 +1,138 @@
+"""
+Index usage check: EXPLAINs the repositories' hot statements and fails if any
+of them cannot be answered from the expected index.
+
+Sequential scans are disabled for the session, so the question asked is "can
+the planner use the index for this query shape", not "does it prefer it on
+this data": the check is meaningful on an empty scratch database. Index sizes
+and scan counts are printed afterwards.
+
+    python -m benchmarks.check_indexes
+"""
+import asyncio
+import json
+import sys
+from datetime import datetime, timezone
+from typing import Any, Iterator, List, Optional, Tuple
+from uuid import uuid7
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from app.infra.db.models import ProposalTable, SolverTable, UserTable
+from app.infra.db.repo import project_repo, solver_repo, task_submission_repo, user_repo
+from app.infra.db.session import dispose_engine, get_engine
+
+
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement: Any):
+        self.statement = statement
+
+
+@compiles(_Explain)
+def _compile_explain(element: _Explain, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+# (name, statement, params, expected index). None accepts any index: indexes on
+# partitioned tables are reported under each partition's own name
+CHECKS: List[Tuple[str, Any, dict, Optional[str]]] = [
+    ("users.get_by_uuid", user_repo._GET_BY_UUID, {"b_uuid": uuid7()}, "ix_users_uuid"),
+    ("users.get_by_email", user_repo._GET_BY_EMAIL, {"b_email": "a@example.com"}, "ix_users_email"),
+    ("users.get_by_username", user_repo._GET_BY_USERNAME, {"b_user_name": "a"}, "users_user_name_key"),
+    (
+        "users.page",
+        select(UserTable.uuid).where(UserTable.deleted_at == None).order_by(UserTable.uuid.desc()).limit(21),
+        {},
+        "ix_users_live_uuid",
+    ),
+    (
+        "users.page_total",
+        select(func.count()).select_from(UserTable).where(UserTable.deleted_at == None),
+        {},
+        "ix_users_live_uuid",
+    ),
+    (
+        "solvers.features_changed",
+        solver_repo._FEATURES_CHANGED,
+        {"b_updated_at": datetime.now(timezone.utc), "b_id": 0, "b_limit": 5000},
+        "ix_solvers_updated_at_id",
+    ),
+    ("solvers.features_from_start", solver_repo._FEATURES_FROM_START, {"b_limit": 5000}, "ix_solvers_updated_at_id"),
+    ("projects.get_by_uuid", project_repo._GET_BY_UUID, {"b_uuid": uuid7()}, "ix_projects_uuid"),
+    (
+        "solvers.search",
+        select(SolverTable)
+        .where(SolverTable.deleted_at == None)
+        .order_by(SolverTable.rating.desc(), SolverTable.uuid.desc())
+        .limit(21),
+        {},
+        "ix_solvers_rating_uuid",
+    ),
+    (
+        "proposals.list_recent",
+        select(ProposalTable)
+        .where(ProposalTable.project_id == 1, ProposalTable.deleted_at == None)
+        .order_by(ProposalTable.created_at.desc(), ProposalTable.uuid.desc())
+        .limit(21),
+        {},
+        None,
+    ),
+    ("task_submissions.latest", task_submission_repo._LATEST, {"b_task_id": 1}, None),
+]
+
+_SIZES = text("""
+    SELECT relname, indexrelname, pg_relation_size(indexrelid) AS bytes, idx_scan
+    FROM pg_stat_user_indexes
+    WHERE schemaname = current_schema()
+    ORDER BY relname, indexrelname
+""")
+
+
+def _walk(node: dict) -> Iterator[dict]:
+    yield node
+    for child in node.get("Plans", ()):
+        yield from _walk(child)
+
+
+def _scans(plan: dict) -> Tuple[List[str], List[str]]:
+    """(indexes used, tables read by sequential scan)"""
+    indexes, seq = [], []
+    for node in _walk(plan["Plan"]):
+        if "Index Name" in node:
+            indexes.append(node["Index Name"])
+        if node["Node Type"] == "Seq Scan":
+            seq.append(node["Relation Name"])
+    return indexes, seq
+
+
+async def run() -> int:
+    failures = 0
+    async with get_engine().connect() as conn:
+        await conn.execute(text("SET enable_seqscan = off"))
+        for name, statement, params, expected in CHECKS:
+            raw = (await conn.execute(_Explain(statement), params)).scalar_one()
+            plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]
+            indexes, seq = _scans(plan)
+            ok = not seq and bool(indexes) and (expected is None or expected in indexes)
+            failures += not ok
+            used = ", ".join(indexes) or "-"
+            print(f"{'ok ' if ok else 'FAIL'} {name:28} {used}" + (f"  (seq scan: {', '.join(seq)})" if seq else ""))
+
+        print()
+        for relname, index, size, scans in (await conn.execute(_SIZES)).all():
+            print(f"{relname:32} {index:44} {size / 1024:>10.0f} KiB {scans:>10} scans")
+    await dispose_engine()
+    return failures
+
+
+def main() -> None:
+    failures = asyncio.run(run())
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Diff two benchmark result files.
+
+    python -m benchmarks.compare bench_results/base.json bench_results/head.json
+"""
+import argparse
+import json
+from pathlib import Path
+
+# Lower is better for latencies and memory, higher for throughput
+_METRICS = ("p50_ms", "p99_ms", "throughput_ops_s", "bytes", "ms")
+
+
+def _load(path: Path) -> dict:
+    return json.loads(path.read_text())["results"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("base", type=Path)
+    parser.add_argument("head", type=Path)
+    args = parser.parse_args()
+
+    base, head = _load(args.base), _load(args.head)
+    print(f"{'benchmark':44} {'metric':18} {'base':>12} {'head':>12} {'change':>9}")
+    for name in sorted(set(base) & set(head)):
+        for metric in _METRICS:
+            old, new = base[name].get(metric), head[name].get(metric)
+            if old is None or new is None:
+                continue
+            change = f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+            print(f"{name:44} {metric:18} {old:>12} {new:>12} {change:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark suite entry point. Seeds the configured database, runs the DB-backed
+and micro benchmarks, and writes one JSON file per run for diffing.
+
+    python -m benchmarks.run --users 100000 --output bench_results/$(git rev-parse --short HEAD).json
+    python -m benchmarks.compare bench_results/old.json bench_results/new.json
+
+Use --micro-only when no database is available.
+"""
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks import bench_domain_memory, bench_micro, bench_statements
+
+
+def _git_sha() -> str:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+async def _run_db(args: argparse.Namespace) -> dict:
+    from benchmarks import bench_user_path
+    from benchmarks.seed import seed_users
+    from app.infra.db.session import dispose_engine
+
+    try:
+        await seed_users(args.users)
+        return await bench_user_path.run(
+            iterations=args.iterations,
+            concurrency=args.concurrency,
+            page_size=args.page_size,
+            depths=tuple(d for d in args.depths if d < args.users),
+            create_iterations=args.create_iterations
+        )
+    finally:
+        await dispose_engine()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=10_000, help="Seeded user count")
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--create-iterations", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--depths", type=int, nargs="+", default=[0, 1_000, 10_000])
+    parser.add_argument("--micro-only", action="store_true")
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    sha = _git_sha()
+    results: dict = {}
+    results.update(bench_micro.run())
+    results["micro.statement_overhead"] = bench_statements.run()
+    results.update(bench_domain_memory.run())
+    if not args.micro_only:
+        results.update(asyncio.run(_run_db(args)))
+
+    report = {
+        "meta": {
+            "git_sha": sha,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "users": None if args.micro_only else args.users,
+            "concurrency": args.concurrency,
+        },
+        "results": results,
+    }
+
+    output = args.output or Path("bench_results") / f"{sha}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, sort_keys=True))
+    print(f"Wrote {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Seed the configured database with synthetic users for benchmarking.
+Point DB_NAME at a scratch database; rows are tagged with a "bench_" prefix.
+
+    python -m benchmarks.seed --users 100000
+"""
+import argparse
+import asyncio
+
+from sqlalchemy import func, select
+
+from app.domain.user import User, UserRole, UserStatus
+from app.infra.db.models import UserTable
+from app.infra.db.repo.user_repo import AlchemyUserRepository
+from app.infra.db.session import async_session_factory
+from app.secure.argon import ArgonHaser
+
+PREFIX = "bench_"
+
+
+async def count_seeded() -> int:
+    async with async_session_factory() as session:
+        query = select(func.count()).select_from(UserTable).where(UserTable.user_name.startswith(PREFIX))
+        return (await session.execute(query)).scalar() or 0
+
+
+async def seed_users(total: int, batch_size: int = 1000) -> int:
+    """Top up bench users to `total`. Returns how many were inserted."""
+    existing = await count_seeded()
+    # One hash for every row: seeding measures nothing, so skip the Argon2 cost
+    password = ArgonHaser().hash("bench-password")
+    roles = (UserRole.SOLVER, UserRole.BUYER)
+
+    inserted = 0
+    for start in range(existing, total, batch_size):
+        users = [
+            User(
+                id=0,
+                user_name=f"{PREFIX}{i}",
+                email=f"{PREFIX}{i}@example.com",
+                phone=f"+880{i:010d}",
+                password=password,
+                user_status=UserStatus.ACTIVE,
+                user_role=roles[i % 2]
+            )
+            for i in range(start, min(start + batch_size, total))
+        ]
+        async with async_session_factory() as session:
+            inserted += len(await AlchemyUserRepository(session).create_many(users))
+    return inserted
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=10_000)
+    args = parser.parse_args()
+    inserted = asyncio.run(seed_users(args.users))
+    print(f"Inserted {inserted} users ({args.users} requested in total)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Startup-time breakdown for one worker: where import time goes, then how long
+each lifespan phase takes until the worker is ready.
+
+Imports are measured in a fresh interpreter with -X importtime and summed by
+package (app modules by subpackage). The lifespan runs in this process against
+the configured database, Redis and key files; use --imports-only without them.
+
+    python -m benchmarks.startup_profile --top 20
+"""
+import argparse
+import asyncio
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, Tuple
+
+
+def _group(module: str) -> str:
+    parts = module.split(".")
+    return ".".join(parts[:2]) if parts[0] == "app" else parts[0]
+
+
+def profile_imports(module: str = "app.main") -> Tuple[float, Dict[str, float]]:
+    """(wall seconds, self-time seconds per package) for importing `module` cold."""
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True
+    )
+    wall = time.perf_counter() - started
+
+    by_package: Dict[str, float] = defaultdict(float)
+    for line in proc.stderr.splitlines():
+        # "import time:   self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        by_package[_group(name.strip())] += int(self_us) / 1e6
+    return wall, dict(by_package)
+
+
+async def profile_lifespan() -> dict:
+    from app.infra.startup import startup_phases
+    from app.main import app
+
+    async with app.router.lifespan_context(app):
+        return startup_phases.stats()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--top", type=int, default=15, help="Packages listed by import time")
+    parser.add_argument("--imports-only", action="store_true")
+    args = parser.parse_args()
+
+    wall, by_package = profile_imports()
+    total = sum(by_package.values())
+    print(f"import app.main: {wall * 1000:.0f} ms wall, {total * 1000:.0f} ms in module bodies\n")
+    for name, seconds in sorted(by_package.items(), key=lambda kv: kv[1], reverse=True)[:args.top]:
+        print(f"  {name:32} {seconds * 1000:>8.1f} ms {seconds / total:>7.1%}")
+
+    if args.imports_only:
+        return
+    stats = asyncio.run(profile_lifespan())
+    print("\nlifespan:")
+    for name, ms in stats["phases_ms"].items():
+        print(f"  {name:32} {ms:>8.1f} ms")
+    print(f"  {'ready after':32} {stats['ready_after_ms']:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+from typing import Sequence
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies: Sequence[float], elapsed: float) -> dict:
+    """Latencies and elapsed are in seconds; output is in ops/s and milliseconds."""
+    values = sorted(latencies)
+    count = len(values)
+    return {
+        "ops": count,
+        "throughput_ops_s": round(count / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(sum(values) / count * 1000, 4) if count else 0.0,
+        "p50_ms": round(percentile(values, 0.50) * 1000, 4),
+        "p99_ms": round(percentile(values, 0.99) * 1000, 4),
+        "max_ms": round(values[-1] * 1000, 4) if count else 0.0,
+    }
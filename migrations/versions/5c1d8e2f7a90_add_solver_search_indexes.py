@@ -0,0 +1,58 @@
+"""add_solver_search_indexes
+
+Revision ID: 5c1d8e2f7a90
+Revises: 738e5f376a4a
+Create Date: 2026-10-18 09:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1d8e2f7a90'
+down_revision: Union[str, Sequence[str], None] = '738e5f376a4a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY keeps solvers writable while the indexes build,
+    # but it cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_solvers_skills', 'solvers', ['skills'],
+            unique=False, postgresql_using='gin', postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_solvers_rating_uuid', 'solvers',
+            [sa.text('rating DESC'), sa.text('uuid DESC')],
+            unique=False,
+            postgresql_where=sa.text('deleted_at IS NULL'),
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_solvers_available_rating_uuid', 'solvers',
+            [sa.text('rating DESC'), sa.text('uuid DESC')],
+            unique=False,
+            postgresql_where=sa.text("deleted_at IS NULL AND is_available = 'AVAILABLE'"),
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_solvers_hourly_rate', 'solvers', ['hourly_rate'],
+            unique=False,
+            postgresql_where=sa.text('deleted_at IS NULL'),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_solvers_hourly_rate', table_name='solvers', postgresql_concurrently=True)
+        op.drop_index('ix_solvers_available_rating_uuid', table_name='solvers', postgresql_concurrently=True)
+        op.drop_index('ix_solvers_rating_uuid', table_name='solvers', postgresql_concurrently=True)
+        op.drop_index('ix_solvers_skills', table_name='solvers', postgresql_concurrently=True)
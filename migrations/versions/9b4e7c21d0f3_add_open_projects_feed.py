@@ -0,0 +1,122 @@
+"""add_open_projects_feed
+
+Revision ID: 9b4e7c21d0f3
+Revises: 5c1d8e2f7a90
+Create Date: 2026-10-18 11:02:17.540913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b4e7c21d0f3'
+down_revision: Union[str, Sequence[str], None] = '5c1d8e2f7a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CRON_JOB = 'refresh-open-projects-feed'
+CRON_SCHEDULE = '30 seconds'
+
+
+def _pg_cron_usable(conn) -> bool:
+    # pg_cron must be preloaded and can only live in cron.database_name
+    return bool(conn.execute(sa.text(
+        "SELECT EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_cron') "
+        "AND current_setting('cron.database_name', true) = current_database()"
+    )).scalar())
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('materialized_view_refreshes',
+    sa.Column('view_name', sa.String(length=63), nullable=False),
+    sa.Column('refreshed_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('duration_ms', sa.Float(), nullable=False, server_default='0'),
+    sa.PrimaryKeyConstraint('view_name')
+    )
+
+    # Pending projects only; the description is cut to a preview so the
+    # view stays small enough to be mostly cached
+    op.execute("""
+        CREATE MATERIALIZED VIEW open_projects_feed AS
+        SELECT
+            p.id,
+            p.uuid,
+            p.project_name,
+            left(p.project_description, 280) AS project_summary,
+            p.project_budget,
+            p.project_duration_days,
+            p.created_at,
+            b.uuid AS buyer_uuid,
+            b.rating AS buyer_rating,
+            b.is_hiring AS buyer_hiring_status,
+            pc.proposal_count
+        FROM projects p
+        JOIN buyers b ON b.id = p.buyer_id
+        CROSS JOIN LATERAL (
+            SELECT count(*) AS proposal_count
+            FROM proposals pr
+            WHERE pr.project_id = p.id AND pr.deleted_at IS NULL
+        ) pc
+        WHERE p.project_status = 'PENDING'
+          AND p.deleted_at IS NULL
+          AND b.deleted_at IS NULL
+        WITH DATA
+    """)
+    # REFRESH ... CONCURRENTLY needs a unique index; the second one serves the keyset order
+    op.execute("CREATE UNIQUE INDEX ux_open_projects_feed_uuid ON open_projects_feed (uuid)")
+    op.execute(
+        "CREATE INDEX ix_open_projects_feed_created_uuid "
+        "ON open_projects_feed (created_at DESC, uuid DESC)"
+    )
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION refresh_open_projects_feed() RETURNS void
+        LANGUAGE plpgsql AS $$
+        DECLARE
+            started timestamptz := clock_timestamp();
+        BEGIN
+            REFRESH MATERIALIZED VIEW CONCURRENTLY open_projects_feed;
+            INSERT INTO materialized_view_refreshes (view_name, refreshed_at, duration_ms)
+            VALUES (
+                'open_projects_feed',
+                started,
+                extract(epoch FROM clock_timestamp() - started) * 1000
+            )
+            ON CONFLICT (view_name) DO UPDATE
+            SET refreshed_at = EXCLUDED.refreshed_at, duration_ms = EXCLUDED.duration_ms;
+        END
+        $$
+    """)
+    op.execute(
+        "INSERT INTO materialized_view_refreshes (view_name, refreshed_at) "
+        "VALUES ('open_projects_feed', now())"
+    )
+
+    conn = op.get_bind()
+    if _pg_cron_usable(conn):
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_cron")
+        op.execute(sa.text(
+            "SELECT cron.schedule(:job, :schedule, 'SELECT refresh_open_projects_feed()')"
+        ).bindparams(job=CRON_JOB, schedule=CRON_SCHEDULE))
+    else:
+        # Feed still works, it just never refreshes: the API reports it as stale
+        print("pg_cron unavailable, open_projects_feed will not be refreshed on a schedule")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    conn = op.get_bind()
+    has_cron = conn.execute(sa.text(
+        "SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron')"
+    )).scalar()
+    if has_cron:
+        op.execute(sa.text(
+            "SELECT cron.unschedule(jobid) FROM cron.job WHERE jobname = :job"
+        ).bindparams(job=CRON_JOB))
+    op.execute("DROP FUNCTION IF EXISTS refresh_open_projects_feed()")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS open_projects_feed")
+    op.drop_table('materialized_view_refreshes')
@@ -0,0 +1,35 @@
+"""add_solver_refresh_index
+
+Revision ID: a8e2c4f6b0d1
+Revises: d1f3a5c7e9b0
+Create Date: 2026-10-18 21:04:37.290518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8e2c4f6b0d1'
+down_revision: Union[str, Sequence[str], None] = 'd1f3a5c7e9b0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The matching refresh pages solvers by (updated_at, id) > watermark.
+    # Without this index every tick sorts the whole table, even when nothing changed
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_solvers_updated_at_id', 'solvers', ['updated_at', 'id'],
+            unique=False, postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_solvers_updated_at_id', table_name='solvers', postgresql_concurrently=True)
@@ -0,0 +1,44 @@
+"""add_outbox_dead_letter
+
+Revision ID: b3f5d7e9a1c2
+Revises: a8e2c4f6b0d1
+Create Date: 2026-10-18 23:12:08.604211
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f5d7e9a1c2'
+down_revision: Union[str, Sequence[str], None] = 'a8e2c4f6b0d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Nullable without a default: a catalog-only change
+    op.add_column('outbox_events', sa.Column('dead_lettered_at', sa.DateTime(timezone=True), nullable=True))
+    # The relay's scan skips dead-lettered rows; the index leaves them out too
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_outbox_events_pending', 'outbox_events', ['id'],
+            unique=False, postgresql_concurrently=True,
+            postgresql_where=sa.text('published_at IS NULL AND dead_lettered_at IS NULL')
+        )
+        op.drop_index('ix_outbox_events_unpublished', table_name='outbox_events', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_outbox_events_unpublished', 'outbox_events', ['id'],
+            unique=False, postgresql_concurrently=True,
+            postgresql_where=sa.text('published_at IS NULL')
+        )
+        op.drop_index('ix_outbox_events_pending', table_name='outbox_events', postgresql_concurrently=True)
+    op.drop_column('outbox_events', 'dead_lettered_at')
@@ -0,0 +1,229 @@
+"""partition_proposals_and_task_submissions
+
+Revision ID: c7a31f5e9d48
+Revises: 9b4e7c21d0f3
+Create Date: 2026-10-18 13:40:51.276604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7a31f5e9d48'
+down_revision: Union[str, Sequence[str], None] = '9b4e7c21d0f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTITION_INTERVAL = '1 month'
+PREMAKE = 4  # Future partitions kept ahead of now()
+RETENTION = '24 months'  # Older partitions are detached (kept as plain tables), not dropped
+
+# Column lists and constraints as of 'b32bddb21b76' / '7d204b390771'
+TABLES = {
+    'proposals': {
+        'columns': """
+            project_id integer NOT NULL,
+            solver_id integer NOT NULL,
+            proposed_price double precision NOT NULL,
+            cover_letter varchar(5000),
+            proposal_status proposal_status_type NOT NULL,
+        """,
+        'constraints': """
+            CONSTRAINT proposals_project_id_fkey FOREIGN KEY (project_id)
+                REFERENCES projects (id) ON DELETE CASCADE,
+            CONSTRAINT proposals_solver_id_fkey FOREIGN KEY (solver_id)
+                REFERENCES solvers (id) ON DELETE CASCADE
+        """,
+        'copy': 'project_id, solver_id, proposed_price, cover_letter, proposal_status',
+        'indexes': ['project_id', 'solver_id'],
+    },
+    'task_submissions': {
+        'columns': """
+            task_id integer NOT NULL,
+            file_path varchar(512) NOT NULL,
+            version integer NOT NULL,
+            buyer_feedback buyer_feedback_type NOT NULL,
+        """,
+        'constraints': """
+            CONSTRAINT task_submissions_task_id_fkey FOREIGN KEY (task_id)
+                REFERENCES tasks (id) ON DELETE CASCADE
+        """,
+        'copy': 'task_id, file_path, version, buyer_feedback',
+        'indexes': ['task_id'],
+    },
+}
+COMMON_COPY = 'id, uuid, created_at, updated_at, deleted_at'
+
+FEED_VIEW = """
+    CREATE MATERIALIZED VIEW open_projects_feed AS
+    SELECT
+        p.id,
+        p.uuid,
+        p.project_name,
+        left(p.project_description, 280) AS project_summary,
+        p.project_budget,
+        p.project_duration_days,
+        p.created_at,
+        b.uuid AS buyer_uuid,
+        b.rating AS buyer_rating,
+        b.is_hiring AS buyer_hiring_status,
+        pc.proposal_count
+    FROM projects p
+    JOIN buyers b ON b.id = p.buyer_id
+    CROSS JOIN LATERAL (
+        SELECT count(*) AS proposal_count
+        FROM proposals pr
+        WHERE pr.project_id = p.id AND pr.deleted_at IS NULL
+    ) pc
+    WHERE p.project_status = 'PENDING'
+      AND p.deleted_at IS NULL
+      AND b.deleted_at IS NULL
+    WITH DATA
+"""
+
+
+def _drop_feed() -> None:
+    # open_projects_feed reads proposals, so it has to be rebuilt around the swap
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS open_projects_feed")
+
+
+def _create_feed() -> None:
+    op.execute(FEED_VIEW)
+    op.execute("CREATE UNIQUE INDEX ux_open_projects_feed_uuid ON open_projects_feed (uuid)")
+    op.execute(
+        "CREATE INDEX ix_open_projects_feed_created_uuid "
+        "ON open_projects_feed (created_at DESC, uuid DESC)"
+    )
+
+
+def _partman_available(conn) -> bool:
+    return bool(conn.execute(sa.text(
+        "SELECT EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_partman')"
+    )).scalar())
+
+
+def _detach_legacy(table: str) -> None:
+    legacy = f'{table}_legacy'
+    op.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+    op.execute(f"ALTER TABLE {legacy} RENAME CONSTRAINT {table}_pkey TO {legacy}_pkey")
+    # Keep the sequence (and so the id space) for the new table
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY NONE")
+    op.execute(f"ALTER TABLE {legacy} ALTER COLUMN id DROP DEFAULT")
+    for name in ('deleted_at', 'uuid', *TABLES[table]['indexes']):
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_{name}")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    use_partman = _partman_available(conn)
+    if use_partman:
+        op.execute("CREATE SCHEMA IF NOT EXISTS partman")
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_partman SCHEMA partman")
+    else:
+        print("pg_partman unavailable, partitioned tables get a DEFAULT partition only")
+
+    _drop_feed()
+
+    for table, spec in TABLES.items():
+        _detach_legacy(table)
+
+        # The partition key has to be part of every unique constraint, so the
+        # primary key becomes (id, created_at) and uuid is unique per created_at.
+        # ids still come from one sequence and stay unique in practice
+        op.execute(f"""
+            CREATE TABLE {table} (
+                {spec['columns']}
+                id integer NOT NULL DEFAULT nextval('{table}_id_seq'),
+                uuid uuid NOT NULL DEFAULT gen_random_uuid(),
+                created_at timestamptz NOT NULL DEFAULT now(),
+                updated_at timestamptz NOT NULL DEFAULT now(),
+                deleted_at timestamptz,
+                CONSTRAINT {table}_pkey PRIMARY KEY (id, created_at),
+                {spec['constraints']}
+            ) PARTITION BY RANGE (created_at)
+        """)
+        op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+        op.execute(f"CREATE UNIQUE INDEX ix_{table}_uuid ON {table} (uuid, created_at)")
+        op.execute(f"CREATE INDEX ix_{table}_deleted_at ON {table} (deleted_at)")
+        for column in spec['indexes']:
+            op.execute(f"CREATE INDEX ix_{table}_{column} ON {table} ({column})")
+
+        if use_partman:
+            # Start at the oldest existing row so the copy lands in real partitions
+            start = conn.execute(sa.text(
+                f"SELECT to_char(date_trunc('month', coalesce(min(created_at), now())), 'YYYY-MM-DD') "
+                f"FROM {table}_legacy"
+            )).scalar()
+            op.execute(sa.text(
+                "SELECT partman.create_parent("
+                "p_parent_table := :parent, p_control := 'created_at', "
+                "p_interval := :interval, p_premake := :premake, p_start_partition := :start)"
+            ).bindparams(parent=f'public.{table}', interval=PARTITION_INTERVAL, premake=PREMAKE, start=start))
+            op.execute(sa.text(
+                "UPDATE partman.part_config "
+                "SET retention = :retention, retention_keep_table = true, infinite_time_partitions = true "
+                "WHERE parent_table = :parent"
+            ).bindparams(retention=RETENTION, parent=f'public.{table}'))
+        else:
+            op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+        op.execute(
+            f"INSERT INTO {table} ({spec['copy']}, {COMMON_COPY}) "
+            f"SELECT {spec['copy']}, {COMMON_COPY} FROM {table}_legacy"
+        )
+        op.execute(f"DROP TABLE {table}_legacy")
+
+    _create_feed()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    conn = op.get_bind()
+    has_partman = bool(conn.execute(sa.text(
+        "SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_partman')"
+    )).scalar())
+
+    _drop_feed()
+
+    for table, spec in TABLES.items():
+        if has_partman:
+            op.execute(sa.text(
+                "DELETE FROM partman.part_config WHERE parent_table = :parent"
+            ).bindparams(parent=f'public.{table}'))
+
+        op.execute(f"ALTER TABLE {table} RENAME TO {table}_partitioned")
+        op.execute(f"ALTER TABLE {table}_partitioned RENAME CONSTRAINT {table}_pkey TO {table}_partitioned_pkey")
+        op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY NONE")
+        for name in ('deleted_at', 'uuid', *spec['indexes']):
+            op.execute(f"DROP INDEX IF EXISTS ix_{table}_{name}")
+
+        op.execute(f"""
+            CREATE TABLE {table} (
+                {spec['columns']}
+                id integer NOT NULL DEFAULT nextval('{table}_id_seq'),
+                uuid uuid NOT NULL DEFAULT gen_random_uuid(),
+                created_at timestamptz NOT NULL DEFAULT now(),
+                updated_at timestamptz NOT NULL DEFAULT now(),
+                deleted_at timestamptz,
+                CONSTRAINT {table}_pkey PRIMARY KEY (id),
+                {spec['constraints']}
+            )
+        """)
+        op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+        # Detached (retained) partitions are not copied back
+        op.execute(
+            f"INSERT INTO {table} ({spec['copy']}, {COMMON_COPY}) "
+            f"SELECT {spec['copy']}, {COMMON_COPY} FROM {table}_partitioned"
+        )
+        op.execute(f"DROP TABLE {table}_partitioned CASCADE")
+
+        op.create_index(f'ix_{table}_deleted_at', table, ['deleted_at'], unique=False)
+        op.create_index(f'ix_{table}_uuid', table, ['uuid'], unique=True)
+        for column in spec['indexes']:
+            op.create_index(f'ix_{table}_{column}', table, [column], unique=False)
+
+    _create_feed()
@@ -0,0 +1,60 @@
+"""replace_deleted_at_indexes
+
+Revision ID: d1f3a5c7e9b0
+Revises: f4b8e0c6a217
+Create Date: 2026-10-18 18:20:13.502947
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1f3a5c7e9b0'
+down_revision: Union[str, Sequence[str], None] = 'f4b8e0c6a217'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Every CommonMixin table got a b-tree on deleted_at. Reads only ever ask for
+# "deleted_at IS NULL", which matches nearly every row, so the planner never
+# picks it; it only costs a write on every insert and soft delete
+PLAIN_TABLES = (
+    'users', 'solvers', 'buyers', 'staff', 'projects', 'tasks', 'project_completion_requests'
+)
+# Partitioned parents: their indexes cannot be dropped or built CONCURRENTLY
+PARTITIONED_TABLES = ('proposals', 'task_submissions')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in PARTITIONED_TABLES:
+        op.drop_index(f'ix_{table}_deleted_at', table_name=table)
+
+    with op.get_context().autocommit_block():
+        # Live users, newest first: keyset pages and their counts. Unique
+        # indexes (uuid, email, user_name) stay full, they must also see
+        # soft-deleted rows to keep those values taken
+        op.create_index(
+            'ix_users_live_uuid', 'users', [sa.text('uuid DESC')],
+            unique=False,
+            postgresql_where=sa.text('deleted_at IS NULL'),
+            postgresql_concurrently=True
+        )
+        for table in PLAIN_TABLES:
+            op.drop_index(f'ix_{table}_deleted_at', table_name=table, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for table in PLAIN_TABLES:
+            op.create_index(
+                f'ix_{table}_deleted_at', table, ['deleted_at'],
+                unique=False, postgresql_concurrently=True
+            )
+        op.drop_index('ix_users_live_uuid', table_name='users', postgresql_concurrently=True)
+
+    for table in PARTITIONED_TABLES:
+        op.create_index(f'ix_{table}_deleted_at', table, ['deleted_at'], unique=False)
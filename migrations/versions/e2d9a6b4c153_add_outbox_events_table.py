@@ -0,0 +1,50 @@
+"""add_outbox_events_table
+
+Revision ID: e2d9a6b4c153
+Revises: c7a31f5e9d48
+Create Date: 2026-10-18 15:21:08.904137
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2d9a6b4c153'
+down_revision: Union[str, Sequence[str], None] = 'c7a31f5e9d48'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('outbox_events',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('event_id', sa.Uuid(), nullable=False),
+    sa.Column('subject', sa.String(length=255), nullable=False),
+    sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('occurred_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('published_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('last_error', sa.String(length=500), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('event_id')
+    )
+    op.create_index(
+        'ix_outbox_events_unpublished', 'outbox_events', ['id'],
+        unique=False, postgresql_where=sa.text('published_at IS NULL')
+    )
+    op.create_index(
+        'ix_outbox_events_published_at', 'outbox_events', ['published_at'],
+        unique=False, postgresql_where=sa.text('published_at IS NOT NULL')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_outbox_events_published_at', table_name='outbox_events')
+    op.drop_index('ix_outbox_events_unpublished', table_name='outbox_events')
+    op.drop_table('outbox_events')
@@ -0,0 +1,123 @@
+"""add_proposal_dedup_and_stats
+
+Revision ID: f4b8e0c6a217
+Revises: e2d9a6b4c153
+Create Date: 2026-10-18 17:05:44.318826
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4b8e0c6a217'
+down_revision: Union[str, Sequence[str], None] = 'e2d9a6b4c153'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match settings.PROPOSAL_COUNT_STRIPES for the backfill to land on real stripes;
+# any stripe value is summed correctly either way
+STRIPES = 16
+
+
+def _feed_view(proposal_count_sql: str) -> str:
+    return f"""
+        CREATE MATERIALIZED VIEW open_projects_feed AS
+        SELECT
+            p.id,
+            p.uuid,
+            p.project_name,
+            left(p.project_description, 280) AS project_summary,
+            p.project_budget,
+            p.project_duration_days,
+            p.created_at,
+            b.uuid AS buyer_uuid,
+            b.rating AS buyer_rating,
+            b.is_hiring AS buyer_hiring_status,
+            pc.proposal_count
+        FROM projects p
+        JOIN buyers b ON b.id = p.buyer_id
+        CROSS JOIN LATERAL ({proposal_count_sql}) pc
+        WHERE p.project_status = 'PENDING'
+          AND p.deleted_at IS NULL
+          AND b.deleted_at IS NULL
+        WITH DATA
+    """
+
+
+def _recreate_feed(proposal_count_sql: str) -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS open_projects_feed")
+    op.execute(_feed_view(proposal_count_sql))
+    op.execute("CREATE UNIQUE INDEX ux_open_projects_feed_uuid ON open_projects_feed (uuid)")
+    op.execute(
+        "CREATE INDEX ix_open_projects_feed_created_uuid "
+        "ON open_projects_feed (created_at DESC, uuid DESC)"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('proposal_dedup',
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('solver_id', sa.Integer(), nullable=False),
+    sa.Column('proposal_uuid', sa.Uuid(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['solver_id'], ['solvers.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('project_id', 'solver_id')
+    )
+    op.create_table('project_proposal_stats',
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('stripe', sa.SmallInteger(), nullable=False),
+    sa.Column('proposal_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('project_id', 'stripe')
+    )
+
+    # Earliest proposal wins for pairs that already bid twice
+    op.execute("""
+        INSERT INTO proposal_dedup (project_id, solver_id, proposal_uuid, created_at)
+        SELECT DISTINCT ON (project_id, solver_id) project_id, solver_id, uuid, created_at
+        FROM proposals
+        WHERE deleted_at IS NULL
+        ORDER BY project_id, solver_id, created_at, id
+    """)
+    op.execute(f"""
+        INSERT INTO project_proposal_stats (project_id, stripe, proposal_count)
+        SELECT project_id, solver_id % {STRIPES}, count(*)
+        FROM proposals
+        WHERE deleted_at IS NULL
+        GROUP BY project_id, solver_id % {STRIPES}
+    """)
+
+    # On the partitioned parent, so every partition (and future ones) gets them
+    op.create_index(
+        'ix_proposals_project_price_uuid', 'proposals',
+        ['project_id', 'proposed_price', 'uuid'],
+        unique=False, postgresql_where=sa.text('deleted_at IS NULL')
+    )
+    op.create_index(
+        'ix_proposals_project_created_uuid', 'proposals',
+        ['project_id', sa.text('created_at DESC'), sa.text('uuid DESC')],
+        unique=False, postgresql_where=sa.text('deleted_at IS NULL')
+    )
+
+    # The feed reads the striped counts instead of counting proposals
+    _recreate_feed(
+        "SELECT coalesce(sum(s.proposal_count), 0)::integer AS proposal_count "
+        "FROM project_proposal_stats s WHERE s.project_id = p.id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _recreate_feed(
+        "SELECT count(*) AS proposal_count "
+        "FROM proposals pr WHERE pr.project_id = p.id AND pr.deleted_at IS NULL"
+    )
+    op.drop_index('ix_proposals_project_created_uuid', table_name='proposals')
+    op.drop_index('ix_proposals_project_price_uuid', table_name='proposals')
+    op.drop_table('project_proposal_stats')
+    op.drop_table('proposal_dedup')